@@ -3,26 +3,45 @@ import os
 
 from stack.libs.shared.aws import client as aws_client
 from stack.libs.shared.aws import ensure_bucket
+from stack.libs.shared.job_index import DynamoJobIndex
 
 
 class S3JobRepository:
-    def __init__(self, bucket: str, prefix: str = "results/"):
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "results/",
+        s3=None,
+        index: DynamoJobIndex | None = None,
+    ):
         self.bucket = bucket
         self.prefix = prefix
-        self.s3 = aws_client("s3")
+        self.s3 = s3 or aws_client("s3")
+        # Optional catalog updated on every transition
+        self.index = index
 
     @classmethod
-    def from_env(cls) -> "S3JobRepository":
+    def from_env(cls, index: DynamoJobIndex | None = None) -> "S3JobRepository":
         bucket = (
             os.getenv("STATUS_BUCKET") or os.getenv("BUCKET_NAME") or "agent-status"
         )
         if os.getenv("LOCALSTACK", "").lower() in ("1", "true", "yes", "on"):
             ensure_bucket(aws_client("s3"), bucket_name=bucket)
-        return cls(bucket=bucket)
+        return cls(bucket=bucket, index=index)
 
     def _key(self, cid: str) -> str:
         return f"{self.prefix}{cid}.json"
 
+    def get_status(self, correlation_id: str) -> dict | None:
+        try:
+            obj = self.s3.get_object(Bucket=self.bucket, Key=self._key(correlation_id))
+            body = obj["Body"].read().decode("utf-8")
+            return json.loads(body)
+        except self.s3.exceptions.NoSuchKey:  # type: ignore[attr-defined]
+            return None
+        except Exception:
+            return None
+
     def mark_running(self, correlation_id: str) -> None:
         self.s3.put_object(
             Bucket=self.bucket,
@@ -31,6 +50,8 @@ class S3JobRepository:
                 "utf-8"
             ),
         )
+        if self.index is not None:
+            self.index.record(correlation_id, "running")
 
     def mark_completed(self, correlation_id: str, result: dict) -> None:
         out = {"id": correlation_id, "status": "completed", "result": result}
@@ -39,6 +60,8 @@ class S3JobRepository:
             Key=self._key(correlation_id),
             Body=json.dumps(out).encode("utf-8"),
         )
+        if self.index is not None:
+            self.index.record(correlation_id, "completed")
 
     def mark_failed(self, correlation_id: str, error: str) -> None:
         out = {"id": correlation_id, "status": "failed", "error": error}
@@ -47,6 +70,8 @@ class S3JobRepository:
             Key=self._key(correlation_id),
             Body=json.dumps(out).encode("utf-8"),
         )
+        if self.index is not None:
+            self.index.record(correlation_id, "failed", error=error)
 
     def is_canceled(self, correlation_id: str) -> bool:
         try:
@@ -54,3 +79,12 @@ class S3JobRepository:
             return True
         except Exception:
             return False
+
+    def list_canceled(self) -> set[str]:
+        # One paginated listing covers every cancel sentinel at once
+        out: set[str] = set()
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix="cancels/"):
+            for obj in page.get("Contents", []):
+                out.add(obj["Key"][len("cancels/") :])
+        return out
@@ -0,0 +1,110 @@
+import threading
+import time
+
+from stack.libs.shared.logging import get_logger
+
+log = get_logger("agent.worker.acks")
+
+# SQS hard limit on entries per *_batch call
+SQS_MAX_BATCH = 10
+
+
+class AckBuffer:
+    """Buffers receipt handles and deletes them with ``delete_message_batch``.
+
+    A background thread flushes once ``max_batch`` handles are pending or the
+    oldest one has waited ``max_delay`` seconds. Entries that fail with a
+    receiver-side fault are retried up to ``max_attempts`` times.
+    """
+
+    def __init__(
+        self,
+        sqs,
+        queue_url: str,
+        max_batch: int = SQS_MAX_BATCH,
+        max_delay: float = 1.0,
+        max_attempts: int = 3,
+    ):
+        self.sqs = sqs
+        self.queue_url = queue_url
+        self.max_batch = max(1, min(max_batch, SQS_MAX_BATCH))
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self._pending: list[tuple[str, int]] = []
+        self._first_at: float | None = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="agent-acks", daemon=True
+        )
+        self._thread.start()
+
+    def ack(self, receipt_handle: str) -> None:
+        self._put([(receipt_handle, 0)])
+
+    def close(self) -> None:
+        """Flush everything still pending and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _put(self, entries: list[tuple[str, int]]) -> None:
+        with self._cond:
+            if not self._pending:
+                self._first_at = time.monotonic()
+            self._pending.extend(entries)
+            self._cond.notify_all()
+
+    def _take(self) -> list[tuple[str, int]] | None:
+        with self._cond:
+            while True:
+                if self._pending:
+                    waited = time.monotonic() - (self._first_at or 0.0)
+                    if (
+                        self._closed
+                        or len(self._pending) >= self.max_batch
+                        or waited >= self.max_delay
+                    ):
+                        break
+                    self._cond.wait(self.max_delay - waited)
+                elif self._closed:
+                    return None
+                else:
+                    self._cond.wait()
+            batch = self._pending[: self.max_batch]
+            self._pending = self._pending[self.max_batch :]
+            self._first_at = time.monotonic() if self._pending else None
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take()
+            if batch is None:
+                return
+            retry = self._delete(batch)
+            if retry:
+                self._put(retry)
+
+    def _delete(self, batch: list[tuple[str, int]]) -> list[tuple[str, int]]:
+        entries = [
+            {"Id": str(i), "ReceiptHandle": rh} for i, (rh, _) in enumerate(batch)
+        ]
+        try:
+            resp = self.sqs.delete_message_batch(
+                QueueUrl=self.queue_url, Entries=entries
+            )
+        except Exception as e:  # noqa: BLE001
+            log.warning("delete_message_batch failed: %s", e)
+            failed = [{"Id": ent["Id"]} for ent in entries]
+        else:
+            failed = resp.get("Failed") or []
+
+        retry = []
+        for f in failed:
+            rh, attempts = batch[int(f["Id"])]
+            if f.get("SenderFault") or attempts + 1 >= self.max_attempts:
+                log.error("giving up on ack %s: %s", rh, f.get("Message", f))
+                continue
+            retry.append((rh, attempts + 1))
+        return retry
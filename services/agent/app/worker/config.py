@@ -0,0 +1,71 @@
+import os
+from dataclasses import dataclass
+
+POOL_MODES = ("thread", "process")
+
+
+@dataclass
+class WorkerConfig:
+    concurrency: int = 1
+    pool: str = "thread"
+    receive_batch: int = 10
+    wait_seconds: int = 20
+    ack_batch: int = 10
+    ack_flush_seconds: float = 1.0
+    cancel_refresh_seconds: float = 2.0
+    codec: str = "auto"
+    heartbeat_seconds: float = 60.0
+    visibility_step_seconds: int = 180
+    visibility_max_seconds: int = 43_200
+    retry_base_seconds: float = 5.0
+    retry_max_backoff_seconds: float = 900.0
+    max_receives: int = 5
+    min_concurrency: int = 1
+    max_concurrency: int = 1
+    depth_refresh_seconds: float = 5.0
+    idle_backoff_max_seconds: float = 30.0
+    drain_timeout_seconds: float = 25.0
+    idempotency_cache_size: int = 10_000
+
+    @classmethod
+    def from_env(cls) -> "WorkerConfig":
+        pool = os.getenv("WORKER_POOL", "thread").lower()
+        if pool not in POOL_MODES:
+            raise SystemExit(f"WORKER_POOL must be one of {POOL_MODES}, got {pool!r}")
+        concurrency = max(1, int(os.getenv("WORKER_CONCURRENCY", "1")))
+        # Adaptive sizing is on when the bounds differ; both default to the
+        # fixed concurrency.
+        min_concurrency = max(
+            1, int(os.getenv("WORKER_MIN_CONCURRENCY", str(concurrency)))
+        )
+        max_concurrency = max(
+            min_concurrency,
+            int(os.getenv("WORKER_MAX_CONCURRENCY", str(concurrency))),
+        )
+        return cls(
+            concurrency=min(max(concurrency, min_concurrency), max_concurrency),
+            pool=pool,
+            receive_batch=min(10, max(1, int(os.getenv("SQS_RECEIVE_BATCH", "10")))),
+            wait_seconds=min(20, max(0, int(os.getenv("SQS_WAIT_SECONDS", "20")))),
+            ack_batch=min(10, max(1, int(os.getenv("SQS_ACK_BATCH", "10")))),
+            ack_flush_seconds=float(os.getenv("SQS_ACK_FLUSH_SECONDS", "1.0")),
+            cancel_refresh_seconds=float(os.getenv("CANCEL_REFRESH_SECONDS", "2.0")),
+            codec=os.getenv("JOB_CODEC", "auto"),
+            heartbeat_seconds=float(os.getenv("VISIBILITY_HEARTBEAT_SECONDS", "60")),
+            visibility_step_seconds=int(os.getenv("VISIBILITY_STEP_SECONDS", "180")),
+            visibility_max_seconds=int(os.getenv("VISIBILITY_MAX_SECONDS", "43200")),
+            retry_base_seconds=float(os.getenv("RETRY_BASE_SECONDS", "5")),
+            retry_max_backoff_seconds=float(
+                os.getenv("RETRY_MAX_BACKOFF_SECONDS", "900")
+            ),
+            # Keep in line with the queue's redrive maxReceiveCount
+            max_receives=max(1, int(os.getenv("WORKER_MAX_RECEIVES", "5"))),
+            min_concurrency=min_concurrency,
+            max_concurrency=max_concurrency,
+            depth_refresh_seconds=float(os.getenv("QUEUE_DEPTH_REFRESH_SECONDS", "5")),
+            idle_backoff_max_seconds=float(os.getenv("IDLE_BACKOFF_MAX_SECONDS", "30")),
+            # Keep below the ECS stopTimeout (30s by default)
+            drain_timeout_seconds=float(os.getenv("DRAIN_TIMEOUT_SECONDS", "25")),
+            # 0 turns the redelivery check off
+            idempotency_cache_size=int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "10000")),
+        )
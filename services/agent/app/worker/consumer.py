@@ -0,0 +1,198 @@
+import threading
+import time
+from concurrent.futures import Future
+
+from services.agent.app.worker.acks import SQS_MAX_BATCH, AckBuffer
+from services.agent.app.worker.controller import ConcurrencyController
+from services.agent.app.worker.heartbeat import VisibilityHeartbeat
+from services.agent.app.worker.pool import JobPool
+from services.agent.app.worker.retry import RetryPolicy
+from services.agent.domain.models.messages import (
+    JobMessage,
+    MessageDecodeError,
+    decode_message,
+)
+from stack.libs.shared.codec import Codec, get_codec
+from stack.libs.shared.logging import get_logger
+
+log = get_logger("agent.worker")
+
+
+class Consumer:
+    """Receives jobs from SQS, runs them on a ``JobPool`` and settles each message.
+
+    Up to ``pool.size`` jobs are kept in flight and the queue is only polled
+    when a slot is free; each long-poll asks for as many messages as there are
+    free slots (capped at ``receive_batch``). Successful jobs are acknowledged
+    through ``acks``; failures are handed to ``retry``. An optional
+    ``controller`` resizes the pool and backs off polling when the queue is idle.
+
+    Once ``stop`` is set the loop stops polling; ``drain`` then waits for
+    in-flight jobs and hands back any that do not finish in time.
+    """
+
+    def __init__(
+        self,
+        sqs,
+        queue_url: str,
+        pool: JobPool,
+        acks: AckBuffer,
+        *,
+        receive_batch: int = 10,
+        wait_seconds: int = 20,
+        codec: Codec | None = None,
+        heartbeat: VisibilityHeartbeat | None = None,
+        retry: RetryPolicy | None = None,
+        controller: ConcurrencyController | None = None,
+    ):
+        self.sqs = sqs
+        self.queue_url = queue_url
+        self.pool = pool
+        self.acks = acks
+        self.receive_batch = receive_batch
+        self.wait_seconds = wait_seconds
+        self.codec = codec or get_codec()
+        self.heartbeat = heartbeat
+        self.retry = retry or RetryPolicy()
+        self.controller = controller
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._inflight: dict[str, JobMessage] = {}
+        self._abandoned: set[str] = set()
+
+    def run(self, stop: threading.Event | None = None) -> None:
+        stop = self._stop = stop or self._stop
+        while not stop.is_set():
+            if self.controller is not None:
+                self.controller.adjust()
+            free = self.pool.wait_for_slot(timeout=1.0)
+            if not free:
+                continue
+            received = self.poll(free)
+            if self.controller is not None:
+                pause = self.controller.after_poll(received)
+                if pause:
+                    stop.wait(pause)
+
+    def poll(self, free: int) -> int:
+        """Receive and dispatch up to ``free`` messages; return how many arrived."""
+        resp = self.sqs.receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=min(free, self.receive_batch),
+            WaitTimeSeconds=self.wait_seconds,
+            AttributeNames=["ApproximateReceiveCount"],
+            MessageAttributeNames=["All"],
+        )
+        messages = resp.get("Messages", [])
+        if self._stop.is_set():
+            # Shutdown began during the long-poll: give these straight back
+            self.release_many([m["ReceiptHandle"] for m in messages], 0)
+            return 0
+        for m in messages:
+            self._dispatch(m)
+        return len(messages)
+
+    def drain(self, timeout: float) -> int:
+        """Wait up to ``timeout`` seconds for in-flight jobs to finish.
+
+        Jobs still running afterwards are released with visibility 0 so
+        another task picks them up right away. Returns how many were released.
+        """
+        if self.pool.wait_idle(timeout):
+            return 0
+        with self._lock:
+            receipts = list(self._inflight)
+            self._abandoned.update(receipts)
+        for receipt in receipts:
+            if self.heartbeat is not None:
+                self.heartbeat.untrack(receipt)
+        log.warning("releasing %d unfinished jobs", len(receipts))
+        self.release_many(receipts, 0)
+        return len(receipts)
+
+    def _dispatch(self, m: dict) -> None:
+        try:
+            job = decode_message(m, self.codec)
+        except MessageDecodeError as e:
+            # Undecodable messages will never succeed: report them and leave
+            # them hidden until the redrive policy moves them to the DLQ
+            log.error("undecodable message %s: %s", m.get("MessageId"), e)
+            if e.correlation_id:
+                self._mark_failed(e.correlation_id, f"invalid message: {e}")
+            self.release(m["ReceiptHandle"], self.retry.fatal_visibility_seconds)
+            return
+        with self._lock:
+            self._inflight[m["ReceiptHandle"]] = job
+        if self.heartbeat is not None:
+            self.heartbeat.track(m["ReceiptHandle"])
+        started = time.monotonic()
+        self.pool.submit(job, on_done=lambda f: self._settle(job, f, started))
+
+    def _settle(self, job: JobMessage, f: Future, started: float) -> None:
+        receipt = job.receipt_handle or ""
+        with self._lock:
+            self._inflight.pop(receipt, None)
+            if receipt in self._abandoned:
+                # Already handed back by drain(); another task owns it now
+                self._abandoned.discard(receipt)
+                return
+        if self.controller is not None:
+            self.controller.record_latency(time.monotonic() - started)
+        if self.heartbeat is not None:
+            self.heartbeat.untrack(receipt)
+        exc = f.exception()
+        if exc is None:
+            self.acks.ack(receipt)
+            return
+
+        cid = job.correlation_id
+        if not self.retry.is_retryable(exc):
+            log.error("job %s failed permanently: %r", cid, exc)
+            self._mark_failed(cid, f"{type(exc).__name__}: {exc}")
+            # Kept for the DLQ; straight there once out of receives
+            if self.retry.exhausted(job.receive_count):
+                self.release(receipt, 0)
+            else:
+                self.release(receipt, self.retry.fatal_visibility_seconds)
+        elif self.retry.exhausted(job.receive_count):
+            # Leave it visible so the redrive policy moves it to the DLQ
+            log.error(
+                "job %s failed after %d attempts: %r", cid, job.receive_count, exc
+            )
+            self._mark_failed(cid, f"{type(exc).__name__}: {exc}")
+            self.release(receipt, 0)
+        else:
+            delay = self.retry.backoff(job.receive_count)
+            log.warning("job %s failed, retrying in %ss: %r", cid, delay, exc)
+            self.release(receipt, delay)
+
+    def release(self, receipt: str, delay: int) -> None:
+        try:
+            self.sqs.change_message_visibility(
+                QueueUrl=self.queue_url, ReceiptHandle=receipt, VisibilityTimeout=delay
+            )
+        except Exception as e:  # noqa: BLE001
+            log.warning("could not release message: %s", e)
+
+    def release_many(self, receipts: list[str], delay: int) -> None:
+        for i in range(0, len(receipts), SQS_MAX_BATCH):
+            chunk = receipts[i : i + SQS_MAX_BATCH]
+            try:
+                resp = self.sqs.change_message_visibility_batch(
+                    QueueUrl=self.queue_url,
+                    Entries=[
+                        {"Id": str(n), "ReceiptHandle": rh, "VisibilityTimeout": delay}
+                        for n, rh in enumerate(chunk)
+                    ],
+                )
+            except Exception as e:  # noqa: BLE001
+                log.warning("could not release messages: %s", e)
+                continue
+            for f in resp.get("Failed") or []:
+                log.warning("could not release message: %s", f.get("Message", f))
+
+    def _mark_failed(self, cid: str, error: str) -> None:
+        try:
+            self.pool.repo.mark_failed(cid, error)
+        except Exception as e:  # noqa: BLE001
+            log.warning("could not mark %s failed: %s", cid, e)
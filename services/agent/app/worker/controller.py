@@ -0,0 +1,115 @@
+import statistics
+import threading
+import time
+from collections import deque
+
+from services.agent.app.worker.pool import JobPool
+from stack.libs.shared.logging import get_logger
+
+log = get_logger("agent.worker.controller")
+
+
+class ConcurrencyController:
+    """Sizes the job pool from queue depth and recent job latency.
+
+    Queue attributes are read at most every ``refresh_seconds``. With a
+    backlog the pool doubles towards ``max_size``; when the queue is empty it
+    shrinks one slot at a time towards ``min_size``. If the median latency of
+    recent jobs climbs past ``latency_factor`` times the best median seen,
+    the pool is cut by a quarter since more concurrency is only adding load.
+    """
+
+    def __init__(
+        self,
+        sqs,
+        queue_url: str,
+        pool: JobPool,
+        min_size: int = 1,
+        max_size: int = 1,
+        refresh_seconds: float = 5.0,
+        idle_backoff_max: float = 30.0,
+        latency_window: int = 50,
+        latency_factor: float = 2.0,
+    ):
+        self.sqs = sqs
+        self.queue_url = queue_url
+        self.pool = pool
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.refresh_seconds = refresh_seconds
+        self.idle_backoff_max = idle_backoff_max
+        self.latency_factor = latency_factor
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self._baseline: float | None = None
+        self._lock = threading.Lock()
+        self._depth = (0, 0)
+        self._depth_at: float | None = None
+        self._idle_polls = 0
+
+    def depth(self) -> tuple[int, int]:
+        """Return cached ``(visible, in_flight)`` message counts for the queue."""
+        now = time.monotonic()
+        if self._depth_at is None or now - self._depth_at >= self.refresh_seconds:
+            self._depth_at = now
+            try:
+                attrs = self.sqs.get_queue_attributes(
+                    QueueUrl=self.queue_url,
+                    AttributeNames=[
+                        "ApproximateNumberOfMessages",
+                        "ApproximateNumberOfMessagesNotVisible",
+                    ],
+                )["Attributes"]
+                self._depth = (
+                    int(attrs.get("ApproximateNumberOfMessages", 0)),
+                    int(attrs.get("ApproximateNumberOfMessagesNotVisible", 0)),
+                )
+            except Exception as e:  # noqa: BLE001
+                log.warning("get_queue_attributes failed: %s", e)
+        return self._depth
+
+    def record_latency(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def adjust(self) -> int:
+        """Resize the pool once per refresh interval; return the current size."""
+        refreshed_at = self._depth_at
+        visible, _ = self.depth()
+        if refreshed_at == self._depth_at:
+            return self.pool.size
+
+        size = self.pool.size
+        target = size
+        if self._latency_degraded():
+            target = max(self.min_size, size * 3 // 4)
+            with self._lock:
+                self._latencies.clear()
+        elif visible >= size:
+            target = min(self.max_size, size * 2)
+        elif visible == 0 and self.pool.inflight < size:
+            target = max(self.min_size, size - 1)
+
+        if target != size:
+            log.info("concurrency %d -> %d (queued=%d)", size, target, visible)
+            self.pool.resize(target)
+        return self.pool.size
+
+    def after_poll(self, received: int) -> float:
+        """Return how long to pause before the next poll."""
+        if received:
+            self._idle_polls = 0
+            return 0.0
+        self._idle_polls += 1
+        if self.depth()[0] > 0:
+            return 0.0
+        return min(self.idle_backoff_max, 2.0 ** (self._idle_polls - 1))
+
+    def _latency_degraded(self) -> bool:
+        with self._lock:
+            if len(self._latencies) < 5:
+                return False
+            median = statistics.median(self._latencies)
+        if self._baseline is None or median < self._baseline:
+            self._baseline = median
+            return False
+        return median > self.latency_factor * self._baseline
@@ -0,0 +1,94 @@
+import threading
+import time
+
+from services.agent.app.worker.acks import SQS_MAX_BATCH
+from stack.libs.shared.logging import get_logger
+
+log = get_logger("agent.worker.heartbeat")
+
+# SQS refuses to keep a message invisible for more than 12 hours in total
+SQS_MAX_VISIBILITY = 43_200
+
+
+class VisibilityHeartbeat:
+    """Keeps in-flight messages invisible while their jobs are running.
+
+    Every ``interval`` seconds all tracked receipt handles are pushed out by
+    ``step`` seconds with ``change_message_visibility_batch``, until a message
+    has been held for ``cap`` seconds in total.
+    """
+
+    def __init__(
+        self,
+        sqs,
+        queue_url: str,
+        interval: float = 60.0,
+        step: int = 180,
+        cap: int = SQS_MAX_VISIBILITY,
+    ):
+        self.sqs = sqs
+        self.queue_url = queue_url
+        self.interval = interval
+        self.step = step
+        self.cap = min(cap, SQS_MAX_VISIBILITY)
+        self._inflight: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "VisibilityHeartbeat":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="agent-heartbeat", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def track(self, receipt_handle: str) -> None:
+        with self._lock:
+            self._inflight[receipt_handle] = time.monotonic()
+
+    def untrack(self, receipt_handle: str) -> None:
+        with self._lock:
+            self._inflight.pop(receipt_handle, None)
+
+    def beat(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            items = list(self._inflight.items())
+        entries = []
+        for rh, started in items:
+            remaining = int(self.cap - (now - started))
+            if remaining > 0:
+                entries.append((rh, min(self.step, remaining)))
+        for i in range(0, len(entries), SQS_MAX_BATCH):
+            self._extend(entries[i : i + SQS_MAX_BATCH])
+
+    def _extend(self, chunk: list[tuple[str, int]]) -> None:
+        try:
+            resp = self.sqs.change_message_visibility_batch(
+                QueueUrl=self.queue_url,
+                Entries=[
+                    {"Id": str(i), "ReceiptHandle": rh, "VisibilityTimeout": t}
+                    for i, (rh, t) in enumerate(chunk)
+                ],
+            )
+        except Exception as e:  # noqa: BLE001
+            log.warning("change_message_visibility_batch failed: %s", e)
+            return
+        for f in resp.get("Failed") or []:
+            rh = chunk[int(f["Id"])][0]
+            log.warning("could not extend %s: %s", rh, f.get("Message", f))
+            if f.get("SenderFault"):
+                # Receipt no longer valid (already deleted or expired)
+                self.untrack(rh)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.beat()
@@ -0,0 +1,141 @@
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable
+
+from services.agent.domain.models.messages import JobMessage
+from services.agent.domain.ports import JobRepository
+from services.agent.domain.services.cancellation import CancellationWatcher
+from services.agent.domain.services.idempotency import IdempotencyGuard
+from services.agent.domain.services.worker import process_message
+from services.agent.public.providers import provide_job_repo
+
+# Repository owned by each child process when running in "process" mode;
+# boto3 clients cannot be pickled, so children build their own. Children are
+# spawned, not forked: by the first submit the parent already runs the ack,
+# heartbeat and controller threads and holds pooled boto3 clients, whose
+# locks and sockets a forked child would inherit.
+_child_repo: JobRepository | None = None
+_child_cancels: CancellationWatcher | None = None
+_child_guard: IdempotencyGuard | None = None
+
+
+def _init_child(
+    repo_factory: Callable[[], JobRepository],
+    cancel_interval: float | None,
+    guard_capacity: int | None,
+) -> None:
+    global _child_repo, _child_cancels, _child_guard
+    _child_repo = repo_factory()
+    if cancel_interval is not None:
+        _child_cancels = CancellationWatcher(_child_repo, cancel_interval).start()
+    if guard_capacity is not None:
+        _child_guard = IdempotencyGuard(_child_repo, guard_capacity)
+
+
+def _process_in_child(msg: JobMessage) -> None:
+    assert _child_repo is not None, "child repository not initialised"
+    process_message(_child_repo, msg, _child_cancels, _child_guard)
+
+
+class JobPool:
+    """Runs ``process_message`` on a thread or process pool.
+
+    At most ``size`` jobs are in flight at any time; callers block in
+    ``wait_for_slot`` before fetching more work from the queue. ``size`` can be
+    changed with ``resize`` anywhere up to ``max_size`` workers. In process
+    mode each child builds its repository with ``repo_factory``, which must
+    be picklable (a module-level callable).
+    """
+
+    def __init__(
+        self,
+        repo: JobRepository,
+        size: int = 1,
+        mode: str = "thread",
+        cancels: CancellationWatcher | None = None,
+        max_size: int | None = None,
+        guard: IdempotencyGuard | None = None,
+        repo_factory: Callable[[], JobRepository] = provide_job_repo,
+    ):
+        self.repo = repo
+        self.max_size = max(size, max_size or size)
+        self.size = size
+        self.mode = mode
+        self.cancels = cancels
+        self.guard = guard
+        self._inflight = 0
+        self._cond = threading.Condition()
+        self._executor: Executor
+        if mode == "process":
+            # Each child runs its own watcher and guard against its own repository
+            interval = cancels.interval if cancels is not None else None
+            capacity = guard.capacity if guard is not None else None
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_size,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_child,
+                initargs=(repo_factory, interval, capacity),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_size, thread_name_prefix="agent-job"
+            )
+
+    @property
+    def inflight(self) -> int:
+        with self._cond:
+            return self._inflight
+
+    def resize(self, size: int) -> int:
+        with self._cond:
+            self.size = max(1, min(size, self.max_size))
+            self._cond.notify_all()
+            return self.size
+
+    def free_slots(self) -> int:
+        with self._cond:
+            return max(0, self.size - self._inflight)
+
+    def wait_for_slot(self, timeout: float | None = None) -> int:
+        """Block until at least one slot is free; return the number of free slots."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._inflight < self.size, timeout=timeout)
+            return max(0, self.size - self._inflight)
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until no jobs are in flight; return False if ``timeout`` ran out."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._inflight == 0, timeout=timeout)
+
+    def submit(self, msg: JobMessage, on_done: Callable[[Future], None]) -> Future:
+        """Start ``msg`` and call ``on_done`` with its future before freeing the slot."""
+        with self._cond:
+            self._inflight += 1
+        try:
+            if self.mode == "process":
+                fut = self._executor.submit(_process_in_child, msg)
+            else:
+                fut = self._executor.submit(
+                    process_message, self.repo, msg, self.cancels, self.guard
+                )
+        except BaseException:
+            self._release()
+            raise
+
+        def _done(f: Future) -> None:
+            try:
+                on_done(f)
+            finally:
+                self._release()
+
+        fut.add_done_callback(_done)
+        return fut
+
+    def _release(self) -> None:
+        with self._cond:
+            self._inflight -= 1
+            self._cond.notify_all()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,71 @@
+import random
+from dataclasses import dataclass
+
+from services.agent.domain.models.errors import FatalJobError, RetryableJobError
+from services.agent.domain.models.messages import MessageDecodeError
+
+# AWS error codes that are worth retrying; expired credentials and request
+# signatures clear up once the task role's credentials refresh
+_RETRYABLE_CODES = {
+    "ExpiredToken",
+    "ExpiredTokenException",
+    "RequestExpired",
+    "RequestTimeTooSkewed",
+    "InternalError",
+    "RequestTimeout",
+    "RequestTimeoutException",
+    "ServiceUnavailable",
+    "SlowDown",
+    "Throttling",
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ProvisionedThroughputExceededException",
+}
+
+
+@dataclass
+class RetryPolicy:
+    """Sorts job failures into retryable and fatal and spaces out retries.
+
+    Retryable failures are released back to the queue after an exponential
+    backoff derived from ``ApproximateReceiveCount``; after ``max_receives``
+    attempts the queue's redrive policy takes over. Fatal failures are not
+    deleted either: they stay hidden for ``fatal_visibility_seconds`` and
+    then count towards the same redrive to the DLQ.
+    """
+
+    base_seconds: float = 5.0
+    max_backoff_seconds: float = 900.0
+    max_receives: int = 5
+    jitter: bool = True
+    fatal_visibility_seconds: int = 43_200
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        if isinstance(exc, RetryableJobError):
+            return True
+        if isinstance(exc, (FatalJobError, MessageDecodeError)):
+            return False
+        # botocore ClientError carries the AWS error in ``response``
+        response = getattr(exc, "response", None)
+        if isinstance(response, dict) and "Error" in response:
+            code = response["Error"].get("Code", "")
+            status = response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+            return code in _RETRYABLE_CODES or status >= 500
+        if isinstance(exc, (ValueError, TypeError, KeyError, AttributeError)):
+            return False
+        # Connection and timeout errors, and anything unknown, get retried;
+        # max_receives bounds the damage.
+        return True
+
+    def exhausted(self, receive_count: int) -> bool:
+        return receive_count >= self.max_receives
+
+    def backoff(self, receive_count: int) -> int:
+        delay = min(
+            self.max_backoff_seconds,
+            self.base_seconds * 2 ** max(0, receive_count - 1),
+        )
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        # SQS visibility timeouts are whole seconds, max 12h
+        return max(0, min(43_200, int(delay)))
@@ -1,9 +1,36 @@
 import os
+import signal
+import threading
+import time
 
-from services.agent.domain.services.worker import process_message
+from services.agent.app.worker.acks import AckBuffer
+from services.agent.app.worker.config import WorkerConfig
+from services.agent.app.worker.consumer import Consumer
+from services.agent.app.worker.controller import ConcurrencyController
+from services.agent.app.worker.heartbeat import VisibilityHeartbeat
+from services.agent.app.worker.pool import JobPool
+from services.agent.app.worker.retry import RetryPolicy
+from services.agent.domain.ports import JobRepository
+from services.agent.domain.services.cancellation import CancellationWatcher
+from services.agent.domain.services.idempotency import IdempotencyGuard
 from services.agent.public.providers import provide_job_repo
 from stack.libs.shared.aws import client as aws_client
 from stack.libs.shared.aws import ensure_bucket, ensure_queue
+from stack.libs.shared.codec import get_codec
+from stack.libs.shared.logging import get_logger
+
+log = get_logger("agent.worker")
+
+
+def _install_signal_handlers(stop: threading.Event, stopped_at: list[float]) -> None:
+    def _handler(signum, _frame) -> None:
+        if not stop.is_set():
+            log.info("received %s, draining", signal.Signals(signum).name)
+            stopped_at.append(time.monotonic())
+            stop.set()
+
+    signal.signal(signal.SIGTERM, _handler)
+    signal.signal(signal.SIGINT, _handler)
 
 
 def main() -> None:
@@ -19,42 +46,96 @@ def main() -> None:
     if not queue_url:
         raise SystemExit("QUEUE_URL must be set")
 
-    repo = provide_job_repo()
-    while True:
-        resp = sqs.receive_message(
-            QueueUrl=queue_url,
-            MaxNumberOfMessages=1,
-            WaitTimeSeconds=20,
-            MessageAttributeNames=["All"],
+    stop = threading.Event()
+    stopped_at: list[float] = []
+    _install_signal_handlers(stop, stopped_at)
+    released = serve(
+        sqs, queue_url, provide_job_repo(), WorkerConfig.from_env(), stop, stopped_at
+    )
+    if released:
+        # Abandoned jobs are still running on pool threads; exit without
+        # joining them now that their messages have been handed back.
+        os._exit(0)
+
+
+def serve(
+    sqs,
+    queue_url: str,
+    repo: JobRepository,
+    config: WorkerConfig,
+    stop: threading.Event,
+    stopped_at: list[float] | None = None,
+) -> int:
+    """Run the worker until ``stop`` is set, then drain it.
+
+    Returns the number of unfinished jobs handed back to the queue.
+    """
+    cancels = CancellationWatcher(repo, interval=config.cancel_refresh_seconds)
+    if config.pool == "thread":
+        cancels.start()
+    pool = JobPool(
+        repo,
+        size=config.concurrency,
+        mode=config.pool,
+        cancels=cancels,
+        max_size=config.max_concurrency,
+        guard=(
+            IdempotencyGuard(repo, config.idempotency_cache_size)
+            if config.idempotency_cache_size > 0
+            else None
+        ),
+    )
+    acks = AckBuffer(
+        sqs,
+        queue_url,
+        max_batch=config.ack_batch,
+        max_delay=config.ack_flush_seconds,
+    )
+    heartbeat = VisibilityHeartbeat(
+        sqs,
+        queue_url,
+        interval=config.heartbeat_seconds,
+        step=config.visibility_step_seconds,
+        cap=config.visibility_max_seconds,
+    ).start()
+    controller = None
+    if config.max_concurrency > config.min_concurrency:
+        controller = ConcurrencyController(
+            sqs,
+            queue_url,
+            pool,
+            min_size=config.min_concurrency,
+            max_size=config.max_concurrency,
+            refresh_seconds=config.depth_refresh_seconds,
+            idle_backoff_max=config.idle_backoff_max_seconds,
         )
-        for m in resp.get("Messages", []):
-            try:
-                # If delivered from EventBridge, body is JSON with detail
-                body = m.get("Body")
-                if body and body.strip().startswith("{"):
-                    import json
-
-                    try:
-                        payload = json.loads(body)
-                        detail = payload.get("detail") or {}
-                        # Normalize to legacy shape for process_message
-                        m = {
-                            "Body": detail.get("job_type"),
-                            "MessageAttributes": {
-                                "correlation_id": {
-                                    "StringValue": detail.get("correlation_id", ""),
-                                    "DataType": "String",
-                                },
-                                "params": {
-                                    "StringValue": json.dumps(
-                                        detail.get("params") or {}
-                                    ),
-                                    "DataType": "String",
-                                },
-                            },
-                        }
-                    except Exception:
-                        pass
-                process_message(repo, m)
-            finally:
-                sqs.delete_message(QueueUrl=queue_url, ReceiptHandle=m["ReceiptHandle"])
+    consumer = Consumer(
+        sqs,
+        queue_url,
+        pool,
+        acks,
+        receive_batch=config.receive_batch,
+        wait_seconds=config.wait_seconds,
+        codec=get_codec(config.codec),
+        heartbeat=heartbeat,
+        retry=RetryPolicy(
+            base_seconds=config.retry_base_seconds,
+            max_backoff_seconds=config.retry_max_backoff_seconds,
+            max_receives=config.max_receives,
+        ),
+        controller=controller,
+    )
+    released = 0
+    try:
+        consumer.run(stop)
+        # The drain deadline counts from the signal, not from the end of the
+        # long-poll that was in progress when it arrived.
+        since = stopped_at[0] if stopped_at else time.monotonic()
+        elapsed = time.monotonic() - since
+        released = consumer.drain(max(0.0, config.drain_timeout_seconds - elapsed))
+    finally:
+        pool.shutdown(wait=not released)
+        heartbeat.stop()
+        acks.close()
+        cancels.stop()
+    return released
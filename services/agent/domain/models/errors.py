@@ -0,0 +1,6 @@
+class RetryableJobError(Exception):
+    """A job failed for a transient reason and may succeed if run again."""
+
+
+class FatalJobError(Exception):
+    """A job failed in a way that retrying cannot fix."""
@@ -0,0 +1,84 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from stack.libs.shared.codec import Codec, get_codec
+
+DEFAULT_JOB_TYPE = "content.generate"
+
+
+class MessageDecodeError(ValueError):
+    """Raised when a queue message cannot be turned into a ``JobMessage``."""
+
+    def __init__(self, reason: str, correlation_id: str | None = None):
+        super().__init__(reason)
+        self.correlation_id = correlation_id
+
+
+@dataclass(frozen=True)
+class JobMessage:
+    correlation_id: str
+    job_type: str
+    params: dict[str, Any] = field(default_factory=dict)
+    receipt_handle: str | None = None
+    receive_count: int = 1
+
+
+def decode_message(msg: dict, codec: Codec | None = None) -> JobMessage:
+    """Decode a raw SQS message in a single pass.
+
+    Two shapes are accepted:
+
+    * direct SQS sends: ``Body`` is the job type and ``correlation_id`` /
+      ``params`` travel as message attributes (``params`` may be a
+      ``Binary`` attribute encoded with msgpack);
+    * EventBridge deliveries: ``Body`` is the event envelope and the job
+      lives under ``detail``.
+    """
+    codec = codec or get_codec()
+    body = msg.get("Body") or ""
+    receipt = msg.get("ReceiptHandle")
+    try:
+        receive_count = int((msg.get("Attributes") or {})["ApproximateReceiveCount"])
+    except (KeyError, ValueError):
+        receive_count = 1
+
+    if body.lstrip().startswith("{"):
+        try:
+            envelope = codec.loads(body)
+        except Exception as e:  # noqa: BLE001
+            raise MessageDecodeError(f"invalid event body: {e}") from e
+        detail = envelope.get("detail") if isinstance(envelope, dict) else None
+        if not isinstance(detail, dict):
+            raise MessageDecodeError("event body has no detail object")
+        cid = detail.get("correlation_id")
+        params = detail.get("params") or {}
+        job_type = detail.get("job_type") or DEFAULT_JOB_TYPE
+    else:
+        attrs = msg.get("MessageAttributes") or {}
+        cid = (attrs.get("correlation_id") or {}).get("StringValue")
+        params = _decode_params(attrs.get("params"), codec, cid)
+        job_type = body or DEFAULT_JOB_TYPE
+
+    if not cid:
+        raise MessageDecodeError("missing correlation_id")
+    if not isinstance(params, dict):
+        raise MessageDecodeError("params must be an object", correlation_id=cid)
+    return JobMessage(
+        correlation_id=cid,
+        job_type=job_type,
+        params=params,
+        receipt_handle=receipt,
+        receive_count=receive_count,
+    )
+
+
+def _decode_params(attr: dict | None, codec: Codec, cid: str | None) -> Any:
+    if not attr:
+        return {}
+    try:
+        if attr.get("DataType", "").startswith("Binary"):
+            return get_codec("msgpack").loads(attr["BinaryValue"])
+        raw = attr.get("StringValue")
+        return codec.loads(raw) if raw else {}
+    except Exception as e:  # noqa: BLE001
+        raise MessageDecodeError(f"invalid params: {e}", correlation_id=cid) from e
@@ -0,0 +1,80 @@
+import threading
+
+from services.agent.domain.ports import JobRepository
+from stack.libs.shared.logging import get_logger
+
+log = get_logger("agent.cancellation")
+
+
+class CancellationWatcher:
+    """Worker-wide view of which in-flight jobs have been canceled.
+
+    Jobs register their correlation id with ``track`` and consult
+    ``is_canceled``, which only reads an in-memory set. A background thread
+    refreshes that set with one ``repo.list_canceled()`` call every
+    ``interval`` seconds, whatever the job rate. A job canceled before
+    pickup is caught by a single ``repo.is_canceled()`` check in ``track``,
+    so job start never waits on a listing. Only tracked ids are kept.
+    """
+
+    def __init__(self, repo: JobRepository, interval: float = 2.0):
+        self.repo = repo
+        self.interval = interval
+        self._tracked: set[str] = set()
+        self._canceled: set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "CancellationWatcher":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="agent-cancels", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def track(self, correlation_id: str) -> None:
+        with self._lock:
+            self._tracked.add(correlation_id)
+        try:
+            canceled = self.repo.is_canceled(correlation_id)
+        except Exception as e:  # noqa: BLE001 - the next refresh catches it
+            log.warning("cancel check failed for %s: %s", correlation_id, e)
+            return
+        if canceled:
+            with self._lock:
+                if correlation_id in self._tracked:
+                    self._canceled.add(correlation_id)
+
+    def untrack(self, correlation_id: str) -> None:
+        with self._lock:
+            self._tracked.discard(correlation_id)
+            self._canceled.discard(correlation_id)
+
+    def is_canceled(self, correlation_id: str) -> bool:
+        with self._lock:
+            return correlation_id in self._canceled
+
+    def refresh(self) -> None:
+        with self._lock:
+            if not self._tracked:
+                return
+        try:
+            canceled = self.repo.list_canceled()
+        except Exception as e:  # noqa: BLE001
+            log.warning("cancel refresh failed: %s", e)
+            return
+        with self._lock:
+            # Cancels never revert, so ids already known stay canceled
+            self._canceled = (self._canceled | set(canceled)) & self._tracked
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.refresh()
@@ -0,0 +1,39 @@
+import threading
+from collections import OrderedDict
+
+from services.agent.domain.ports import JobRepository
+
+TERMINAL_STATUSES = frozenset({"completed", "failed", "canceled"})
+
+
+class IdempotencyGuard:
+    """Skips redelivered jobs that have already reached a terminal status.
+
+    SQS delivers at least once, so the same correlation id can arrive again
+    after it finished. Ids finished by this worker are kept in a bounded LRU;
+    anything else costs one status read before the job is allowed to run.
+    """
+
+    def __init__(self, repo: JobRepository, capacity: int = 10_000):
+        self.repo = repo
+        self.capacity = capacity
+        self._done: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def remember(self, correlation_id: str) -> None:
+        with self._lock:
+            self._done[correlation_id] = None
+            self._done.move_to_end(correlation_id)
+            while len(self._done) > self.capacity:
+                self._done.popitem(last=False)
+
+    def already_done(self, correlation_id: str) -> bool:
+        with self._lock:
+            if correlation_id in self._done:
+                self._done.move_to_end(correlation_id)
+                return True
+        status = self.repo.get_status(correlation_id)
+        if status and status.get("status") in TERMINAL_STATUSES:
+            self.remember(correlation_id)
+            return True
+        return False
@@ -1,27 +1,44 @@
-import json
-import time
-
+from services.agent.domain.models.messages import JobMessage, decode_message
 from services.agent.domain.ports import JobRepository
+from services.agent.domain.services.cancellation import CancellationWatcher
+from services.agent.domain.services.idempotency import IdempotencyGuard
 from stack.agents.runner import run_agent
 
 
-def process_message(repo: JobRepository, msg: dict) -> None:
-    attrs = msg.get("MessageAttributes") or {}
-    cid = attrs.get("correlation_id", {}).get("StringValue")
-    params_raw = attrs.get("params", {}).get("StringValue")
-    job_type = msg.get("Body") or "content.generate"
-    try:
-        params = json.loads(params_raw or "{}")
-    except Exception:
-        params = {}
+def process_message(
+    repo: JobRepository,
+    msg: JobMessage | dict,
+    cancels: CancellationWatcher | None = None,
+    guard: IdempotencyGuard | None = None,
+) -> None:
+    job = msg if isinstance(msg, JobMessage) else decode_message(msg)
+    cid = job.correlation_id
+    if guard is not None and guard.already_done(cid):
+        # Redelivery of a job that already finished
+        return
 
-    repo.mark_running(cid)
+    def canceled() -> bool:
+        if cancels is not None:
+            return cancels.is_canceled(cid)
+        return repo.is_canceled(cid)
 
-    for _ in range(5):
-        if repo.is_canceled(cid):
+    if cancels is not None:
+        cancels.track(cid)
+    try:
+        repo.mark_running(cid)
+        if canceled():
             repo.mark_failed(cid, "canceled")
+            if guard is not None:
+                guard.remember(cid)
             return
-        time.sleep(1)
 
-    result = run_agent(job_type, params)
-    repo.mark_completed(cid, result)
+        result = run_agent(job.job_type, job.params)
+        if canceled():
+            repo.mark_failed(cid, "canceled")
+        else:
+            repo.mark_completed(cid, result)
+        if guard is not None:
+            guard.remember(cid)
+    finally:
+        if cancels is not None:
+            cancels.untrack(cid)
@@ -17,11 +17,69 @@ ECR_BASE = f"{AWS_ACCOUNT_ID}.dkr.ecr.{AWS_REGION}.amazonaws.com/{ECR_REPO}"
 
 worker_image = f"{ECR_BASE}:{MODULE}-worker-{BRANCH}-{SHORT_SHA}"
 
+# Longest a job can wait for delivery (the DLQ keeps messages 14 days)
+CANCEL_TTL_DAYS = 14
+
 # Status bucket (owned by agent)
 bucket = aws.s3.BucketV2(f"{MODULE}-status", force_destroy=True)
 
-# Agent requests queue
-queue = aws.sqs.Queue(f"{MODULE}-requests", visibility_timeout_seconds=300)
+# Cancel sentinels only matter while the job can still be delivered; expire
+# them after the queue's retention so worker listings stay small
+aws.s3.BucketLifecycleConfigurationV2(
+    f"{MODULE}-status-lifecycle",
+    bucket=bucket.id,
+    rules=[
+        aws.s3.BucketLifecycleConfigurationV2RuleArgs(
+            id="expire-cancels",
+            status="Enabled",
+            filter=aws.s3.BucketLifecycleConfigurationV2RuleFilterArgs(
+                prefix="cancels/"
+            ),
+            expiration=aws.s3.BucketLifecycleConfigurationV2RuleExpirationArgs(
+                days=CANCEL_TTL_DAYS
+            ),
+        )
+    ],
+)
+
+# Job index: one item per job, queryable by status/time without reading blobs.
+# GSI partitions are "<day>#<shard>" (and "<status>#<day>#<shard>") so job
+# writes spread out instead of landing on a single hot key.
+job_index = aws.dynamodb.Table(
+    f"{MODULE}-jobs",
+    attributes=[
+        aws.dynamodb.TableAttributeArgs(name="cid", type="S"),
+        aws.dynamodb.TableAttributeArgs(name="status_pk", type="S"),
+        aws.dynamodb.TableAttributeArgs(name="time_pk", type="S"),
+        aws.dynamodb.TableAttributeArgs(name="updated_at", type="N"),
+    ],
+    hash_key="cid",
+    billing_mode="PAY_PER_REQUEST",
+    global_secondary_indexes=[
+        aws.dynamodb.TableGlobalSecondaryIndexArgs(
+            name="by_status",
+            hash_key="status_pk",
+            range_key="updated_at",
+            projection_type="ALL",
+        ),
+        aws.dynamodb.TableGlobalSecondaryIndexArgs(
+            name="by_time",
+            hash_key="time_pk",
+            range_key="updated_at",
+            projection_type="ALL",
+        ),
+    ],
+)
+
+# Agent requests queue; jobs that keep failing are redriven to the DLQ
+dlq = aws.sqs.Queue(f"{MODULE}-requests-dlq", message_retention_seconds=1209600)
+queue = aws.sqs.Queue(
+    f"{MODULE}-requests",
+    visibility_timeout_seconds=300,
+    redrive_policy=dlq.arn.apply(
+        lambda arn: f'{{"deadLetterTargetArn":"{arn}","maxReceiveCount":5}}'
+    ),
+)
 
 # EventBridge bus reference (prefer env), fallback to local bus
 bus_name = os.getenv("EVENT_BUS_NAME")
@@ -62,15 +120,21 @@ aws.cloudwatch.EventTarget(
 )
 
 # Task IAM: allow reading from SQS queue and writing to S3 bucket
-policy = pulumi.Output.all(queue.arn, bucket.arn).apply(
+policy = pulumi.Output.all(queue.arn, bucket.arn, job_index.arn).apply(
     lambda vals: pulumi.Output.secret(
         '{"Version":"2012-10-17","Statement":[\
-            {"Effect":"Allow","Action":["sqs:ReceiveMessage","sqs:DeleteMessage","sqs:GetQueueAttributes"],"Resource":"'
+            {"Effect":"Allow","Action":["sqs:ReceiveMessage","sqs:DeleteMessage","sqs:ChangeMessageVisibility","sqs:GetQueueAttributes"],"Resource":"'
         + vals[0]
         + '"},\
             {"Effect":"Allow","Action":["s3:PutObject","s3:GetObject","s3:HeadObject"],"Resource":"'
         + vals[1]
-        + '/*"}\
+        + '/*"},\
+            {"Effect":"Allow","Action":["s3:ListBucket"],"Resource":"'
+        + vals[1]
+        + '"},\
+            {"Effect":"Allow","Action":["dynamodb:UpdateItem"],"Resource":"'
+        + vals[2]
+        + '"}\
         ]}'
     )
 )
@@ -81,10 +145,13 @@ svc = EcsWorkerService(
     env={
         "QUEUE_URL": queue.url,
         "STATUS_BUCKET": bucket.bucket,
+        "JOB_INDEX_TABLE": job_index.name,
         "SERVICE_NAME": MODULE,
     },
     task_inline_policy_json=policy,
 )
 
 pulumi.export("queue_url", queue.url)
+pulumi.export("dlq_url", dlq.url)
 pulumi.export("status_bucket", bucket.bucket)
+pulumi.export("job_index_table", job_index.name)
@@ -1,5 +1,13 @@
+import os
+
 from services.agent.adapters.repositories.s3_jobs import S3JobRepository
+from stack.libs.shared.job_index import DynamoJobIndex
+from stack.libs.shared.redis_jobs import RedisJobStore
 
 
-def provide_job_repo() -> S3JobRepository:
-    return S3JobRepository.from_env()
+def provide_job_repo() -> S3JobRepository | RedisJobStore:
+    index = DynamoJobIndex.from_env()
+    archive = S3JobRepository.from_env(index=index)
+    if os.getenv("JOB_STORE", "s3").lower() == "redis":
+        return RedisJobStore.from_env(archive, index=index)
+    return archive
@@ -0,0 +1,187 @@
+"""Offline throughput benchmark for the agent worker.
+
+Drives the real ``serve`` loop against in-memory SQS/S3 with injected
+latency and reports jobs/sec and end-to-end latency percentiles (send to
+delete). Run directly for larger numbers:
+
+    python -m services.agent.tests.bench.test_worker_throughput --jobs 2000
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+import uuid
+
+from services.agent.adapters.repositories.s3_jobs import S3JobRepository
+from services.agent.app.worker.config import WorkerConfig
+from services.agent.app.worker.run import serve
+from services.agent.domain.services.worker import process_message
+from stack.libs.testing.aws_fakes import FakeS3, FakeSqs
+
+
+def _send_jobs(sqs: FakeSqs, queue_url: str, jobs: int) -> None:
+    for start in range(0, jobs, 10):
+        sqs.send_message_batch(
+            QueueUrl=queue_url,
+            Entries=[
+                {
+                    "Id": str(i),
+                    "MessageBody": "content.generate",
+                    "MessageAttributes": {
+                        "correlation_id": {
+                            "StringValue": str(uuid.uuid4()),
+                            "DataType": "String",
+                        },
+                        "params": {
+                            "StringValue": json.dumps({"n": i}),
+                            "DataType": "String",
+                        },
+                    },
+                }
+                for i in range(start, min(start + 10, jobs))
+            ],
+        )
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    if len(samples) < 2:
+        only = samples[0] if samples else 0.0
+        return {"p50": only, "p95": only, "p99": only}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+def run_benchmark(
+    monkeypatch,
+    jobs: int = 200,
+    concurrency: int = 8,
+    sqs_latency: float = 0.002,
+    s3_latency: float = 0.005,
+    agent_seconds: float = 0.01,
+    timeout: float = 60.0,
+) -> dict:
+    import services.agent.domain.services.worker as mod
+
+    def fake_agent(job_type, params):
+        threading.Event().wait(agent_seconds)
+        return {"ok": True}
+
+    monkeypatch.setattr(mod, "run_agent", fake_agent)
+
+    sqs = FakeSqs(latency=sqs_latency, max_wait=0.05)
+    s3 = FakeS3(latency=s3_latency)
+    s3.create_bucket(Bucket="bench")
+    queue_url = sqs.create_queue(QueueName="bench")["QueueUrl"]
+    _send_jobs(sqs, queue_url, jobs)
+
+    config = WorkerConfig(
+        concurrency=concurrency,
+        min_concurrency=concurrency,
+        max_concurrency=concurrency,
+        wait_seconds=1,
+        ack_flush_seconds=0.01,
+        cancel_refresh_seconds=0.5,
+    )
+    stop = threading.Event()
+    worker = threading.Thread(
+        target=serve,
+        args=(sqs, queue_url, S3JobRepository("bench", s3=s3), config, stop),
+        daemon=True,
+    )
+    started = time.monotonic()
+    worker.start()
+    deadline = started + timeout
+    while len(sqs.deleted) < jobs and time.monotonic() < deadline:
+        time.sleep(0.01)
+    elapsed = time.monotonic() - started
+    stop.set()
+    worker.join(timeout=10)
+
+    done = list(sqs.deleted)
+    latencies = [m.deleted_at - m.sent_at for m in done]
+    return {
+        "jobs": len(done),
+        "seconds": elapsed,
+        "jobs_per_sec": len(done) / elapsed if elapsed else 0.0,
+        **_percentiles(latencies),
+        "calls": {**sqs.calls, **s3.calls},
+    }
+
+
+def process_message_benchmark(
+    monkeypatch, jobs: int = 500, s3_latency: float = 0.0
+) -> dict:
+    """Per-job overhead of ``process_message`` with a free agent."""
+    import services.agent.domain.services.worker as mod
+
+    monkeypatch.setattr(mod, "run_agent", lambda t, p: {})
+    s3 = FakeS3(latency=s3_latency)
+    s3.create_bucket(Bucket="bench")
+    repo = S3JobRepository("bench", s3=s3)
+    msgs = [
+        {
+            "Body": "content.generate",
+            "MessageAttributes": {
+                "correlation_id": {"StringValue": f"c{i}", "DataType": "String"},
+                "params": {"StringValue": "{}", "DataType": "String"},
+            },
+        }
+        for i in range(jobs)
+    ]
+    samples = []
+    for msg in msgs:
+        t0 = time.perf_counter()
+        process_message(repo, msg)
+        samples.append(time.perf_counter() - t0)
+    return {"jobs": jobs, "mean": statistics.fmean(samples), **_percentiles(samples)}
+
+
+def test_worker_drains_queue_under_latency(monkeypatch):
+    stats = run_benchmark(monkeypatch, jobs=40, concurrency=4, timeout=20)
+    assert stats["jobs"] == 40
+    assert stats["p50"] <= stats["p95"] <= stats["p99"]
+    # Acks are batched, so far fewer delete calls than jobs
+    assert stats["calls"]["delete_message_batch"] < 40
+
+
+def test_process_message_overhead(monkeypatch):
+    stats = process_message_benchmark(monkeypatch, jobs=50)
+    assert stats["jobs"] == 50
+    assert stats["mean"] > 0
+
+
+if __name__ == "__main__":
+    import pytest
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--sqs-latency", type=float, default=0.005)
+    parser.add_argument("--s3-latency", type=float, default=0.015)
+    parser.add_argument("--agent-seconds", type=float, default=0.05)
+    args = parser.parse_args()
+
+    with pytest.MonkeyPatch.context() as mp:
+        stats = run_benchmark(
+            mp,
+            jobs=args.jobs,
+            concurrency=args.concurrency,
+            sqs_latency=args.sqs_latency,
+            s3_latency=args.s3_latency,
+            agent_seconds=args.agent_seconds,
+            timeout=600,
+        )
+        micro = process_message_benchmark(mp, s3_latency=args.s3_latency)
+    print(
+        f"{stats['jobs']} jobs in {stats['seconds']:.2f}s "
+        f"({stats['jobs_per_sec']:.1f} jobs/s); end-to-end "
+        f"p50={stats['p50'] * 1000:.1f}ms p95={stats['p95'] * 1000:.1f}ms "
+        f"p99={stats['p99'] * 1000:.1f}ms"
+    )
+    print(f"calls: {stats['calls']}")
+    print(
+        f"process_message: mean={micro['mean'] * 1000:.2f}ms "
+        f"p99={micro['p99'] * 1000:.2f}ms"
+    )
@@ -0,0 +1,54 @@
+import time
+
+from services.agent.app.worker.acks import AckBuffer
+
+
+class FakeSqs:
+    def __init__(self, fail_once=(), sender_fault=()):
+        self.calls: list[list[str]] = []
+        self.fail_once = set(fail_once)
+        self.sender_fault = set(sender_fault)
+
+    def delete_message_batch(self, QueueUrl, Entries):
+        self.calls.append([e["ReceiptHandle"] for e in Entries])
+        failed = []
+        for e in Entries:
+            rh = e["ReceiptHandle"]
+            if rh in self.sender_fault:
+                failed.append({"Id": e["Id"], "SenderFault": True, "Code": "x"})
+            elif rh in self.fail_once:
+                self.fail_once.discard(rh)
+                failed.append({"Id": e["Id"], "SenderFault": False, "Code": "x"})
+        return {"Failed": failed}
+
+
+def test_flushes_full_batches_of_ten():
+    sqs = FakeSqs()
+    acks = AckBuffer(sqs, "q", max_delay=60)
+    for i in range(25):
+        acks.ack(f"rh-{i}")
+    acks.close()
+    assert [len(c) for c in sqs.calls] == [10, 10, 5]
+
+
+def test_flushes_after_linger():
+    sqs = FakeSqs()
+    acks = AckBuffer(sqs, "q", max_delay=0.01)
+    acks.ack("rh-1")
+    for _ in range(100):
+        if sqs.calls:
+            break
+        time.sleep(0.01)
+    assert sqs.calls == [["rh-1"]]
+    acks.close()
+
+
+def test_retries_only_failed_entries():
+    sqs = FakeSqs(fail_once={"rh-2"}, sender_fault={"rh-3"})
+    acks = AckBuffer(sqs, "q", max_delay=60)
+    for i in range(1, 4):
+        acks.ack(f"rh-{i}")
+    acks.close()
+    assert sqs.calls[0] == ["rh-1", "rh-2", "rh-3"]
+    assert sqs.calls[1] == ["rh-2"]
+    assert len(sqs.calls) == 2
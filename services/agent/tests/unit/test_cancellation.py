@@ -0,0 +1,132 @@
+import time
+
+from services.agent.domain.services.cancellation import CancellationWatcher
+from services.agent.domain.services.worker import process_message
+
+
+class FakeRepo:
+    def __init__(self, canceled=()):
+        self.canceled = set(canceled)
+        self.list_calls = 0
+        self.head_calls = 0
+        self.marks = []
+
+    def list_canceled(self):
+        self.list_calls += 1
+        return set(self.canceled)
+
+    def is_canceled(self, cid):
+        self.head_calls += 1
+        return cid in self.canceled
+
+    def mark_running(self, cid):
+        self.marks.append(("running", cid))
+
+    def mark_completed(self, cid, result):
+        self.marks.append(("completed", cid))
+
+    def mark_failed(self, cid, error):
+        self.marks.append(("failed", cid, error))
+
+
+def _msg(cid):
+    return {
+        "Body": "content.generate",
+        "MessageAttributes": {
+            "correlation_id": {"StringValue": cid, "DataType": "String"},
+            "params": {"StringValue": "{}", "DataType": "String"},
+        },
+    }
+
+
+def test_refresh_is_one_call_for_all_tracked_ids():
+    repo = FakeRepo(canceled={"a", "other"})
+    w = CancellationWatcher(repo)
+    w.refresh()
+    assert repo.list_calls == 0  # nothing tracked, nothing to do
+
+    # Pickup does one check per job and never lists
+    w.track("a")
+    w.track("b")
+    assert (repo.list_calls, repo.head_calls) == (0, 2)
+    assert w.is_canceled("a")
+    assert not w.is_canceled("b")
+
+    repo.canceled.add("b")
+    w.refresh()
+    assert repo.list_calls == 1
+    assert w.is_canceled("b")
+    # Cancels of jobs this worker is not running are not kept
+    assert not w.is_canceled("other")
+    w.untrack("a")
+    assert not w.is_canceled("a")
+
+
+def test_background_refresh_keeps_to_the_interval():
+    repo = FakeRepo()
+    w = CancellationWatcher(repo, interval=0.2).start()
+    try:
+        deadline = time.monotonic() + 0.5
+        i = 0
+        while time.monotonic() < deadline:
+            w.track(f"job-{i}")
+            i += 1
+            time.sleep(0.005)
+    finally:
+        w.stop()
+    assert 1 <= repo.list_calls <= 3
+
+
+def test_process_message_uses_watcher(monkeypatch):
+    import services.agent.domain.services.worker as mod
+
+    repo = FakeRepo()
+    w = CancellationWatcher(repo)
+
+    def agent(job_type, params):
+        # Cancel lands while the agent is running
+        repo.canceled.add("job-1")
+        w.refresh()
+        return {"ok": True}
+
+    monkeypatch.setattr(mod, "run_agent", agent)
+    process_message(repo, _msg("job-1"), w)
+
+    assert repo.marks == [("running", "job-1"), ("failed", "job-1", "canceled")]
+
+
+def test_job_canceled_before_pickup_never_runs(monkeypatch):
+    import services.agent.domain.services.worker as mod
+
+    repo = FakeRepo(canceled={"job-1"})
+    w = CancellationWatcher(repo)
+    ran = []
+    monkeypatch.setattr(mod, "run_agent", lambda t, p: ran.append(t) or {})
+
+    process_message(repo, _msg("job-1"), w)
+
+    assert ran == []
+    assert repo.marks == [("running", "job-1"), ("failed", "job-1", "canceled")]
+
+
+def test_watcher_reads_redis_cancel_flags():
+    from services.agent.adapters.repositories.s3_jobs import S3JobRepository
+    from stack.libs.shared.redis_jobs import RedisJobStore
+    from stack.libs.testing.aws_fakes import FakeS3
+    from stack.libs.testing.redis_fake import FakeRedis
+
+    s3 = FakeS3()
+    s3.create_bucket(Bucket="b")
+    r = FakeRedis()
+    store = RedisJobStore(r, S3JobRepository("b", s3=s3))
+    # The web side flags the cancel; the agent only reads Redis
+    r.set("job:cancel:a", b"1", ex=60)
+    r.zadd("job:cancels", {"a": time.time()})
+
+    w = CancellationWatcher(store)
+    w.track("a")
+    w.track("b")
+    w.refresh()
+    assert w.is_canceled("a")
+    assert not w.is_canceled("b")
+    assert s3.calls.get("list_objects_v2", 0) == 0
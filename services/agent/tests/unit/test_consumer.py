@@ -0,0 +1,233 @@
+import threading
+
+from services.agent.app.worker.acks import AckBuffer
+from services.agent.app.worker.consumer import Consumer
+from services.agent.app.worker.pool import JobPool
+from services.agent.app.worker.retry import RetryPolicy
+from services.agent.domain.models.errors import FatalJobError
+
+
+class FakeRepo:
+    def __init__(self):
+        self.marks = []
+
+    def mark_running(self, cid):
+        self.marks.append(("running", cid))
+
+    def is_canceled(self, cid):
+        return False
+
+    def mark_completed(self, cid, result):
+        self.marks.append(("completed", cid))
+
+    def mark_failed(self, cid, error):
+        self.marks.append(("failed", cid))
+
+
+class FakeSqs:
+    def __init__(self, messages, stop, stop_during_poll=False):
+        self.messages = list(messages)
+        self.stop = stop
+        self.stop_during_poll = stop_during_poll
+        self.requested: list[int] = []
+        self.deleted: list[str] = []
+        self.released: list[tuple[str, int]] = []
+
+    def receive_message(self, **kw):
+        n = kw["MaxNumberOfMessages"]
+        self.requested.append(n)
+        batch, self.messages = self.messages[:n], self.messages[n:]
+        # Stop once the queue is drained, or (to simulate SIGTERM arriving
+        # mid long-poll) while the last batch is still being returned.
+        if not batch or (self.stop_during_poll and not self.messages):
+            self.stop.set()
+        return {"Messages": batch}
+
+    def delete_message_batch(self, **kw):
+        self.deleted.extend(e["ReceiptHandle"] for e in kw["Entries"])
+        return {"Successful": [{"Id": e["Id"]} for e in kw["Entries"]]}
+
+    def change_message_visibility(self, **kw):
+        self.released.append((kw["ReceiptHandle"], kw["VisibilityTimeout"]))
+
+    def change_message_visibility_batch(self, **kw):
+        for e in kw["Entries"]:
+            self.released.append((e["ReceiptHandle"], e["VisibilityTimeout"]))
+        return {"Successful": [{"Id": e["Id"]} for e in kw["Entries"]]}
+
+
+def _msg(i, receive_count=1):
+    return {
+        "Body": "content.generate",
+        "ReceiptHandle": f"rh-{i}",
+        "Attributes": {"ApproximateReceiveCount": str(receive_count)},
+        "MessageAttributes": {
+            "correlation_id": {"StringValue": f"cid-{i}", "DataType": "String"},
+            "params": {"StringValue": "{}", "DataType": "String"},
+        },
+    }
+
+
+def test_pool_keeps_n_jobs_in_flight_and_deletes_each(monkeypatch):
+    import services.agent.domain.services.worker as mod
+
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def fake_agent(job_type, params):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        threading.Event().wait(0.05)
+        with lock:
+            running["now"] -= 1
+        return {"ok": True}
+
+    monkeypatch.setattr(mod, "run_agent", fake_agent)
+
+    stop = threading.Event()
+    sqs = FakeSqs([_msg(i) for i in range(6)], stop)
+    repo = FakeRepo()
+    pool = JobPool(repo, size=3)
+    acks = AckBuffer(sqs, "q", max_delay=0.01)
+    Consumer(sqs, "q", pool, acks).run(stop)
+    pool.shutdown()
+    acks.close()
+
+    assert running["peak"] == 3
+    assert all(n <= 3 for n in sqs.requested)
+    assert sorted(sqs.deleted) == sorted(f"rh-{i}" for i in range(6))
+    assert sum(1 for m in repo.marks if m[0] == "completed") == 6
+
+
+def _run_failing(monkeypatch, exc, messages, retry=None):
+    import services.agent.domain.services.worker as mod
+
+    def boom(job_type, params):
+        raise exc
+
+    monkeypatch.setattr(mod, "run_agent", boom)
+
+    stop = threading.Event()
+    sqs = FakeSqs(messages, stop)
+    repo = FakeRepo()
+    pool = JobPool(repo, size=1)
+    acks = AckBuffer(sqs, "q", max_delay=0.01)
+    Consumer(sqs, "q", pool, acks, retry=retry).run(stop)
+    pool.shutdown()
+    acks.close()
+    return sqs, repo
+
+
+def test_retryable_failure_is_released_with_backoff(monkeypatch):
+    retry = RetryPolicy(base_seconds=10, jitter=False)
+    sqs, repo = _run_failing(
+        monkeypatch, ConnectionError("reset"), [_msg(1, receive_count=3)], retry
+    )
+    assert sqs.deleted == []
+    assert sqs.released == [("rh-1", 40)]
+    assert ("failed", "cid-1") not in repo.marks
+
+
+def test_fatal_failure_is_marked_failed_and_kept_for_the_dlq(monkeypatch):
+    sqs, repo = _run_failing(
+        monkeypatch,
+        FatalJobError("bad input"),
+        [_msg(1), _msg(2, receive_count=5)],
+        RetryPolicy(max_receives=5, fatal_visibility_seconds=3600),
+    )
+    assert sqs.deleted == []
+    assert sqs.released == [("rh-1", 3600), ("rh-2", 0)]
+    assert ("failed", "cid-1") in repo.marks
+
+
+def test_exhausted_retries_are_left_for_the_dlq(monkeypatch):
+    retry = RetryPolicy(max_receives=5)
+    sqs, repo = _run_failing(
+        monkeypatch, TimeoutError(), [_msg(1, receive_count=5)], retry
+    )
+    assert sqs.deleted == []
+    assert sqs.released == [("rh-1", 0)]
+    assert ("failed", "cid-1") in repo.marks
+
+
+def test_undecodable_message_is_reported_and_kept_for_the_dlq(monkeypatch):
+    import services.agent.domain.services.worker as mod
+
+    monkeypatch.setattr(mod, "run_agent", lambda job_type, params: {"ok": True})
+
+    bad = _msg(1)
+    bad["MessageAttributes"]["params"]["StringValue"] = "{oops"
+    stop = threading.Event()
+    sqs = FakeSqs([bad, _msg(2)], stop)
+    repo = FakeRepo()
+    pool = JobPool(repo, size=1)
+    acks = AckBuffer(sqs, "q", max_delay=0.01)
+    Consumer(sqs, "q", pool, acks).run(stop)
+    pool.shutdown()
+    acks.close()
+
+    assert sqs.deleted == ["rh-2"]
+    assert sqs.released == [("rh-1", RetryPolicy().fatal_visibility_seconds)]
+    assert ("failed", "cid-1") in repo.marks
+    assert ("completed", "cid-2") in repo.marks
+    assert ("running", "cid-1") not in repo.marks
+
+
+def test_drain_waits_for_jobs_that_finish_in_time(monkeypatch):
+    import services.agent.domain.services.worker as mod
+
+    monkeypatch.setattr(mod, "run_agent", lambda job_type, params: {"ok": True})
+
+    stop = threading.Event()
+    sqs = FakeSqs([_msg(1), _msg(2)], stop)
+    pool = JobPool(FakeRepo(), size=2)
+    acks = AckBuffer(sqs, "q", max_delay=0.01)
+    consumer = Consumer(sqs, "q", pool, acks)
+    consumer.run(stop)
+    assert consumer.drain(timeout=5) == 0
+    pool.shutdown()
+    acks.close()
+
+    assert sorted(sqs.deleted) == ["rh-1", "rh-2"]
+    assert sqs.released == []
+
+
+def test_drain_releases_unfinished_jobs_immediately(monkeypatch):
+    import services.agent.domain.services.worker as mod
+
+    gate = threading.Event()
+
+    def slow(job_type, params):
+        gate.wait(5)
+        return {"ok": True}
+
+    monkeypatch.setattr(mod, "run_agent", slow)
+
+    stop = threading.Event()
+    sqs = FakeSqs([_msg(1)], stop)
+    pool = JobPool(FakeRepo(), size=2)
+    acks = AckBuffer(sqs, "q", max_delay=0.01)
+    consumer = Consumer(sqs, "q", pool, acks)
+    consumer.run(stop)
+    assert consumer.drain(timeout=0.05) == 1
+    assert sqs.released == [("rh-1", 0)]
+
+    # The abandoned job finishing later must not ack a message it gave away
+    gate.set()
+    pool.shutdown()
+    acks.close()
+    assert sqs.deleted == []
+
+
+def test_messages_received_after_stop_are_released():
+    stop = threading.Event()
+    sqs = FakeSqs([_msg(1), _msg(2)], stop, stop_during_poll=True)
+    pool = JobPool(FakeRepo(), size=2)
+    acks = AckBuffer(sqs, "q", max_delay=0.01)
+    consumer = Consumer(sqs, "q", pool, acks)
+    consumer.run(stop)
+    pool.shutdown()
+    acks.close()
+    assert sqs.released == [("rh-1", 0), ("rh-2", 0)]
+    assert pool.inflight == 0
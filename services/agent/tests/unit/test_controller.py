@@ -0,0 +1,78 @@
+from services.agent.app.worker.controller import ConcurrencyController
+from services.agent.app.worker.pool import JobPool
+
+
+class FakeSqs:
+    def __init__(self):
+        self.visible = 0
+        self.calls = 0
+
+    def get_queue_attributes(self, QueueUrl, AttributeNames):
+        self.calls += 1
+        return {
+            "Attributes": {
+                "ApproximateNumberOfMessages": str(self.visible),
+                "ApproximateNumberOfMessagesNotVisible": "0",
+            }
+        }
+
+
+def _controller(monkeypatch, **kw):
+    import services.agent.app.worker.controller as mod
+
+    clock = {"t": 0.0}
+    monkeypatch.setattr(mod.time, "monotonic", lambda: clock["t"])
+    sqs = FakeSqs()
+    pool = JobPool(repo=None, size=kw.pop("size", 1), max_size=kw["max_size"])
+    return ConcurrencyController(sqs, "q", pool, **kw), sqs, pool, clock
+
+
+def test_ramps_up_fast_under_backlog_and_caches_depth(monkeypatch):
+    ctl, sqs, pool, clock = _controller(
+        monkeypatch, min_size=1, max_size=16, refresh_seconds=5
+    )
+    sqs.visible = 1000
+    assert ctl.adjust() == 2
+    assert ctl.adjust() == 2  # depth cached, no resize
+    assert sqs.calls == 1
+    for expected in (4, 8, 16, 16):
+        clock["t"] += 5
+        assert ctl.adjust() == expected
+    pool.shutdown()
+
+
+def test_shrinks_when_queue_is_empty(monkeypatch):
+    ctl, sqs, pool, clock = _controller(
+        monkeypatch, size=3, min_size=2, max_size=8, refresh_seconds=1
+    )
+    sizes = []
+    for _ in range(3):
+        sizes.append(ctl.adjust())
+        clock["t"] += 1
+    assert sizes == [2, 2, 2]
+    pool.shutdown()
+
+
+def test_backs_off_on_latency_regression(monkeypatch):
+    ctl, sqs, pool, clock = _controller(
+        monkeypatch, size=8, min_size=1, max_size=8, refresh_seconds=1
+    )
+    sqs.visible = 5
+    for _ in range(5):
+        ctl.record_latency(1.0)
+    assert ctl.adjust() == 8  # establishes the baseline
+    for _ in range(10):
+        ctl.record_latency(5.0)
+    clock["t"] += 1
+    assert ctl.adjust() == 6
+    pool.shutdown()
+
+
+def test_idle_backoff_grows_and_resets(monkeypatch):
+    ctl, sqs, pool, clock = _controller(
+        monkeypatch, min_size=1, max_size=2, idle_backoff_max=4
+    )
+    assert [ctl.after_poll(0) for _ in range(4)] == [1.0, 2.0, 4.0, 4.0]
+    assert ctl.after_poll(3) == 0.0
+    assert ctl.after_poll(0) == 1.0
+    pool.shutdown()
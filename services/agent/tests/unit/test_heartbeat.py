@@ -0,0 +1,57 @@
+from services.agent.app.worker.heartbeat import VisibilityHeartbeat
+
+
+class FakeSqs:
+    def __init__(self, invalid=()):
+        self.calls: list[list[tuple[str, int]]] = []
+        self.invalid = set(invalid)
+
+    def change_message_visibility_batch(self, QueueUrl, Entries):
+        self.calls.append(
+            [(e["ReceiptHandle"], e["VisibilityTimeout"]) for e in Entries]
+        )
+        failed = [
+            {"Id": e["Id"], "SenderFault": True, "Code": "ReceiptHandleIsInvalid"}
+            for e in Entries
+            if e["ReceiptHandle"] in self.invalid
+        ]
+        return {"Failed": failed}
+
+
+def test_extends_all_inflight_in_batches_of_ten():
+    sqs = FakeSqs()
+    hb = VisibilityHeartbeat(sqs, "q", step=120)
+    for i in range(12):
+        hb.track(f"rh-{i}")
+    hb.untrack("rh-0")
+    hb.beat()
+    assert [len(c) for c in sqs.calls] == [10, 1]
+    assert all(t == 120 for c in sqs.calls for _, t in c)
+
+
+def test_stops_extending_at_cap(monkeypatch):
+    import services.agent.app.worker.heartbeat as mod
+
+    now = {"t": 1000.0}
+    monkeypatch.setattr(mod.time, "monotonic", lambda: now["t"])
+    sqs = FakeSqs()
+    hb = VisibilityHeartbeat(sqs, "q", step=120, cap=300)
+    hb.track("rh")
+
+    now["t"] += 250
+    hb.beat()
+    assert sqs.calls[-1] == [("rh", 50)]
+
+    now["t"] += 100
+    hb.beat()
+    assert len(sqs.calls) == 1
+
+
+def test_drops_invalid_receipts():
+    sqs = FakeSqs(invalid={"gone"})
+    hb = VisibilityHeartbeat(sqs, "q")
+    hb.track("gone")
+    hb.track("ok")
+    hb.beat()
+    hb.beat()
+    assert [rh for rh, _ in sqs.calls[-1]] == ["ok"]
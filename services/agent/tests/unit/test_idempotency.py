@@ -0,0 +1,76 @@
+from services.agent.domain.services.idempotency import IdempotencyGuard
+from services.agent.domain.services.worker import process_message
+
+
+class FakeRepo:
+    def __init__(self, statuses=None):
+        self.statuses = dict(statuses or {})
+        self.reads = 0
+        self.marks = []
+
+    def get_status(self, cid):
+        self.reads += 1
+        return self.statuses.get(cid)
+
+    def is_canceled(self, cid):
+        return False
+
+    def mark_running(self, cid):
+        self.marks.append(("running", cid))
+        self.statuses[cid] = {"status": "running"}
+
+    def mark_completed(self, cid, result):
+        self.marks.append(("completed", cid))
+        self.statuses[cid] = {"status": "completed"}
+
+    def mark_failed(self, cid, error):
+        self.marks.append(("failed", cid))
+        self.statuses[cid] = {"status": "failed"}
+
+
+def _msg(cid):
+    return {
+        "Body": "content.generate",
+        "MessageAttributes": {
+            "correlation_id": {"StringValue": cid, "DataType": "String"},
+            "params": {"StringValue": "{}", "DataType": "String"},
+        },
+    }
+
+
+def test_redelivered_job_is_skipped_from_local_cache(monkeypatch):
+    import services.agent.domain.services.worker as mod
+
+    runs = []
+    monkeypatch.setattr(mod, "run_agent", lambda t, p: runs.append(t) or {})
+
+    repo = FakeRepo()
+    guard = IdempotencyGuard(repo)
+    process_message(repo, _msg("a"), guard=guard)
+    process_message(repo, _msg("a"), guard=guard)
+
+    assert len(runs) == 1
+    assert repo.marks == [("running", "a"), ("completed", "a")]
+    assert repo.reads == 1  # only the first delivery needed a status read
+
+
+def test_terminal_status_in_store_skips_job(monkeypatch):
+    import services.agent.domain.services.worker as mod
+
+    monkeypatch.setattr(mod, "run_agent", lambda t, p: {})
+
+    repo = FakeRepo({"done": {"status": "canceled"}, "live": {"status": "running"}})
+    guard = IdempotencyGuard(repo)
+    process_message(repo, _msg("done"), guard=guard)
+    process_message(repo, _msg("live"), guard=guard)
+
+    assert ("running", "done") not in repo.marks
+    assert ("completed", "live") in repo.marks
+
+
+def test_lru_is_bounded():
+    guard = IdempotencyGuard(FakeRepo(), capacity=2)
+    for cid in ("a", "b", "c"):
+        guard.remember(cid)
+    assert not guard.already_done("a")
+    assert guard.already_done("c")
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from services.agent.domain.models.messages import (
+    JobMessage,
+    MessageDecodeError,
+    decode_message,
+)
+from stack.libs.shared.codec import available, get_codec
+
+
+@pytest.fixture(params=[n for n in available() if n != "msgpack"])
+def codec(request):
+    return get_codec(request.param)
+
+
+def test_decodes_sqs_attribute_shape(codec):
+    msg = {
+        "Body": "content.generate",
+        "ReceiptHandle": "rh",
+        "MessageAttributes": {
+            "correlation_id": {"StringValue": "abc", "DataType": "String"},
+            "params": {"StringValue": '{"topic": "x"}', "DataType": "String"},
+        },
+    }
+    assert decode_message(msg, codec) == JobMessage(
+        correlation_id="abc",
+        job_type="content.generate",
+        params={"topic": "x"},
+        receipt_handle="rh",
+    )
+
+
+def test_decodes_eventbridge_detail_shape(codec):
+    body = {
+        "detail-type": "jobs.requested",
+        "detail": {"job_type": "t", "params": {"a": 1}, "correlation_id": "eb-1"},
+    }
+    job = decode_message({"Body": json.dumps(body), "ReceiptHandle": "rh"}, codec)
+    assert job.correlation_id == "eb-1"
+    assert job.job_type == "t"
+    assert job.params == {"a": 1}
+
+
+def test_reports_bad_params_with_correlation_id(codec):
+    msg = {
+        "Body": "content.generate",
+        "MessageAttributes": {
+            "correlation_id": {"StringValue": "abc", "DataType": "String"},
+            "params": {"StringValue": "{not json", "DataType": "String"},
+        },
+    }
+    with pytest.raises(MessageDecodeError) as exc:
+        decode_message(msg, codec)
+    assert exc.value.correlation_id == "abc"
+
+
+@pytest.mark.parametrize(
+    "msg",
+    [
+        {"Body": "{broken"},
+        {"Body": json.dumps({"detail": {"job_type": "t"}})},
+        {"Body": "content.generate", "MessageAttributes": {}},
+    ],
+)
+def test_rejects_undecodable_messages(msg, codec):
+    with pytest.raises(MessageDecodeError):
+        decode_message(msg, codec)
+
+
+def test_decodes_msgpack_binary_params():
+    if "msgpack" not in available():
+        pytest.skip("msgpack not installed")
+    packed = get_codec("msgpack").dumps({"a": [1, 2]})
+    msg = {
+        "Body": "content.generate",
+        "MessageAttributes": {
+            "correlation_id": {"StringValue": "abc", "DataType": "String"},
+            "params": {"BinaryValue": packed, "DataType": "Binary.msgpack"},
+        },
+    }
+    assert decode_message(msg).params == {"a": [1, 2]}
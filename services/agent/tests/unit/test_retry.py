@@ -0,0 +1,45 @@
+import pytest
+
+from services.agent.app.worker.retry import RetryPolicy
+from services.agent.domain.models.errors import FatalJobError, RetryableJobError
+from services.agent.domain.models.messages import MessageDecodeError
+
+
+class FakeClientError(Exception):
+    def __init__(self, code, status):
+        super().__init__(code)
+        self.response = {
+            "Error": {"Code": code},
+            "ResponseMetadata": {"HTTPStatusCode": status},
+        }
+
+
+@pytest.mark.parametrize(
+    "exc, retryable",
+    [
+        (RetryableJobError("later"), True),
+        (ConnectionError("reset"), True),
+        (TimeoutError(), True),
+        (FakeClientError("SlowDown", 503), True),
+        (FakeClientError("InternalError", 500), True),
+        (FakeClientError("AccessDenied", 403), False),
+        (FakeClientError("ExpiredToken", 400), True),
+        (FakeClientError("RequestExpired", 400), True),
+        (FatalJobError("nope"), False),
+        (MessageDecodeError("garbage"), False),
+        (ValueError("bad params"), False),
+    ],
+)
+def test_classifies_failures(exc, retryable):
+    assert RetryPolicy().is_retryable(exc) is retryable
+
+
+def test_backoff_grows_exponentially_and_is_capped():
+    p = RetryPolicy(base_seconds=5, max_backoff_seconds=60, jitter=False)
+    assert [p.backoff(n) for n in range(1, 6)] == [5, 10, 20, 40, 60]
+
+
+def test_backoff_jitter_stays_within_bounds():
+    p = RetryPolicy(base_seconds=8, jitter=True)
+    for _ in range(50):
+        assert 8 <= p.backoff(2) <= 16
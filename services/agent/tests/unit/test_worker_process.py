@@ -34,3 +34,65 @@ def test_process_message(monkeypatch):
     }
     process_message(repo, msg)
     assert ("completed", "abc") in repo.marks
+
+
+def test_repository_records_transitions_in_index():
+    from services.agent.adapters.repositories.s3_jobs import S3JobRepository
+    from stack.libs.testing.aws_fakes import FakeS3
+
+    class Index:
+        def __init__(self):
+            self.records = []
+
+        def record(self, cid, status, job_type=None, error=None):
+            self.records.append((cid, status, error))
+
+    s3 = FakeS3()
+    s3.create_bucket(Bucket="b")
+    index = Index()
+    repo = S3JobRepository("b", s3=s3, index=index)
+    repo.mark_running("c")
+    repo.mark_failed("c", "boom")
+    assert index.records == [("c", "running", None), ("c", "failed", "boom")]
+    assert repo.get_status("c")["status"] == "failed"
+
+
+def test_process_pool_runs_jobs_in_spawned_children(tmp_path):
+    import functools
+    import os
+
+    from services.agent.app.worker.pool import JobPool
+    from services.agent.domain.models.messages import decode_message
+    from stack.libs.testing.file_jobs import FileJobRepository
+
+    def msg(cid):
+        return decode_message(
+            {
+                "Body": "content.generate",
+                "MessageAttributes": {
+                    "correlation_id": {"StringValue": cid, "DataType": "String"},
+                    "params": {"StringValue": "{}", "DataType": "String"},
+                },
+            }
+        )
+
+    factory = functools.partial(FileJobRepository, str(tmp_path))
+    repo = factory()
+    repo.mark_canceled("p2")
+    pool = JobPool(repo, size=2, mode="process", repo_factory=factory)
+    try:
+        assert pool._executor._mp_context.get_start_method() == "spawn"
+        futures = [
+            pool.submit(msg(cid), on_done=lambda f: None) for cid in ("p1", "p2")
+        ]
+        for fut in futures:
+            fut.result(timeout=60)
+    finally:
+        pool.shutdown()
+
+    done = repo.get_status("p1")
+    assert done["status"] == "completed"
+    assert done["pid"] != os.getpid()
+    canceled = repo.get_status("p2")
+    assert (canceled["status"], canceled["error"]) == ("failed", "canceled")
+    assert pool.inflight == 0
@@ -0,0 +1,75 @@
+import asyncio
+import base64
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from services.auth.domain.models.errors import HashingOverloaded
+from stack.libs.shared.memo import once
+
+PBKDF2_ROUNDS = 200_000
+
+
+def pbkdf2(password: str, salt: str, rounds: int = PBKDF2_ROUNDS) -> str:
+    dk = hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), base64.b64decode(salt), rounds
+    )
+    return base64.b64encode(dk).decode()
+
+
+class HashPool:
+    """PBKDF2 on a CPU-sized pool with a bounded backlog.
+
+    ``pbkdf2_hmac`` releases the GIL, so threads give real parallelism without
+    process start-up or pickling. At most ``workers + max_queue`` hashes are
+    admitted; beyond that ``HashingOverloaded`` is raised immediately instead
+    of letting login latency grow without bound. Async callers should use
+    ``hash_async`` so the check runs on the event loop, not behind another
+    executor's queue.
+    """
+
+    def __init__(self, workers: int | None = None, max_queue: int = 64):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self._slots = threading.BoundedSemaphore(self.workers + max_queue)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="pbkdf2"
+        )
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls) -> "HashPool":
+        workers = os.getenv("HASH_WORKERS")
+        return cls(
+            workers=int(workers) if workers else None,
+            max_queue=int(os.getenv("HASH_MAX_QUEUE", "64")),
+        )
+
+    def _admit(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            self.rejected += 1
+            raise HashingOverloaded("password hashing is saturated")
+
+    def hash(self, password: str, salt: str) -> str:
+        self._admit()
+        try:
+            return self._pool.submit(pbkdf2, password, salt).result()
+        finally:
+            self._slots.release()
+
+    async def hash_async(self, password: str, salt: str) -> str:
+        self._admit()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, pbkdf2, password, salt)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+@once
+def hash_pool() -> HashPool:
+    return HashPool.from_env()
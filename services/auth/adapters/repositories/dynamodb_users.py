@@ -1,69 +1,105 @@
 import base64
-import hashlib
 import os
 import secrets
-from typing import Optional
-
-import boto3
+from typing import Callable, Optional
 
+from services.auth.adapters.hashing import HashPool, hash_pool, pbkdf2
 from services.auth.domain.ports.users import UserRecord
+from stack.libs.shared.aio import run_blocking
+from stack.libs.shared.aws import shared_client
 
 
 class DynamoUsers:
-    def __init__(self, table_name: str):
-        self.table = boto3.resource("dynamodb").Table(table_name)
+    def __init__(
+        self,
+        table_name: str,
+        hasher: Callable[[str, str], str] | None = None,
+        ddb=None,
+        pool: HashPool | None = None,
+    ):
+        self.table = table_name
+        self.pool = pool
+        self.hasher = hasher or (pool.hash if pool is not None else pbkdf2)
+        # Low-level client: cheap to share, and the pooled config applies
+        self.ddb = ddb or shared_client("dynamodb")
 
     @classmethod
     def from_env(cls) -> "DynamoUsers":
         table = os.getenv("AUTH_USERS_TABLE") or "auth-users"
-        inst = cls(table)
+        inst = cls(table, pool=hash_pool())
         # Auto-provision when running against LocalStack to ease local dev
         if os.getenv("LOCALSTACK", "").lower() in ("1", "true", "yes", "on"):
-            exceptions = inst.table.meta.client.exceptions
-            try:
-                inst.table.load()
-            except exceptions.ResourceNotFoundException:  # type: ignore[attr-defined]
-                inst.table = inst.table.meta.client.create_table(
-                    TableName=table,
-                    AttributeDefinitions=[
-                        {"AttributeName": "pk", "AttributeType": "S"}
-                    ],
-                    KeySchema=[{"AttributeName": "pk", "KeyType": "HASH"}],
-                    BillingMode="PAY_PER_REQUEST",
-                )
+            inst.ensure_table()
         return inst
 
-    def _hash(self, password: str, salt: str) -> str:
-        dk = hashlib.pbkdf2_hmac(
-            "sha256", password.encode(), base64.b64decode(salt), 200_000
+    def ensure_table(self) -> None:
+        try:
+            self.ddb.describe_table(TableName=self.table)
+            return
+        except Exception:  # noqa: BLE001
+            pass
+        self.ddb.create_table(
+            TableName=self.table,
+            AttributeDefinitions=[{"AttributeName": "pk", "AttributeType": "S"}],
+            KeySchema=[{"AttributeName": "pk", "KeyType": "HASH"}],
+            BillingMode="PAY_PER_REQUEST",
         )
-        return base64.b64encode(dk).decode()
+
+    def _hash(self, password: str, salt: str) -> str:
+        return self.hasher(password, salt)
+
+    async def _hash_async(self, password: str, salt: str) -> str:
+        if self.pool is None:
+            return await run_blocking(self._hash, password, salt)
+        return await self.pool.hash_async(password, salt)
 
     def get_by_email(self, email: str) -> Optional[UserRecord]:
-        resp = self.table.get_item(Key={"pk": f"USER#{email}"})
+        resp = self.ddb.get_item(
+            TableName=self.table, Key={"pk": {"S": f"USER#{email}"}}
+        )
         item = resp.get("Item")
         if not item:
             return None
         return UserRecord(
             email=email,
-            username=item.get("username", ""),
-            password_hash=item["password_hash"],
-            salt=item["salt"],
+            username=item.get("username", {}).get("S", ""),
+            password_hash=item["password_hash"]["S"],
+            salt=item["salt"]["S"],
         )
 
-    def create_user(self, email: str, username: str, password: str) -> UserRecord:
-        salt = base64.b64encode(secrets.token_bytes(16)).decode()
-        ph = self._hash(password, salt)
-        self.table.put_item(
+    def _put_user(self, email: str, username: str, ph: str, salt: str) -> UserRecord:
+        self.ddb.put_item(
+            TableName=self.table,
             Item={
-                "pk": f"USER#{email}",
-                "username": username,
-                "password_hash": ph,
-                "salt": salt,
+                "pk": {"S": f"USER#{email}"},
+                "username": {"S": username},
+                "password_hash": {"S": ph},
+                "salt": {"S": salt},
             },
             ConditionExpression="attribute_not_exists(pk)",
         )
         return UserRecord(email=email, username=username, password_hash=ph, salt=salt)
 
+    def create_user(self, email: str, username: str, password: str) -> UserRecord:
+        salt = _new_salt()
+        return self._put_user(email, username, self._hash(password, salt), salt)
+
     def verify_password(self, rec: UserRecord, password: str) -> bool:
         return secrets.compare_digest(self._hash(password, rec.salt), rec.password_hash)
+
+    # Async variants hash on the pool directly, so admission is decided on the
+    # event loop instead of after waiting in the io executor's queue.
+    async def create_user_async(
+        self, email: str, username: str, password: str
+    ) -> UserRecord:
+        salt = _new_salt()
+        ph = await self._hash_async(password, salt)
+        return await run_blocking(self._put_user, email, username, ph, salt)
+
+    async def verify_password_async(self, rec: UserRecord, password: str) -> bool:
+        ph = await self._hash_async(password, rec.salt)
+        return secrets.compare_digest(ph, rec.password_hash)
+
+
+def _new_salt() -> str:
+    return base64.b64encode(secrets.token_bytes(16)).decode()
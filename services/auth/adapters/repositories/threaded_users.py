@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from services.auth.domain.ports.users import UserRecord, UserRepository
+from stack.libs.shared.aio import run_blocking
+
+
+class ThreadedUsers:
+    """Async ``UserRepository`` running a blocking one on a bounded executor.
+
+    Password hashing goes through the repository's own ``*_async`` methods
+    when it has them, so hashing never queues behind lookups on the executor.
+    """
+
+    def __init__(
+        self, users: UserRepository, executor: ThreadPoolExecutor | None = None
+    ):
+        self.users = users
+        self.executor = executor
+
+    async def get_by_email(self, email: str) -> Optional[UserRecord]:
+        return await run_blocking(
+            self.users.get_by_email, email, executor=self.executor
+        )
+
+    async def create_user(self, email: str, username: str, password: str) -> UserRecord:
+        native = getattr(self.users, "create_user_async", None)
+        if native is not None:
+            return await native(email, username, password)
+        return await run_blocking(
+            self.users.create_user, email, username, password, executor=self.executor
+        )
+
+    async def verify_password(self, rec: UserRecord, password: str) -> bool:
+        native = getattr(self.users, "verify_password_async", None)
+        if native is not None:
+            return await native(rec, password)
+        return await run_blocking(
+            self.users.verify_password, rec, password, executor=self.executor
+        )
@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+
+import jwt
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "EdDSA")
+
+
+class TokenSigner:
+    """Issues tokens with the configured algorithm and verifies them.
+
+    With ``RS256``/``EdDSA`` tokens carry a ``kid`` header and the public half
+    is published via ``jwks()`` so other services can verify locally. HS256
+    tokens signed with ``secret`` stay valid while ``accept_hs256`` is on, so
+    already-issued tokens keep working during the migration.
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        algorithm: str = "HS256",
+        private_key: str | None = None,
+        key_id: str | None = None,
+        accept_hs256: bool = True,
+    ):
+        self.secret = secret
+        self.algorithm = algorithm
+        self.accept_hs256 = accept_hs256 or algorithm == "HS256"
+        self._private = None
+        self._public = None
+        self._jwk: dict | None = None
+        self.key_id: str | None = None
+        if algorithm in ASYMMETRIC_ALGORITHMS:
+            if not private_key:
+                raise ValueError(f"{algorithm} signing requires JWT_PRIVATE_KEY")
+            algo = jwt.get_algorithm_by_name(algorithm)
+            self._private = algo.prepare_key(private_key)
+            self._public = self._private.public_key()
+            jwk = algo.to_jwk(self._public, as_dict=True)
+            self.key_id = key_id or _thumbprint(jwk)
+            self._jwk = {**jwk, "kid": self.key_id, "alg": algorithm, "use": "sig"}
+        elif algorithm != "HS256":
+            raise ValueError(f"unsupported JWT algorithm {algorithm!r}")
+
+    @classmethod
+    def from_env(cls) -> "TokenSigner":
+        private_key = os.getenv("JWT_PRIVATE_KEY")
+        path = os.getenv("JWT_PRIVATE_KEY_FILE")
+        if not private_key and path:
+            with open(path) as fh:
+                private_key = fh.read()
+        return cls(
+            os.getenv("JWT_SECRET", "dev-secret"),
+            os.getenv("JWT_ALGORITHM", "HS256"),
+            private_key,
+            os.getenv("JWT_KEY_ID"),
+            os.getenv("JWT_ACCEPT_HS256", "true").lower() in ("1", "true", "yes", "on"),
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """Changes whenever any verification key does (for cache invalidation)."""
+        parts = [self.algorithm, self.key_id or ""]
+        if self.accept_hs256:
+            parts.append(self.secret)
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def encode(self, payload: dict) -> str:
+        if self._private is None:
+            return jwt.encode(payload, self.secret, algorithm="HS256")
+        return jwt.encode(
+            payload,
+            self._private,
+            algorithm=self.algorithm,
+            headers={"kid": self.key_id},
+        )
+
+    def decode(self, token: str) -> dict:
+        """Verified claims; raises ``jwt.PyJWTError`` on any failure."""
+        header = jwt.get_unverified_header(token)
+        alg = header.get("alg")
+        if alg == "HS256" and self.accept_hs256:
+            return jwt.decode(token, self.secret, algorithms=["HS256"])
+        if self._public is not None and alg == self.algorithm:
+            if header.get("kid") not in (None, self.key_id):
+                raise jwt.InvalidTokenError(f"unknown key id {header.get('kid')!r}")
+            return jwt.decode(token, self._public, algorithms=[self.algorithm])
+        raise jwt.InvalidAlgorithmError(f"algorithm {alg!r} is not accepted")
+
+    def jwks(self) -> dict:
+        return {"keys": [self._jwk] if self._jwk else []}
+
+
+def _thumbprint(jwk: dict) -> str:
+    """RFC 7638 JWK thumbprint (SHA-256, base64url) of the public key."""
+    required = {"RSA": ("e", "kty", "n"), "OKP": ("crv", "kty", "x")}[jwk["kty"]]
+    canonical = json.dumps(
+        {k: jwk[k] for k in required}, separators=(",", ":"), sort_keys=True
+    )
+    digest = hashlib.sha256(canonical.encode()).digest()
+    return jwt.utils.base64url_encode(digest).decode()
@@ -1,13 +1,42 @@
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
 
 import jwt
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, EmailStr
 
 from services.auth.adapters.repositories.dynamodb_users import DynamoUsers
+from services.auth.adapters.repositories.threaded_users import ThreadedUsers
+from services.auth.adapters.signing import TokenSigner
+from services.auth.domain.models.errors import HashingOverloaded
+from services.auth.domain.ports.users import AsyncUserRepository
+from services.auth.public.providers import provide_signer, provide_users
+from stack.libs.shared.aio import run_blocking
+from stack.libs.shared.logging import get_logger
+from stack.libs.shared.token_cache import TokenCache
+
+log = get_logger("auth.api")
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Build the shared client (and run any LocalStack table bootstrap) before
+    # the first login rather than inside it.
+    try:
+        await run_blocking(provide_users)
+    except Exception as exc:
+        log.warning("users repository not ready at startup: %s", exc)
+    await run_blocking(provide_signer)
+    yield
+
 
-app = FastAPI(title="auth", version="0.1.0")
+app = FastAPI(title="auth", version="0.1.0", lifespan=_lifespan)
+
+# Other services call /verify per request; repeat tokens skip jwt.decode
+_token_cache = TokenCache(capacity=int(os.getenv("VERIFY_CACHE_SIZE", "4096")))
 
 
 class RegisterRequest(BaseModel):
@@ -22,33 +51,48 @@ class LoginRequest(BaseModel):
 
 
 def repo() -> DynamoUsers:
-    return DynamoUsers.from_env()
+    return provide_users()
+
 
+def _async_repo() -> AsyncUserRepository:
+    return ThreadedUsers(repo())
 
-def _jwt_secret() -> str:
-    return os.getenv("JWT_SECRET", "dev-secret")
+
+def _signer() -> TokenSigner:
+    return provide_signer()
+
+
+@app.exception_handler(HashingOverloaded)
+async def _hashing_overloaded(
+    _request: Request, exc: HashingOverloaded
+) -> JSONResponse:
+    return JSONResponse(
+        {"detail": str(exc)}, status_code=503, headers={"Retry-After": "1"}
+    )
 
 
 @app.get("/healthz")
-def healthz() -> dict[str, str]:
+async def healthz() -> dict[str, str]:
     return {"status": "ok"}
 
 
 @app.post("/register")
-def register(req: RegisterRequest) -> dict:
-    r = repo()
+async def register(req: RegisterRequest) -> dict:
+    r = _async_repo()
     try:
-        r.create_user(req.email, req.username, req.password)
+        await r.create_user(req.email, req.username, req.password)
+    except HashingOverloaded:
+        raise
     except Exception as e:  # noqa: BLE001
         raise HTTPException(400, f"could not create: {e}")
     return {"ok": True}
 
 
 @app.post("/login")
-def login(req: LoginRequest) -> dict:
-    r = repo()
-    rec = r.get_by_email(req.email)
-    if not rec or not r.verify_password(rec, req.password):
+async def login(req: LoginRequest) -> dict:
+    r = _async_repo()
+    rec = await r.get_by_email(req.email)
+    if not rec or not await r.verify_password(rec, req.password):
         raise HTTPException(401, "invalid credentials")
     now = datetime.now(tz=timezone.utc)
     payload = {
@@ -57,17 +101,31 @@ def login(req: LoginRequest) -> dict:
         "iat": int(now.timestamp()),
         "exp": int((now + timedelta(hours=12)).timestamp()),
     }
-    token = jwt.encode(payload, _jwt_secret(), algorithm="HS256")
+    token = _signer().encode(payload)
     return {"token": token}
 
 
 @app.get("/verify")
-def verify(token: str) -> dict:
-    try:
-        data = jwt.decode(token, _jwt_secret(), algorithms=["HS256"])
-        return {"valid": True, "sub": data.get("sub"), "name": data.get("name")}
-    except jwt.PyJWTError as e:  # type: ignore[attr-defined]
-        raise HTTPException(401, f"invalid: {e}")
+async def verify(token: str) -> dict:
+    signer = _signer()
+    _token_cache.bind(signer.fingerprint)
+    data = _token_cache.get(token)
+    if data is None:
+        try:
+            data = signer.decode(token)
+        except jwt.PyJWTError as e:  # type: ignore[attr-defined]
+            raise HTTPException(401, f"invalid: {e}")
+        _token_cache.put(token, data)
+    return {"valid": True, "sub": data.get("sub"), "name": data.get("name")}
+
+
+@app.get("/.well-known/jwks.json")
+async def jwks() -> Response:
+    # Public keys only; downstream verifiers cache this and refresh on unknown kid
+    return JSONResponse(
+        _signer().jwks(),
+        headers={"Cache-Control": "public, max-age=300"},
+    )
 
 
 def run() -> None:
@@ -0,0 +1,2 @@
+class HashingOverloaded(RuntimeError):
+    """Too many password hashes are already queued; retry shortly."""
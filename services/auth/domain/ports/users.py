@@ -17,3 +17,13 @@ class UserRepository(Protocol):
     def get_by_email(self, email: str) -> Optional[UserRecord]: ...
     def create_user(self, email: str, username: str, password: str) -> UserRecord: ...
     def verify_password(self, rec: UserRecord, password: str) -> bool: ...
+
+
+class AsyncUserRepository(Protocol):
+    async def get_by_email(self, email: str) -> Optional[UserRecord]: ...
+
+    async def create_user(
+        self, email: str, username: str, password: str
+    ) -> UserRecord: ...
+
+    async def verify_password(self, rec: UserRecord, password: str) -> bool: ...
@@ -0,0 +1,17 @@
+from services.auth.adapters.repositories.dynamodb_users import DynamoUsers
+from services.auth.adapters.signing import TokenSigner
+from stack.libs.shared.memo import once
+
+
+# Built once per process: the DynamoDB client is shared and pooled, and the
+# LocalStack table bootstrap in from_env() runs only on the first call.
+@once
+def provide_users() -> DynamoUsers:
+    return DynamoUsers.from_env()
+
+
+# Built once per process: PEM parsing (and JWT_PRIVATE_KEY_FILE reads) stay
+# off the /login and /verify paths. Key rotation takes a restart.
+@once
+def provide_signer() -> TokenSigner:
+    return TokenSigner.from_env()
@@ -32,6 +32,7 @@ def test_register_and_login(monkeypatch):
     repo = FakeRepo()
     monkeypatch.setattr(mod, "repo", lambda: repo)
     monkeypatch.setenv("JWT_SECRET", "test-secret")
+    mod.provide_signer.reset()
 
     client = TestClient(app)
 
@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+
+from services.auth.adapters import hashing
+from services.auth.adapters.hashing import HashPool, pbkdf2
+from services.auth.domain.models.errors import HashingOverloaded
+
+
+def test_pool_matches_direct_hash():
+    pool = HashPool(workers=2)
+    try:
+        assert pool.hash("pw", "c2FsdA==") == pbkdf2("pw", "c2FsdA==")
+    finally:
+        pool.close()
+
+
+def test_pool_refuses_beyond_backlog(monkeypatch):
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow(password, salt):
+        started.set()
+        release.wait(5)
+        return "h"
+
+    monkeypatch.setattr(hashing, "pbkdf2", slow)
+    pool = HashPool(workers=1, max_queue=0)
+    t = threading.Thread(target=pool.hash, args=("a", "s"))
+    t.start()
+    try:
+        assert started.wait(5)
+        with pytest.raises(HashingOverloaded):
+            pool.hash("b", "s")
+        assert pool.rejected == 1
+    finally:
+        release.set()
+        t.join()
+        pool.close()
+    # The slot is returned once the running hash finishes
+    assert HashPool(workers=1, max_queue=0).hash("c", "s") == "h"
+
+
+def test_overloaded_login_is_503(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import services.auth.app.api.main as mod
+
+    class BusyRepo:
+        def get_by_email(self, email):
+            return object()
+
+        def verify_password(self, rec, password):
+            raise HashingOverloaded("busy")
+
+        def create_user(self, email, username, password):
+            raise HashingOverloaded("busy")
+
+    monkeypatch.setattr(mod, "repo", lambda: BusyRepo())
+    client = TestClient(mod.app)
+
+    r = client.post("/login", json={"email": "a@b.com", "password": "p"})
+    assert r.status_code == 503
+    assert r.headers["Retry-After"] == "1"
+    r = client.post(
+        "/register", json={"email": "a@b.com", "username": "u", "password": "p"}
+    )
+    assert r.status_code == 503
+
+
+def test_admission_applies_through_threaded_users(monkeypatch):
+    import asyncio
+    import time
+
+    from services.auth.adapters.repositories.dynamodb_users import DynamoUsers
+    from services.auth.adapters.repositories.threaded_users import ThreadedUsers
+    from services.auth.domain.ports.users import UserRecord
+
+    def slow(password, salt):
+        time.sleep(0.2)
+        return "h"
+
+    monkeypatch.setattr(hashing, "pbkdf2", slow)
+    pool = HashPool(workers=1, max_queue=1)
+    users = ThreadedUsers(DynamoUsers("t", ddb=object(), pool=pool))
+    rec = UserRecord("a@b.com", "u", "h", "s")
+
+    async def burst():
+        return await asyncio.gather(
+            *(users.verify_password(rec, "pw") for _ in range(20)),
+            return_exceptions=True,
+        )
+
+    started = time.monotonic()
+    try:
+        results = asyncio.run(burst())
+    finally:
+        pool.close()
+    assert results.count(True) == 2
+    assert sum(isinstance(r, HashingOverloaded) for r in results) == 18
+    assert pool.rejected == 18
+    # Rejected calls never waited behind the admitted ones
+    assert time.monotonic() - started < 1.0
@@ -0,0 +1,111 @@
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from services.auth.adapters.signing import TokenSigner
+
+
+def _pem(key) -> str:
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+@pytest.fixture(scope="module")
+def rsa_pem():
+    return _pem(rsa.generate_private_key(public_exponent=65537, key_size=2048))
+
+
+def _claims():
+    return {"sub": "a@b.com", "exp": int(time.time()) + 60}
+
+
+@pytest.mark.parametrize("alg", ["RS256", "EdDSA"])
+def test_asymmetric_round_trip_and_jwks(alg, rsa_pem):
+    pem = rsa_pem if alg == "RS256" else _pem(ed25519.Ed25519PrivateKey.generate())
+    signer = TokenSigner("s", algorithm=alg, private_key=pem)
+    token = signer.encode(_claims())
+    assert jwt.get_unverified_header(token)["kid"] == signer.key_id
+    assert signer.decode(token)["sub"] == "a@b.com"
+
+    # A verifier holding only the JWKS can check the token
+    (jwk,) = signer.jwks()["keys"]
+    assert jwk["kid"] == signer.key_id and "d" not in jwk
+    public = jwt.PyJWK(jwk).key
+    assert jwt.decode(token, public, algorithms=[alg])["sub"] == "a@b.com"
+
+
+def test_hs256_still_accepted_during_migration(rsa_pem):
+    signer = TokenSigner("s", algorithm="RS256", private_key=rsa_pem)
+    legacy = jwt.encode(_claims(), "s", algorithm="HS256")
+    assert signer.decode(legacy)["sub"] == "a@b.com"
+
+    strict = TokenSigner("s", "RS256", rsa_pem, accept_hs256=False)
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        strict.decode(legacy)
+
+
+def test_unknown_kid_rejected(rsa_pem):
+    signer = TokenSigner("s", algorithm="RS256", private_key=rsa_pem, key_id="k1")
+    other = jwt.encode(_claims(), rsa_pem, algorithm="RS256", headers={"kid": "k2"})
+    with pytest.raises(jwt.InvalidTokenError):
+        signer.decode(other)
+
+
+def test_login_issues_rs256_and_serves_jwks(monkeypatch, rsa_pem):
+    from fastapi.testclient import TestClient
+
+    import services.auth.app.api.main as mod
+    from stack.libs.shared.token_cache import TokenCache
+
+    class Repo:
+        def get_by_email(self, email):
+            from services.auth.domain.ports.users import UserRecord
+
+            return UserRecord(email, "u", "p", "s")
+
+        def verify_password(self, rec, password):
+            return password == rec.password_hash
+
+    monkeypatch.setattr(mod, "repo", lambda: Repo())
+    monkeypatch.setattr(mod, "_token_cache", TokenCache())
+    monkeypatch.setenv("JWT_ALGORITHM", "RS256")
+    monkeypatch.setenv("JWT_PRIVATE_KEY", rsa_pem)
+    monkeypatch.setenv("JWT_KEY_ID", "k1")
+    mod.provide_signer.reset()
+    client = TestClient(mod.app)
+
+    token = client.post("/login", json={"email": "a@b.com", "password": "p"}).json()[
+        "token"
+    ]
+    assert jwt.get_unverified_header(token) == {
+        "alg": "RS256",
+        "kid": "k1",
+        "typ": "JWT",
+    }
+    assert client.get("/verify", params={"token": token}).json()["valid"] is True
+
+    r = client.get("/.well-known/jwks.json")
+    assert r.headers["Cache-Control"] == "public, max-age=300"
+    assert [k["kid"] for k in r.json()["keys"]] == ["k1"]
+
+
+def test_signer_reads_key_file_once(monkeypatch, tmp_path, rsa_pem):
+    from services.auth.public.providers import provide_signer
+
+    path = tmp_path / "key.pem"
+    path.write_text(rsa_pem)
+    monkeypatch.delenv("JWT_PRIVATE_KEY", raising=False)
+    monkeypatch.setenv("JWT_ALGORITHM", "RS256")
+    monkeypatch.setenv("JWT_PRIVATE_KEY_FILE", str(path))
+    provide_signer.reset()
+    signer = provide_signer()
+    path.unlink()
+    assert provide_signer() is signer
+    assert signer.decode(signer.encode(_claims()))["sub"] == "a@b.com"
+    provide_signer.reset()
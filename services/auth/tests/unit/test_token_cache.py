@@ -0,0 +1,68 @@
+import time
+
+import jwt
+
+from stack.libs.shared.token_cache import TokenCache
+
+
+def test_hit_until_exp_then_miss(monkeypatch):
+    cache = TokenCache()
+    cache.bind("k")
+    now = time.time()
+    cache.put("t", {"sub": "a", "exp": now + 10})
+    assert cache.get("t") == {"sub": "a", "exp": now + 10}
+    monkeypatch.setattr(time, "time", lambda: now + 11)
+    assert cache.get("t") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 0}
+
+
+def test_lru_bound_and_no_exp_not_cached():
+    cache = TokenCache(capacity=2)
+    exp = time.time() + 60
+    for t in ("a", "b", "c"):
+        cache.put(t, {"exp": exp})
+    cache.put("forever", {"sub": "x"})
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    assert cache.get("forever") is None
+
+
+def test_rotation_clears():
+    cache = TokenCache()
+    cache.bind("old")
+    cache.put("t", {"exp": time.time() + 60})
+    cache.bind("old")
+    assert cache.get("t") is not None
+    cache.bind("new")
+    assert cache.get("t") is None
+
+
+def test_verify_decodes_once_per_token(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import services.auth.app.api.main as mod
+
+    monkeypatch.setenv("JWT_SECRET", "cache-secret")
+    mod.provide_signer.reset()
+    monkeypatch.setattr(mod, "_token_cache", TokenCache())
+    decodes = []
+    real_decode = jwt.decode
+
+    def counting_decode(*a, **kw):
+        decodes.append(1)
+        return real_decode(*a, **kw)
+
+    monkeypatch.setattr(mod.jwt, "decode", counting_decode)
+    token = jwt.encode(
+        {"sub": "a@b.com", "exp": int(time.time()) + 60}, "cache-secret", "HS256"
+    )
+    client = TestClient(mod.app)
+    for _ in range(3):
+        r = client.get("/verify", params={"token": token})
+        assert r.json()["sub"] == "a@b.com"
+    assert len(decodes) == 1
+    assert mod._token_cache.hits == 2
+
+    monkeypatch.setenv("JWT_SECRET", "rotated")
+    mod.provide_signer.reset()
+    assert client.get("/verify", params={"token": token}).status_code == 401
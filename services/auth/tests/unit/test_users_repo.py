@@ -0,0 +1,59 @@
+from services.auth.adapters.repositories import dynamodb_users
+from services.auth.adapters.repositories.dynamodb_users import DynamoUsers
+from services.auth.public import providers
+
+
+class FakeDynamo:
+    def __init__(self):
+        self.items: dict[str, dict] = {}
+        self.calls: dict[str, int] = {}
+
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def describe_table(self, TableName):
+        self._count("describe_table")
+        raise RuntimeError("ResourceNotFoundException")
+
+    def create_table(self, **kw):
+        self._count("create_table")
+
+    def get_item(self, TableName, Key):
+        self._count("get_item")
+        item = self.items.get(Key["pk"]["S"])
+        return {"Item": item} if item else {}
+
+    def put_item(self, TableName, Item, ConditionExpression=None):
+        self._count("put_item")
+        self.items[Item["pk"]["S"]] = Item
+
+
+def test_round_trip_with_plain_hasher():
+    users = DynamoUsers("t", ddb=FakeDynamo())
+    users.create_user("a@b.com", "u", "pw")
+    rec = users.get_by_email("a@b.com")
+    assert rec.username == "u"
+    assert users.verify_password(rec, "pw")
+    assert not users.verify_password(rec, "nope")
+    assert users.get_by_email("x@b.com") is None
+
+
+def test_provider_builds_and_provisions_once(monkeypatch):
+    ddb = FakeDynamo()
+    built = []
+
+    def fake_shared_client(name):
+        built.append(name)
+        return ddb
+
+    monkeypatch.setattr(dynamodb_users, "shared_client", fake_shared_client)
+    monkeypatch.setenv("LOCALSTACK", "1")
+    providers.provide_users.reset()
+    try:
+        first = providers.provide_users()
+        for _ in range(3):
+            assert providers.provide_users() is first
+        assert built == ["dynamodb"]
+        assert ddb.calls == {"describe_table": 1, "create_table": 1}
+    finally:
+        providers.provide_users.reset()
@@ -0,0 +1,81 @@
+import time
+from typing import Callable, Iterator, TypeVar
+
+from stack.libs.shared.logging import get_logger
+
+log = get_logger("web.batching")
+
+T = TypeVar("T")
+
+# Shared by SQS SendMessageBatch and EventBridge PutEvents
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 256 * 1024
+
+# key -> (error, retryable)
+Failures = dict[str, tuple[str, bool]]
+
+
+def chunk(
+    items: list[tuple[str, T]],
+    size: Callable[[T], int],
+    max_entries: int = MAX_BATCH_ENTRIES,
+    max_bytes: int = MAX_BATCH_BYTES,
+) -> Iterator[list[tuple[str, T]]]:
+    """Group keyed entries into requests under both the count and size caps."""
+    batch: list[tuple[str, T]] = []
+    total = 0
+    for key, entry in items:
+        n = size(entry)
+        if batch and (len(batch) >= max_entries or total + n > max_bytes):
+            yield batch
+            batch, total = [], 0
+        batch.append((key, entry))
+        total += n
+    if batch:
+        yield batch
+
+
+def send_in_batches(
+    entries: dict[str, T],
+    size: Callable[[T], int],
+    send: Callable[[list[tuple[str, T]]], Failures],
+    max_attempts: int = 3,
+    backoff_seconds: float = 0.05,
+    max_bytes: int = MAX_BATCH_BYTES,
+) -> dict[str, str]:
+    """Send every entry in batches, resending only the ones that failed.
+
+    ``send`` returns the failed keys of one request; retryable failures are
+    resent (with backoff) up to ``max_attempts`` times. Returns the final
+    error for each entry that never went through.
+    """
+    errors: dict[str, str] = {}
+    pending = []
+    for key, entry in entries.items():
+        if size(entry) > max_bytes:
+            errors[key] = f"entry exceeds {max_bytes} bytes"
+        else:
+            pending.append((key, entry))
+
+    for attempt in range(1, max_attempts + 1):
+        retry = []
+        for batch in chunk(pending, size, max_bytes=max_bytes):
+            try:
+                failed = send(batch)
+            except Exception as exc:  # noqa: BLE001 - whole request failed
+                failed = {key: (str(exc), True) for key, _ in batch}
+            for key, entry in batch:
+                if key not in failed:
+                    errors.pop(key, None)
+                    continue
+                error, retryable = failed[key]
+                errors[key] = error
+                if retryable:
+                    retry.append((key, entry))
+        if not retry:
+            break
+        pending = retry
+        if attempt < max_attempts:
+            log.warning("retrying %d failed batch entries", len(retry))
+            time.sleep(backoff_seconds * 2 ** (attempt - 1))
+    return errors
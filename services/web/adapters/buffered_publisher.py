@@ -0,0 +1,120 @@
+import threading
+import time
+import uuid
+from collections import deque
+
+from services.web.adapters.batching import MAX_BATCH_ENTRIES
+from services.web.domain.models.errors import QueueOverloaded
+from services.web.domain.ports.jobs import QueuePort
+from stack.libs.shared.logging import get_logger
+
+log = get_logger("web.buffered_publisher")
+
+
+class BufferedPublisher:
+    """Micro-batching front for a ``QueuePort``.
+
+    ``publish`` assigns the correlation id, buffers the job and returns at
+    once; a background thread sends buffered jobs through ``publish_many``
+    when a full batch is waiting or the oldest job has lingered for
+    ``linger`` seconds. At most ``max_pending`` jobs are held; beyond that
+    ``publish`` blocks for up to ``block_timeout`` and then raises
+    ``QueueOverloaded``. Jobs that fail to send after the batch retries
+    are logged and counted in ``failed``.
+    """
+
+    def __init__(
+        self,
+        inner: QueuePort,
+        linger: float = 0.005,
+        max_pending: int = 1000,
+        block_timeout: float = 1.0,
+    ):
+        self.inner = inner
+        self.linger = linger
+        self.max_pending = max_pending
+        self.block_timeout = block_timeout
+        self.failed = 0
+        self._pending: deque[tuple[str, str, dict, float]] = deque()
+        self._inflight = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="buffered-publisher", daemon=True
+        )
+        self._thread.start()
+
+    def publish(
+        self, job_type: str, params: dict, correlation_id: str | None = None
+    ) -> str:
+        cid = correlation_id or str(uuid.uuid4())
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("publisher is closed")
+            if not self._cond.wait_for(
+                lambda: len(self._pending) < self.max_pending, self.block_timeout
+            ):
+                raise QueueOverloaded(f"{self.max_pending} jobs already buffered")
+            self._pending.append((cid, job_type, params, time.monotonic()))
+            self._cond.notify_all()
+        return cid
+
+    def publish_many(
+        self, jobs: list[tuple[str, dict]], correlation_ids: list[str] | None = None
+    ) -> list[tuple[str, str | None]]:
+        # Already batched; bypass the buffer
+        return self.inner.publish_many(jobs, correlation_ids)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until everything buffered so far has been sent."""
+        with self._cond:
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._inflight, timeout
+            )
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                # Linger for a full batch unless shutting down
+                deadline = self._pending[0][3] + self.linger
+                while (
+                    len(self._pending) < MAX_BATCH_ENTRIES
+                    and not self._closed
+                    and (remaining := deadline - time.monotonic()) > 0
+                ):
+                    self._cond.wait(remaining)
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(len(self._pending), self.max_pending))
+                ]
+                self._inflight = len(batch)
+                self._cond.notify_all()
+            self._send(batch)
+            with self._cond:
+                self._inflight = 0
+                self._cond.notify_all()
+
+    def _send(self, batch: list[tuple[str, str, dict, float]]) -> None:
+        try:
+            results = self.inner.publish_many(
+                [(job_type, params) for _, job_type, params, _ in batch],
+                [cid for cid, *_ in batch],
+            )
+            errors = [(cid, err) for cid, err in results if err]
+        except Exception as exc:  # noqa: BLE001 - keep the sender alive
+            errors = [(cid, str(exc)) for cid, *_ in batch]
+        for cid, err in errors:
+            log.error("dropped job %s: %s", cid, err)
+        if errors:
+            with self._cond:
+                self.failed += len(errors)
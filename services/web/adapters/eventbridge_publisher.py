@@ -2,14 +2,15 @@ import json
 import os
 import uuid
 
-from stack.libs.shared.aws import client as aws_client
+from services.web.adapters.batching import Failures, send_in_batches
+from stack.libs.shared.aws import shared_client
 
 
 class EventBridgePublisher:
-    def __init__(self, bus_name: str, source: str = "services.web"):
+    def __init__(self, bus_name: str, source: str = "services.web", events=None):
         self.bus_name = bus_name
         self.source = source
-        self.events = aws_client("events")
+        self.events = events or shared_client("events")
 
     @classmethod
     def from_env(cls) -> "EventBridgePublisher":
@@ -18,17 +19,48 @@ class EventBridgePublisher:
             raise RuntimeError("EVENT_BUS_NAME not configured")
         return cls(bus_name=name)
 
-    def publish(self, job_type: str, params: dict) -> str:
-        cid = str(uuid.uuid4())
-        detail = {"job_type": job_type, "params": params, "correlation_id": cid}
-        self.events.put_events(
-            Entries=[
-                {
-                    "EventBusName": self.bus_name,
-                    "Source": self.source,
-                    "DetailType": "jobs.requested",
-                    "Detail": json.dumps(detail, default=str),
-                }
-            ]
-        )
+    def publish(
+        self, job_type: str, params: dict, correlation_id: str | None = None
+    ) -> str:
+        cid = correlation_id or str(uuid.uuid4())
+        self.events.put_events(Entries=[self._entry(cid, job_type, params)])
         return cid
+
+    def publish_many(
+        self, jobs: list[tuple[str, dict]], correlation_ids: list[str] | None = None
+    ) -> list[tuple[str, str | None]]:
+        """Publish with batched PutEvents; returns ``(correlation_id, error)``."""
+        cids = correlation_ids or [str(uuid.uuid4()) for _ in jobs]
+        entries = {
+            str(i): self._entry(cid, job_type, params)
+            for i, (cid, (job_type, params)) in enumerate(zip(cids, jobs))
+        }
+        errors = send_in_batches(entries, _entry_size, self._send_batch)
+        return [(cid, errors.get(str(i))) for i, cid in enumerate(cids)]
+
+    def _entry(self, cid: str, job_type: str, params: dict) -> dict:
+        detail = {"job_type": job_type, "params": params, "correlation_id": cid}
+        return {
+            "EventBusName": self.bus_name,
+            "Source": self.source,
+            "DetailType": "jobs.requested",
+            "Detail": json.dumps(detail, default=str),
+        }
+
+    def _send_batch(self, batch: list[tuple[str, dict]]) -> Failures:
+        resp = self.events.put_events(Entries=[entry for _, entry in batch])
+        if not resp.get("FailedEntryCount"):
+            return {}
+        # Result entries line up with the request entries
+        return {
+            key: (f"{out['ErrorCode']}: {out.get('ErrorMessage', '')}", True)
+            for (key, _), out in zip(batch, resp["Entries"])
+            if out.get("ErrorCode")
+        }
+
+
+def _entry_size(entry: dict) -> int:
+    # PutEvents counts Source, DetailType and Detail toward the request size
+    return sum(
+        len(entry[k].encode("utf-8")) for k in ("Source", "DetailType", "Detail")
+    )
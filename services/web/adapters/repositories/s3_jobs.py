@@ -1,35 +1,72 @@
 import json
 import os
+import threading
+from collections import OrderedDict
 
-from stack.libs.shared.aws import client as aws_client
-from stack.libs.shared.aws import ensure_bucket
+from stack.libs.shared.aws import ensure_bucket, shared_client
+from stack.libs.shared.job_index import DynamoJobIndex
 
 
 class S3JobRepository:
-    def __init__(self, bucket: str, prefix: str = "results/"):
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "results/",
+        s3=None,
+        index: DynamoJobIndex | None = None,
+        etag_cache_size: int = 1024,
+    ):
         self.bucket = bucket
         self.prefix = prefix
-        self.s3 = aws_client("s3")
+        self.s3 = s3 or shared_client("s3")
+        # Optional catalog updated on every transition
+        self.index = index
+        # cid -> (ETag, parsed status) of the last full read, for IfNoneMatch
+        self.etag_cache_size = etag_cache_size
+        self._etags: OrderedDict[str, tuple[str, dict]] = OrderedDict()
+        self._etags_lock = threading.Lock()
 
     @classmethod
-    def from_env(cls) -> "S3JobRepository":
+    def from_env(cls, index: DynamoJobIndex | None = None) -> "S3JobRepository":
         bucket = os.getenv("STATUS_BUCKET") or os.getenv("BUCKET_NAME") or "web-status"
         if os.getenv("LOCALSTACK", "").lower() in ("1", "true", "yes", "on"):
-            ensure_bucket(aws_client("s3"), bucket_name=bucket)
-        return cls(bucket=bucket)
+            ensure_bucket(shared_client("s3"), bucket_name=bucket)
+        return cls(bucket=bucket, index=index)
 
     def _key(self, cid: str) -> str:
         return f"{self.prefix}{cid}.json"
 
     def get_status(self, correlation_id: str) -> dict | None:
+        with self._etags_lock:
+            known = self._etags.get(correlation_id)
+        kw = {"IfNoneMatch": known[0]} if known else {}
         try:
-            obj = self.s3.get_object(Bucket=self.bucket, Key=self._key(correlation_id))
-            body = obj["Body"].read().decode("utf-8")
-            return json.loads(body)
+            obj = self.s3.get_object(
+                Bucket=self.bucket, Key=self._key(correlation_id), **kw
+            )
         except self.s3.exceptions.NoSuchKey:  # type: ignore[attr-defined]
+            self._forget(correlation_id)
             return None
-        except Exception:
+        except Exception as exc:
+            if known and _http_status(exc) == 304:
+                # Unchanged since the last read: skip the body and the parse
+                with self._etags_lock:
+                    if correlation_id in self._etags:
+                        self._etags.move_to_end(correlation_id)
+                return known[1]
             return None
+        status = json.loads(obj["Body"].read().decode("utf-8"))
+        if self.etag_cache_size > 0 and obj.get("ETag"):
+            with self._etags_lock:
+                self._etags[correlation_id] = (obj["ETag"], status)
+                self._etags.move_to_end(correlation_id)
+                while len(self._etags) > self.etag_cache_size:
+                    self._etags.popitem(last=False)
+        return status
+
+    def _forget(self, correlation_id: str) -> None:
+        with self._etags_lock:
+            self._etags.pop(correlation_id, None)
 
     def mark_running(self, correlation_id: str) -> None:
         self.s3.put_object(
@@ -39,6 +76,9 @@ class S3JobRepository:
                 "utf-8"
             ),
         )
+        self._forget(correlation_id)
+        if self.index is not None:
+            self.index.record(correlation_id, "running")
 
     def mark_completed(self, correlation_id: str, result: dict) -> None:
         out = {"id": correlation_id, "status": "completed", "result": result}
@@ -47,6 +87,9 @@ class S3JobRepository:
             Key=self._key(correlation_id),
             Body=json.dumps(out).encode("utf-8"),
         )
+        self._forget(correlation_id)
+        if self.index is not None:
+            self.index.record(correlation_id, "completed")
 
     def mark_failed(self, correlation_id: str, error: str) -> None:
         out = {"id": correlation_id, "status": "failed", "error": error}
@@ -55,6 +98,9 @@ class S3JobRepository:
             Key=self._key(correlation_id),
             Body=json.dumps(out).encode("utf-8"),
         )
+        self._forget(correlation_id)
+        if self.index is not None:
+            self.index.record(correlation_id, "failed", error=error)
 
     def mark_canceled(self, correlation_id: str) -> None:
         # Write a cancel sentinel and update status
@@ -67,3 +113,11 @@ class S3JobRepository:
             Key=self._key(correlation_id),
             Body=json.dumps(out).encode("utf-8"),
         )
+        self._forget(correlation_id)
+        if self.index is not None:
+            self.index.record(correlation_id, "canceled")
+
+
+def _http_status(exc: Exception) -> int | None:
+    resp = getattr(exc, "response", None) or {}
+    return resp.get("ResponseMetadata", {}).get("HTTPStatusCode")
@@ -2,14 +2,14 @@ import json
 import os
 import uuid
 
-from stack.libs.shared.aws import client as aws_client
-from stack.libs.shared.aws import ensure_queue
+from services.web.adapters.batching import Failures, send_in_batches
+from stack.libs.shared.aws import ensure_queue, shared_client
 
 
 class SqsQueue:
-    def __init__(self, queue_url: str):
+    def __init__(self, queue_url: str, sqs=None):
         self.queue_url = queue_url
-        self.sqs = aws_client("sqs")
+        self.sqs = sqs or shared_client("sqs")
 
     @classmethod
     def from_env(cls) -> "SqsQueue":
@@ -21,22 +21,67 @@ class SqsQueue:
             "on",
         ):
             name = os.getenv("QUEUE_NAME", "web-queue")
-            qurl = ensure_queue(aws_client("sqs"), queue_name=name)
+            qurl = ensure_queue(shared_client("sqs"), queue_name=name)
         if not qurl:
             raise RuntimeError("QUEUE_URL not configured")
         return cls(queue_url=qurl)
 
-    def publish(self, job_type: str, params: dict) -> str:
-        cid = str(uuid.uuid4())
+    def publish(
+        self, job_type: str, params: dict, correlation_id: str | None = None
+    ) -> str:
+        cid = correlation_id or str(uuid.uuid4())
         self.sqs.send_message(
             QueueUrl=self.queue_url,
             MessageBody=job_type,
-            MessageAttributes={
-                "correlation_id": {"StringValue": cid, "DataType": "String"},
-                "params": {
-                    "StringValue": json.dumps(params, default=str),
-                    "DataType": "String",
-                },
-            },
+            MessageAttributes=_attributes(cid, params),
         )
         return cid
+
+    def publish_many(
+        self, jobs: list[tuple[str, dict]], correlation_ids: list[str] | None = None
+    ) -> list[tuple[str, str | None]]:
+        """Publish with SendMessageBatch; returns ``(correlation_id, error)``."""
+        cids = correlation_ids or [str(uuid.uuid4()) for _ in jobs]
+        entries = {
+            str(i): {
+                "Id": str(i),
+                "MessageBody": job_type,
+                "MessageAttributes": _attributes(cid, params),
+            }
+            for i, (cid, (job_type, params)) in enumerate(zip(cids, jobs))
+        }
+        errors = send_in_batches(entries, _entry_size, self._send_batch)
+        return [(cid, errors.get(str(i))) for i, cid in enumerate(cids)]
+
+    def _send_batch(self, batch: list[tuple[str, dict]]) -> Failures:
+        resp = self.sqs.send_message_batch(
+            QueueUrl=self.queue_url, Entries=[entry for _, entry in batch]
+        )
+        # Sender faults (bad input) will fail again; the rest are retryable
+        return {
+            f["Id"]: (
+                f"{f.get('Code')}: {f.get('Message', '')}",
+                not f.get("SenderFault"),
+            )
+            for f in resp.get("Failed", [])
+        }
+
+
+def _attributes(cid: str, params: dict) -> dict:
+    return {
+        "correlation_id": {"StringValue": cid, "DataType": "String"},
+        "params": {
+            "StringValue": json.dumps(params, default=str),
+            "DataType": "String",
+        },
+    }
+
+
+def _entry_size(entry: dict) -> int:
+    # SQS counts the body plus each attribute's name, type and value
+    n = len(entry["MessageBody"].encode("utf-8"))
+    for name, attr in entry["MessageAttributes"].items():
+        n += (
+            len(name) + len(attr["DataType"]) + len(attr["StringValue"].encode("utf-8"))
+        )
+    return n
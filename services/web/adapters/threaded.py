@@ -0,0 +1,83 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from services.web.domain.ports.jobs import JobIndex, JobRepository, QueuePort
+from stack.libs.shared.aio import run_blocking
+
+
+class ThreadedQueue:
+    """Async ``QueuePort`` that runs a blocking queue on a bounded executor."""
+
+    def __init__(self, queue: QueuePort, executor: ThreadPoolExecutor | None = None):
+        self.queue = queue
+        self.executor = executor
+
+    async def publish(
+        self, job_type: str, params: dict, correlation_id: str | None = None
+    ) -> str:
+        if correlation_id is None:
+            return await run_blocking(
+                self.queue.publish, job_type, params, executor=self.executor
+            )
+        return await run_blocking(
+            functools.partial(self.queue.publish, correlation_id=correlation_id),
+            job_type,
+            params,
+            executor=self.executor,
+        )
+
+    async def publish_many(
+        self, jobs: list[tuple[str, dict]], correlation_ids: list[str] | None = None
+    ) -> list[tuple[str, str | None]]:
+        return await run_blocking(
+            self.queue.publish_many, jobs, correlation_ids, executor=self.executor
+        )
+
+
+class ThreadedJobRepository:
+    """Async ``JobRepository`` over a blocking one, for the API read path."""
+
+    def __init__(self, repo: JobRepository, executor: ThreadPoolExecutor | None = None):
+        self.repo = repo
+        self.executor = executor
+
+    async def get_status(self, correlation_id: str) -> dict | None:
+        return await run_blocking(
+            self.repo.get_status, correlation_id, executor=self.executor
+        )
+
+    async def mark_canceled(self, correlation_id: str) -> None:
+        await run_blocking(
+            self.repo.mark_canceled, correlation_id, executor=self.executor
+        )
+
+
+class ThreadedJobIndex:
+    """Async ``JobIndex`` over a blocking one."""
+
+    def __init__(self, index: JobIndex, executor: ThreadPoolExecutor | None = None):
+        self.index = index
+        self.executor = executor
+
+    async def record_many(self, jobs: list[tuple[str, str, str | None]]) -> None:
+        await run_blocking(self.index.record_many, jobs, executor=self.executor)
+
+    async def query(
+        self,
+        status: str | None = None,
+        job_type: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        return await run_blocking(
+            self.index.query,
+            status,
+            job_type,
+            since,
+            until,
+            limit,
+            cursor,
+            executor=self.executor,
+        )
@@ -1,9 +1,55 @@
-from fastapi import FastAPI, Form, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse
+import hashlib
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-from services.web.domain.models.request import ScheduleRequest
-from services.web.domain.services.jobs import cancel_job, get_job_status, schedule_job
-from services.web.public.providers import provide_job_repo, provide_queue
+from fastapi import FastAPI, Form, HTTPException, Query, Request
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
+
+from services.web.domain.models.errors import QueueOverloaded
+from services.web.domain.models.request import (
+    BatchScheduleRequest,
+    ScheduleRequest,
+    StatusBatchRequest,
+)
+from services.web.domain.ports.jobs import (
+    AsyncJobIndex,
+    AsyncJobRepository,
+    AsyncQueuePort,
+)
+from services.web.domain.services.jobs import (
+    cancel_job_async,
+    get_job_status_async,
+    get_job_statuses_async,
+    list_jobs_async,
+    schedule_job_async,
+    schedule_jobs_async,
+)
+from services.web.domain.services.status_cache import StatusCache
+from services.web.domain.services.status_watch import StatusWatcher, is_terminal
+from services.web.public.providers import (
+    provide_async_job_index,
+    provide_async_job_repo,
+    provide_async_queue,
+    provide_job_index,
+    provide_job_repo,
+    provide_queue,
+    provide_token_verifier,
+)
+from stack.libs.shared.aio import run_blocking
+from stack.libs.shared.jwt_auth import JwtAuthMiddleware, JwtVerifier
+from stack.libs.shared.jwt_auth import login as auth_login
+from stack.libs.shared.logging import get_logger
+
+log = get_logger("web.api")
 
 
 def _provide_queue():
@@ -14,21 +60,188 @@ def _provide_repo():
     return provide_job_repo()
 
 
-app = FastAPI(title="web", version="0.1.0")
+def _provide_index():
+    return provide_job_index()
+
+
+def _token_verifier() -> JwtVerifier | None:
+    return provide_token_verifier()
+
+
+def _auth_disabled() -> bool:
+    return os.getenv("AUTH_DISABLED", "").lower() in ("1", "true", "yes", "on")
+
+
+def _auth_login_url() -> str | None:
+    return os.getenv("AUTH_LOGIN_URL")
+
+
+def _async_index() -> AsyncJobIndex | None:
+    index = _provide_index()
+    return provide_async_job_index(index) if index is not None else None
+
+
+def _async_queue() -> AsyncQueuePort:
+    return provide_async_queue(_provide_queue())
+
+
+def _async_repo() -> AsyncJobRepository:
+    return provide_async_job_repo(_provide_repo())
+
+
+# Shared across requests; terminal statuses stay cached until evicted
+_status_cache = StatusCache(
+    capacity=int(os.getenv("STATUS_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("STATUS_CACHE_TTL_SECONDS", "2")),
+)
+
+# Bounds concurrent store reads per batch status lookup
+STATUS_LOOKUP_CONCURRENCY = int(os.getenv("STATUS_LOOKUP_CONCURRENCY", "16"))
+
+# Longest a single long-poll or SSE stream is held open
+MAX_WAIT_SECONDS = 30.0
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+def _fetch_status(correlation_id: str) -> dict | None:
+    # Poller reads go straight to the store and refresh the cache for others
+    st = _provide_repo().get_status(correlation_id)
+    _status_cache.put(correlation_id, st)
+    return st
+
+
+_status_watcher = StatusWatcher(
+    _fetch_status,
+    min_interval=float(os.getenv("STATUS_POLL_MIN_SECONDS", "0.5")),
+    max_interval=float(os.getenv("STATUS_POLL_MAX_SECONDS", "5")),
+)
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Build the shared clients (and run any LocalStack bootstrap) before the
+    # first request rather than inside it.
+    ready = []
+    for provide in (provide_queue, provide_job_repo):
+        try:
+            ready.append(await run_blocking(provide))
+        except Exception as exc:
+            log.warning("%s not ready at startup: %s", provide.__name__, exc)
+    verifier = _token_verifier()
+    if verifier is not None:
+        # First JWKS fetch happens here; afterwards keys refresh in the background
+        await run_blocking(verifier.start)
+        ready.append(verifier)
+    yield
+    _status_watcher.close()
+    for resource in ready:
+        # Buffered publishers send whatever is still queued
+        close = getattr(resource, "close", None)
+        if close is not None:
+            await run_blocking(close)
+
+
+app = FastAPI(title="web", version="0.1.0", lifespan=_lifespan)
+# Browser sessions keep the token in this cookie (set by POST /login)
+SESSION_COOKIE = "session"
+
+# /admin requires a bearer token or a session; without AUTH_JWKS_URL it
+# answers 503 unless AUTH_DISABLED is set for local development
+app.add_middleware(
+    JwtAuthMiddleware,
+    get_verifier=lambda: _token_verifier(),
+    prefixes=("/admin",),
+    allow_anonymous=lambda: _auth_disabled(),
+    cookie=SESSION_COOKIE,
+    login_url="/login",
+)
+
+
+@app.exception_handler(QueueOverloaded)
+async def _queue_overloaded(_request: Request, exc: QueueOverloaded) -> JSONResponse:
+    return JSONResponse(
+        {"detail": str(exc)}, status_code=503, headers={"Retry-After": "1"}
+    )
 
 
 @app.get("/", response_class=HTMLResponse)
-def index() -> str:
+async def index() -> str:
     return '<meta http-equiv="refresh" content="0; url=/admin" />'
 
 
 @app.get("/healthz")
-def healthz() -> dict[str, str]:
+async def healthz() -> dict[str, str]:
     return {"status": "ok"}
 
 
+def _login_page(error: str = "") -> str:
+    parts = [
+        "<html><head><title>Sign in</title>",
+        "<style>",
+        "body{font-family:sans-serif;max-width:720px;margin:2rem auto}",
+        "label{display:block;margin:.5rem 0}",
+        "</style>",
+        "</head><body>",
+        "  <h1>Sign in</h1>",
+        f"  <p><b>{_html_escape(error)}</b></p>" if error else "",
+        '  <form method=post action="/login">',
+        "    <label>Email <input name=email type=email /></label>",
+        "    <label>Password <input name=password type=password /></label>",
+        "    <button type=submit>Sign in</button>",
+        "  </form>",
+        "</body></html>",
+    ]
+    return "\n".join(parts)
+
+
+@app.get("/login", response_class=HTMLResponse)
+async def login_page() -> str:
+    return _login_page()
+
+
+@app.post("/login")
+async def login(
+    request: Request, email: str = Form(...), password: str = Form(...)
+) -> Response:
+    """Exchange credentials with the auth service for a session cookie."""
+    url = _auth_login_url()
+    if not url:
+        raise HTTPException(503, "login not configured")
+    try:
+        token = await run_blocking(auth_login, url, email, password)
+    except OSError as exc:
+        log.warning("auth login failed: %s", exc)
+        raise HTTPException(503, "auth service unavailable")
+    if token is None:
+        return HTMLResponse(_login_page("Invalid email or password"), status_code=401)
+    resp = RedirectResponse(url="/admin", status_code=303)
+    resp.set_cookie(
+        SESSION_COOKIE,
+        token,
+        path="/admin",
+        httponly=True,
+        samesite="strict",
+        secure=request.url.scheme == "https",
+    )
+    return resp
+
+
+@app.post("/admin/logout")
+async def logout() -> RedirectResponse:
+    resp = RedirectResponse(url="/login", status_code=303)
+    resp.delete_cookie(SESSION_COOKIE, path="/admin")
+    return resp
+
+
+def _csrf_query(request: Request) -> str:
+    # Set by JwtAuthMiddleware; session-cookie form posts must echo it
+    csrf = getattr(request.state, "csrf", None)
+    return f"?csrf={csrf}" if csrf else ""
+
+
 @app.get("/admin", response_class=HTMLResponse)
-def admin_home() -> str:
+async def admin_home(request: Request) -> str:
+    csrf = _csrf_query(request)
     parts = [
         "<html><head><title>Admin</title>",
         "<style>",
@@ -37,46 +250,169 @@ def admin_home() -> str:
         "</style>",
         "</head><body>",
         "  <h1>Schedule Job</h1>",
-        '  <form method=post action="/admin/jobs">',
+        f'  <form method=post action="/admin/jobs{csrf}">',
         '    <label>Job Type <input name=job_type value="content.generate" /></label>',
         '    <label>Title <input name=title placeholder="Post title" /></label>',
         '    <label>Topic <input name=topic placeholder="Topic" /></label>',
         "    <button type=submit>Schedule</button>",
         "  </form>",
+        (
+            f'  <form method=post action="/admin/logout{csrf}">'
+            "<button>Sign out</button></form>"
+            if csrf
+            else ""
+        ),
         "</body></html>",
     ]
     return "\n".join(parts)
 
 
 @app.post("/admin/jobs")
-def schedule_job_form(
+async def schedule_job_form(
     job_type: str = Form(...), title: str = Form(""), topic: str = Form("")
 ) -> RedirectResponse:
     payload = {"title": title, "topic": topic}
-    job = schedule_job(
-        _provide_queue(), ScheduleRequest(job_type=job_type, params=payload)
+    job = await schedule_job_async(
+        _async_queue(),
+        ScheduleRequest(job_type=job_type, params=payload),
+        _async_index(),
     )
     return RedirectResponse(url=f"/admin/jobs/{job['id']}/view", status_code=303)
 
 
 @app.post("/admin/schedule")
-def schedule(req: ScheduleRequest) -> dict[str, str]:
-    out = schedule_job(_provide_queue(), req)
+async def schedule(req: ScheduleRequest) -> dict[str, str]:
+    out = await schedule_job_async(_async_queue(), req, _async_index())
     return out
 
 
+@app.post("/admin/schedule/batch")
+async def schedule_batch(req: BatchScheduleRequest) -> dict:
+    results = await schedule_jobs_async(_async_queue(), req.jobs, _async_index())
+    return {
+        "results": results,
+        "failed": sum(1 for r in results if "error" in r),
+    }
+
+
+@app.get("/admin/jobs")
+async def list_jobs(
+    status: str | None = None,
+    job_type: str | None = None,
+    since: float | None = Query(None, description="updated_at >= (epoch seconds)"),
+    until: float | None = Query(None, description="updated_at <= (epoch seconds)"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+) -> dict:
+    """Page through the job index, newest first."""
+    index = _async_index()
+    if index is None:
+        raise HTTPException(503, "job index not configured")
+    try:
+        return await list_jobs_async(
+            index, status, job_type, since, until, limit, cursor
+        )
+    except ValueError:
+        # Undecodable cursor
+        raise HTTPException(400, "invalid cursor")
+
+
 @app.get("/admin/jobs/{correlation_id}")
-def job_status(correlation_id: str) -> dict:
-    repo = _provide_repo()
-    st = get_job_status(repo, correlation_id)
+async def job_status(correlation_id: str, request: Request) -> Response:
+    st = await _load_status(correlation_id)
+    etag = _etag(st)
+    # Pollers that already have this version get an empty 304
+    tags = _if_none_match(request)
+    if etag in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": etag})
+    return JSONResponse(st, headers={"ETag": etag})
+
+
+async def _load_status(correlation_id: str) -> dict:
+    st = await get_job_status_async(_async_repo(), correlation_id, _status_cache)
     if st is None:
         raise HTTPException(404, "pending")
     return st
 
 
+def _etag(st: dict) -> str:
+    body = json.dumps(st, sort_keys=True, separators=(",", ":"), default=str)
+    return '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def _if_none_match(request: Request) -> set[str]:
+    header = request.headers.get("if-none-match", "")
+    # Weak comparison, as RFC 9110 specifies for If-None-Match
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+@app.post("/admin/jobs/status")
+async def job_statuses(req: StatusBatchRequest) -> dict:
+    statuses = await get_job_statuses_async(
+        _async_repo(), req.ids, _status_cache, STATUS_LOOKUP_CONCURRENCY
+    )
+    return {
+        "statuses": statuses,
+        "missing": [cid for cid, st in statuses.items() if st is None],
+    }
+
+
+@app.get("/admin/jobs/{correlation_id}/wait")
+async def wait_job_status(
+    correlation_id: str, since: str | None = None, timeout: float = 20.0
+) -> dict:
+    """Long-poll: return once the status differs from ``since``."""
+    st = await _status_watcher.wait_async(
+        correlation_id,
+        lambda cur: _status_name(cur) != since,
+        min(max(timeout, 0.0), MAX_WAIT_SECONDS),
+    )
+    if st is None:
+        raise HTTPException(404, "pending")
+    return st
+
+
+@app.get("/admin/jobs/{correlation_id}/events")
+async def job_events(correlation_id: str) -> StreamingResponse:
+    """Server-Sent Events stream of status transitions, ending at a terminal one."""
+    return StreamingResponse(
+        _status_events(correlation_id, MAX_WAIT_SECONDS * 10),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+async def _status_events(correlation_id: str, max_seconds: float) -> AsyncIterator[str]:
+    deadline = time.monotonic() + max_seconds
+    last: dict | None = None
+    sent = False
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        st = await _status_watcher.wait_async(
+            correlation_id,
+            lambda cur: not sent or cur != last,
+            min(remaining, SSE_KEEPALIVE_SECONDS),
+        )
+        if sent and st == last:
+            yield ": keep-alive\n\n"
+            continue
+        last, sent = st, True
+        if st is not None:
+            yield f"event: status\ndata: {_json_dumps(st)}\n\n"
+        if is_terminal(st):
+            return
+
+
+def _status_name(st: dict | None) -> str:
+    return (st or {}).get("status", "pending")
+
+
 @app.get("/admin/jobs/{correlation_id}/view", response_class=HTMLResponse)
-def view_job(correlation_id: str) -> str:
-    j = job_status(correlation_id)
+async def view_job(correlation_id: str, request: Request) -> str:
+    j = await _load_status(correlation_id)
+    csrf = _csrf_query(request)
     status = j.get("status", "pending")
     disabled = "disabled" if status in ["completed", "failed", "canceled"] else ""
     parts = [
@@ -87,7 +423,7 @@ def view_job(correlation_id: str) -> str:
         "</head><body>",
         f"  <h1>Job {correlation_id}</h1>",
         f"  <p>Status: <b>{status}</b></p>",
-        f'  <form method=post action="/admin/jobs/{correlation_id}/cancel" style="display:inline">',
+        f'  <form method=post action="/admin/jobs/{correlation_id}/cancel{csrf}" style="display:inline">',
         f"    <button {disabled}>Cancel</button>",
         "  </form>",
         f'  <form method=get action="/admin/jobs/{correlation_id}/view" style="display:inline;margin-left:1rem">',
@@ -95,14 +431,23 @@ def view_job(correlation_id: str) -> str:
         "  </form>",
         f"  <pre>{_html_escape(_json_dumps(j))}</pre>",
         '  <p><a href="/admin">Back</a></p>',
+        # Reload on the next transition instead of polling
+        (
+            "  <script>new EventSource("
+            f"'/admin/jobs/{correlation_id}/events').addEventListener("
+            "'status',e=>{if(JSON.parse(e.data).status!=="
+            f"'{status}')location.reload()}})</script>"
+            if not disabled
+            else ""
+        ),
         "</body></html>",
     ]
     return "\n".join(parts)
 
 
 @app.post("/admin/jobs/{correlation_id}/cancel")
-def cancel(correlation_id: str) -> RedirectResponse:
-    cancel_job(_provide_repo(), correlation_id)
+async def cancel(correlation_id: str) -> RedirectResponse:
+    await cancel_job_async(_async_repo(), correlation_id, _status_cache)
     return RedirectResponse(url=f"/admin/jobs/{correlation_id}/view", status_code=303)
 
 
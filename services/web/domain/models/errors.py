@@ -0,0 +1,2 @@
+class QueueOverloaded(RuntimeError):
+    """The publisher cannot accept more jobs right now; retry shortly."""
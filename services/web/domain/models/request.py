@@ -1,6 +1,14 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ScheduleRequest(BaseModel):
     job_type: str
     params: dict
+
+
+class BatchScheduleRequest(BaseModel):
+    jobs: list[ScheduleRequest] = Field(min_length=1, max_length=10_000)
+
+
+class StatusBatchRequest(BaseModel):
+    ids: list[str] = Field(min_length=1, max_length=1000)
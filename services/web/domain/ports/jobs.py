@@ -2,8 +2,16 @@ from typing import Protocol
 
 
 class QueuePort(Protocol):
-    def publish(self, job_type: str, params: dict) -> str:  # returns correlation id
-        ...
+    # Returns the correlation id; one is generated unless supplied
+    def publish(
+        self, job_type: str, params: dict, correlation_id: str | None = None
+    ) -> str: ...
+
+    # One (correlation id, error or None) per job, in order; ids are
+    # generated unless supplied
+    def publish_many(
+        self, jobs: list[tuple[str, dict]], correlation_ids: list[str] | None = None
+    ) -> list[tuple[str, str | None]]: ...
 
 
 class JobRepository(Protocol):
@@ -16,3 +24,49 @@ class JobRepository(Protocol):
     def mark_failed(self, correlation_id: str, error: str) -> None: ...
 
     def mark_canceled(self, correlation_id: str) -> None: ...
+
+
+class JobIndex(Protocol):
+    # New (correlation id, status, job type) entries; unconditional puts, so
+    # callers write them before the job can reach a worker
+    def record_many(self, jobs: list[tuple[str, str, str | None]]) -> None: ...
+
+    def query(
+        self,
+        status: str | None = None,
+        job_type: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[dict], str | None]: ...
+
+
+class AsyncQueuePort(Protocol):
+    async def publish(
+        self, job_type: str, params: dict, correlation_id: str | None = None
+    ) -> str: ...
+
+    async def publish_many(
+        self, jobs: list[tuple[str, dict]], correlation_ids: list[str] | None = None
+    ) -> list[tuple[str, str | None]]: ...
+
+
+class AsyncJobRepository(Protocol):
+    async def get_status(self, correlation_id: str) -> dict | None: ...
+
+    async def mark_canceled(self, correlation_id: str) -> None: ...
+
+
+class AsyncJobIndex(Protocol):
+    async def record_many(self, jobs: list[tuple[str, str, str | None]]) -> None: ...
+
+    async def query(
+        self,
+        status: str | None = None,
+        job_type: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[dict], str | None]: ...
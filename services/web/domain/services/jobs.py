@@ -1,15 +1,125 @@
+import asyncio
+import uuid
+
 from services.web.domain.models.request import ScheduleRequest
-from services.web.domain.ports.jobs import JobRepository, QueuePort
+from services.web.domain.ports.jobs import (
+    AsyncJobIndex,
+    AsyncJobRepository,
+    AsyncQueuePort,
+)
+from services.web.domain.services.status_cache import StatusCache
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
 
+def _failed(
+    reqs: list[ScheduleRequest], results: list[tuple[str, str | None]]
+) -> list[tuple[str, str, str | None]]:
+    return [
+        (cid, "failed", r.job_type)
+        for r, (cid, error) in zip(reqs, results)
+        if error is not None
+    ]
 
-def schedule_job(queue: QueuePort, req: ScheduleRequest) -> dict[str, str]:
-    cid = queue.publish(req.job_type, req.params)
+
+def _scheduled(cid: str, error: str | None) -> dict:
+    return {"id": cid} if error is None else {"id": cid, "error": error}
+
+
+async def schedule_job_async(
+    queue: AsyncQueuePort, req: ScheduleRequest, index: AsyncJobIndex | None = None
+) -> dict[str, str]:
+    if index is None:
+        return {"id": await queue.publish(req.job_type, req.params)}
+    cid = _new_id()
+    await index.record_many([(cid, "queued", req.job_type)])
+    try:
+        await queue.publish(req.job_type, req.params, correlation_id=cid)
+    except Exception:
+        await index.record_many([(cid, "failed", req.job_type)])
+        raise
     return {"id": cid}
 
 
-def get_job_status(repo: JobRepository, correlation_id: str) -> dict | None:
-    return repo.get_status(correlation_id)
+async def schedule_jobs_async(
+    queue: AsyncQueuePort,
+    reqs: list[ScheduleRequest],
+    index: AsyncJobIndex | None = None,
+) -> list[dict]:
+    jobs = [(r.job_type, r.params) for r in reqs]
+    if index is None:
+        results = await queue.publish_many(jobs)
+    else:
+        cids = [_new_id() for _ in reqs]
+        await index.record_many(
+            [(cid, "queued", r.job_type) for cid, r in zip(cids, reqs)]
+        )
+        results = await queue.publish_many(jobs, cids)
+        failed = _failed(reqs, results)
+        if failed:
+            await index.record_many(failed)
+    return [_scheduled(cid, error) for cid, error in results]
+
+
+async def get_job_status_async(
+    repo: AsyncJobRepository, correlation_id: str, cache: StatusCache | None = None
+) -> dict | None:
+    if cache is not None:
+        hit, status = cache.get(correlation_id)
+        if hit:
+            return status
+    status = await repo.get_status(correlation_id)
+    if cache is not None:
+        cache.put(correlation_id, status)
+    return status
+
+
+async def get_job_statuses_async(
+    repo: AsyncJobRepository,
+    correlation_ids: list[str],
+    cache: StatusCache | None = None,
+    concurrency: int = 16,
+) -> dict[str, dict | None]:
+    """Look up many statuses at once; ids with no status map to ``None``.
+
+    Cache hits are answered inline; at most ``concurrency`` store reads are
+    in flight at a time.
+    """
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one(cid: str) -> dict | None:
+        async with limit:
+            return await get_job_status_async(repo, cid, cache)
+
+    ids = list(dict.fromkeys(correlation_ids))
+    return dict(zip(ids, await asyncio.gather(*(one(cid) for cid in ids))))
+
+
+async def cancel_job_async(
+    repo: AsyncJobRepository, correlation_id: str, cache: StatusCache | None = None
+) -> None:
+    await repo.mark_canceled(correlation_id)
+    if cache is not None:
+        cache.invalidate(correlation_id)
 
 
-def cancel_job(repo: JobRepository, correlation_id: str) -> None:
-    repo.mark_canceled(correlation_id)
+async def list_jobs_async(
+    index: AsyncJobIndex,
+    status: str | None = None,
+    job_type: str | None = None,
+    since: float | None = None,
+    until: float | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
+) -> dict:
+    jobs, nxt = await index.query(
+        status=status,
+        job_type=job_type,
+        since=since,
+        until=until,
+        limit=limit,
+        cursor=cursor,
+    )
+    return {"jobs": jobs, "next": nxt}
@@ -0,0 +1,54 @@
+import threading
+import time
+from collections import OrderedDict
+
+TERMINAL_STATUSES = frozenset({"completed", "failed", "canceled"})
+
+
+class StatusCache:
+    """Bounded LRU of job statuses read from the repository.
+
+    Terminal statuses never change, so they stay until evicted by size.
+    Anything else (including "not found yet") expires after ``ttl`` seconds.
+    """
+
+    def __init__(self, capacity: int = 1024, ttl: float = 2.0):
+        self.capacity = capacity
+        self.ttl = ttl
+        # cid -> (status, expires_at); expires_at is None for pinned entries
+        self._entries: OrderedDict[str, tuple[dict | None, float | None]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, correlation_id: str) -> tuple[bool, dict | None]:
+        """Return ``(hit, status)``; a hit may carry a cached ``None``."""
+        with self._lock:
+            entry = self._entries.get(correlation_id)
+            if entry is None:
+                return False, None
+            status, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[correlation_id]
+                return False, None
+            self._entries.move_to_end(correlation_id)
+            return True, status
+
+    def put(self, correlation_id: str, status: dict | None) -> None:
+        if self.capacity <= 0:
+            return
+        terminal = bool(status) and status.get("status") in TERMINAL_STATUSES
+        expires_at = None if terminal else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[correlation_id] = (status, expires_at)
+            self._entries.move_to_end(correlation_id)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, correlation_id: str) -> None:
+        with self._lock:
+            self._entries.pop(correlation_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
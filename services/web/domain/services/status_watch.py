@@ -0,0 +1,222 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from services.web.domain.services.status_cache import TERMINAL_STATUSES
+from stack.libs.shared.logging import get_logger
+
+log = get_logger("web.status_watch")
+
+
+def is_terminal(status: dict | None) -> bool:
+    return bool(status) and status.get("status") in TERMINAL_STATUSES
+
+
+class _Watch:
+    def __init__(self) -> None:
+        self.status: dict | None = None
+        self.fetched = False
+        self.done = False
+        self.subscribers = 0
+        self.interval = 0.0
+        # asyncio waiters, woken from the fetch threads
+        self.events: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    def wake(self) -> None:
+        for loop, event in list(self.events):
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:  # loop already closed
+                self.events.discard((loop, event))
+
+
+class StatusWatcher:
+    """Shares one status poll per correlation id among all waiters.
+
+    Polling starts with the first subscriber and repeats every
+    ``min_interval`` seconds, doubling up to ``max_interval`` while nothing
+    changes. It stops once the job is terminal or nobody is waiting. One
+    scheduler thread keeps a due-time heap of all watched ids and hands
+    reads to ``workers`` fetch threads, so the thread count stays fixed no
+    matter how many ids are watched.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], dict | None],
+        min_interval: float = 0.5,
+        max_interval: float = 5.0,
+        workers: int = 4,
+    ):
+        self.fetch = fetch
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.workers = workers
+        self._watches: dict[str, _Watch] = {}
+        self._cond = threading.Condition()
+        self._closed = threading.Event()
+        # (due, seq, correlation_id); seq keeps equal due times ordered
+        self._due: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._scheduler: threading.Thread | None = None
+        self._pool: ThreadPoolExecutor | None = None
+
+    def wait(
+        self,
+        correlation_id: str,
+        changed: Callable[[dict | None], bool],
+        timeout: float,
+    ) -> dict | None:
+        """Block until ``changed(status)`` holds, the job ends or time runs out.
+
+        Returns the latest known status either way.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            w = self._subscribe(correlation_id)
+            try:
+                while not w.done and not (w.fetched and changed(w.status)):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                return w.status
+            finally:
+                w.subscribers -= 1
+
+    async def wait_async(
+        self,
+        correlation_id: str,
+        changed: Callable[[dict | None], bool],
+        timeout: float,
+    ) -> dict | None:
+        """``wait`` for event-loop callers; holds no thread while waiting."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        event = asyncio.Event()
+        with self._cond:
+            w = self._subscribe(correlation_id)
+            w.events.add((loop, event))
+        try:
+            while True:
+                with self._cond:
+                    if w.done or (w.fetched and changed(w.status)):
+                        return w.status
+                    event.clear()
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    with self._cond:
+                        return w.status
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._cond:
+                w.subscribers -= 1
+                w.events.discard((loop, event))
+
+    def watching(self) -> int:
+        with self._cond:
+            return len(self._watches)
+
+    def close(self) -> None:
+        self._closed.set()
+        with self._cond:
+            for cid, w in list(self._watches.items()):
+                self._finish(cid, w)
+            self._due.clear()
+            self._cond.notify_all()
+            pool = self._pool
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _subscribe(self, correlation_id: str) -> _Watch:
+        # Caller holds self._cond
+        w = self._watches.get(correlation_id)
+        if w is None:
+            w = self._watches[correlation_id] = _Watch()
+            w.interval = self.min_interval
+            if self._closed.is_set():
+                w.done = True
+            else:
+                self._schedule(correlation_id, 0.0)
+                self._ensure_scheduler()
+        w.subscribers += 1
+        return w
+
+    def _schedule(self, correlation_id: str, delay: float) -> None:
+        # Caller holds self._cond
+        due = time.monotonic() + delay
+        heapq.heappush(self._due, (due, next(self._seq), correlation_id))
+        self._cond.notify_all()
+
+    def _ensure_scheduler(self) -> None:
+        # Caller holds self._cond
+        if self._scheduler is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="status-watch"
+            )
+            self._scheduler = threading.Thread(
+                target=self._run, name="status-watch-scheduler", daemon=True
+            )
+            self._scheduler.start()
+
+    def _finish(self, correlation_id: str, w: _Watch) -> None:
+        # Caller holds self._cond
+        w.done = True
+        if self._watches.get(correlation_id) is w:
+            del self._watches[correlation_id]
+        self._cond.notify_all()
+        w.wake()
+
+    def _run(self) -> None:
+        with self._cond:
+            while not self._closed.is_set():
+                if not self._due:
+                    self._cond.wait()
+                    continue
+                due, _, cid = self._due[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                heapq.heappop(self._due)
+                w = self._watches.get(cid)
+                if w is None or w.done:
+                    continue
+                if w.subscribers == 0:
+                    self._finish(cid, w)
+                    continue
+                assert self._pool is not None
+                try:
+                    self._pool.submit(self._poll, cid, w)
+                except RuntimeError:  # pool shut down by close()
+                    return
+
+    def _poll(self, correlation_id: str, w: _Watch) -> None:
+        try:
+            status = self.fetch(correlation_id)
+            failed = False
+        except Exception:
+            log.exception("status poll failed for %s", correlation_id)
+            failed = True
+        with self._cond:
+            if w.done:
+                return
+            if not failed and (not w.fetched or status != w.status):
+                w.status = status
+                w.fetched = True
+                w.interval = self.min_interval
+                self._cond.notify_all()
+                w.wake()
+            else:
+                w.interval = min(w.interval * 2, self.max_interval)
+            if is_terminal(w.status) or w.subscribers == 0 or self._closed.is_set():
+                self._finish(correlation_id, w)
+            else:
+                self._schedule(correlation_id, w.interval)
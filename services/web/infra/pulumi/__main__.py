@@ -1,6 +1,7 @@
 import os
 
 import pulumi
+import pulumi_aws as aws
 
 from stack.infra.components.http_service import EcsHttpService
 
@@ -24,6 +25,54 @@ if not EVENT_BUS_NAME and EVENT_BUS_STACK:
     except Exception:
         EVENT_BUS_NAME = None
 
+# /admin is guarded with the auth service's keys and answers 503 without them;
+# the browser sign-in page posts credentials to the auth service's /login
+AUTH_JWKS_URL = os.getenv("AUTH_JWKS_URL")
+AUTH_LOGIN_URL = os.getenv("AUTH_LOGIN_URL")
+AUTH_STACK = os.getenv("AUTH_STACK")
+if AUTH_STACK and not (AUTH_JWKS_URL and AUTH_LOGIN_URL):
+    try:
+        ref = pulumi.StackReference(AUTH_STACK)
+        auth_url = ref.get_output("url")
+        AUTH_JWKS_URL = AUTH_JWKS_URL or auth_url.apply(
+            lambda u: f"{u}/.well-known/jwks.json"
+        )
+        AUTH_LOGIN_URL = AUTH_LOGIN_URL or auth_url.apply(lambda u: f"{u}/login")
+    except Exception:
+        pass
+if not AUTH_JWKS_URL:
+    pulumi.log.warn("AUTH_JWKS_URL/AUTH_STACK unset; web /admin will answer 503")
+
+# Job index table (owned by agent): web lists it and writes queued/canceled
+JOB_INDEX_TABLE = os.getenv("JOB_INDEX_TABLE")
+AGENT_STACK = os.getenv("AGENT_STACK")
+if not JOB_INDEX_TABLE and AGENT_STACK:
+    try:
+        ref = pulumi.StackReference(AGENT_STACK)
+        JOB_INDEX_TABLE = ref.get_output("job_index_table")
+    except Exception:
+        JOB_INDEX_TABLE = None
+if not JOB_INDEX_TABLE:
+    pulumi.log.warn(
+        "JOB_INDEX_TABLE/AGENT_STACK unset; web /admin/jobs will answer 503"
+    )
+
+policy = None
+if JOB_INDEX_TABLE:
+    table_arn = aws.dynamodb.get_table_output(name=JOB_INDEX_TABLE).arn
+    policy = table_arn.apply(
+        lambda arn: pulumi.Output.secret(
+            '{"Version":"2012-10-17","Statement":[\
+            {"Effect":"Allow","Action":["dynamodb:UpdateItem","dynamodb:BatchWriteItem"],"Resource":"'
+            + arn
+            + '"},\
+            {"Effect":"Allow","Action":["dynamodb:Query"],"Resource":"'
+            + arn
+            + '/index/*"}\
+        ]}'
+        )
+    )
+
 svc = EcsHttpService(
     name=f"{MODULE}-api",
     image=api_image,
@@ -31,7 +80,11 @@ svc = EcsHttpService(
     env={
         "SERVICE_NAME": MODULE,
         **({"EVENT_BUS_NAME": EVENT_BUS_NAME} if EVENT_BUS_NAME else {}),
+        **({"AUTH_JWKS_URL": AUTH_JWKS_URL} if AUTH_JWKS_URL else {}),
+        **({"AUTH_LOGIN_URL": AUTH_LOGIN_URL} if AUTH_LOGIN_URL else {}),
+        **({"JOB_INDEX_TABLE": JOB_INDEX_TABLE} if JOB_INDEX_TABLE else {}),
     },
+    task_inline_policy_json=policy,
 )
 
 pulumi.export("alb_dns", svc.alb_dns)
@@ -1,16 +1,77 @@
 import os
 
+from services.web.adapters.buffered_publisher import BufferedPublisher
 from services.web.adapters.eventbridge_publisher import EventBridgePublisher
 from services.web.adapters.repositories.s3_jobs import S3JobRepository
 from services.web.adapters.repositories.sqs_queue import SqsQueue
+from services.web.adapters.threaded import (
+    ThreadedJobIndex,
+    ThreadedJobRepository,
+    ThreadedQueue,
+)
+from services.web.domain.ports.jobs import (
+    AsyncJobIndex,
+    AsyncJobRepository,
+    AsyncQueuePort,
+    JobIndex,
+    JobRepository,
+    QueuePort,
+)
+from stack.libs.shared.job_index import DynamoJobIndex
+from stack.libs.shared.jwt_auth import JwtVerifier
+from stack.libs.shared.memo import once
+from stack.libs.shared.redis_jobs import RedisJobStore
 
 
+# Built once per process: adapters hold shared, pooled clients and the
+# LocalStack bootstrap in from_env() only needs to run the first time.
+@once
 def provide_queue():
     bus = os.getenv("EVENT_BUS_NAME")
     if bus and os.getenv("LOCALSTACK", "").lower() not in ("1", "true", "yes", "on"):
-        return EventBridgePublisher.from_env()
-    return SqsQueue.from_env()
+        queue = EventBridgePublisher.from_env()
+    else:
+        queue = SqsQueue.from_env()
+    if os.getenv("PUBLISH_BUFFERED", "").lower() in ("1", "true", "yes", "on"):
+        # Opt-in micro-batching; the app flushes it on shutdown
+        return BufferedPublisher(
+            queue,
+            linger=float(os.getenv("PUBLISH_LINGER_MS", "5")) / 1000,
+            max_pending=int(os.getenv("PUBLISH_BUFFER_SIZE", "1000")),
+            block_timeout=float(os.getenv("PUBLISH_BLOCK_SECONDS", "1")),
+        )
+    return queue
 
 
-def provide_job_repo() -> S3JobRepository:
-    return S3JobRepository.from_env()
+@once
+def provide_job_index() -> DynamoJobIndex | None:
+    # None unless JOB_INDEX_TABLE is configured
+    return DynamoJobIndex.from_env()
+
+
+@once
+def provide_job_repo() -> S3JobRepository | RedisJobStore:
+    # JOB_STORE=redis keeps live state in Redis; S3 stays the durable archive
+    archive = S3JobRepository.from_env(index=provide_job_index())
+    if os.getenv("JOB_STORE", "s3").lower() == "redis":
+        return RedisJobStore.from_env(archive, index=provide_job_index())
+    return archive
+
+
+@once
+def provide_token_verifier() -> JwtVerifier | None:
+    # None unless AUTH_JWKS_URL is configured
+    return JwtVerifier.from_env()
+
+
+def provide_async_queue(queue: QueuePort | None = None) -> AsyncQueuePort:
+    return ThreadedQueue(queue or provide_queue())
+
+
+def provide_async_job_repo(repo: JobRepository | None = None) -> AsyncJobRepository:
+    return ThreadedJobRepository(repo or provide_job_repo())
+
+
+def provide_async_job_index(index: JobIndex | None = None) -> AsyncJobIndex | None:
+    index = index or provide_job_index()
+    return ThreadedJobIndex(index) if index is not None else None
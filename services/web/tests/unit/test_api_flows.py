@@ -1,6 +1,9 @@
+import asyncio
 from typing import Any
 
-from services.web.app.api.main import cancel, job_status, schedule_job_form
+from fastapi.testclient import TestClient
+
+from services.web.app.api.main import cancel, schedule_job_form
 
 
 class FakeQueue:
@@ -31,17 +34,20 @@ def test_schedule_and_status_routes(monkeypatch):
 
     import services.web.app.api.main as mod
 
+    monkeypatch.setenv("AUTH_DISABLED", "true")
+
     monkeypatch.setattr(mod, "_provide_queue", lambda: q)
     monkeypatch.setattr(mod, "_provide_repo", lambda: r)
 
     # Call the route function directly (unit-level)
-    resp = schedule_job_form("content.generate", "t", "x")
+    resp = asyncio.run(schedule_job_form("content.generate", "t", "x"))
     assert getattr(resp, "status_code", 0) == 303
     assert resp.headers["location"] == "/admin/jobs/job-1/view"
 
-    # Status returns the status dict via function
-    st = job_status("job-1")
-    assert st == {"status": "running"}
+    # Status returns the status dict with a validator for conditional GETs
+    resp = TestClient(mod.app).get("/admin/jobs/job-1")
+    assert resp.json() == {"status": "running"}
+    assert resp.headers["etag"]
 
 
 def test_cancel_route(monkeypatch):
@@ -53,6 +59,6 @@ def test_cancel_route(monkeypatch):
     monkeypatch.setattr(mod, "_provide_queue", lambda: q)
     monkeypatch.setattr(mod, "_provide_repo", lambda: r)
 
-    resp = cancel("job-2")
+    resp = asyncio.run(cancel("job-2"))
     assert getattr(resp, "status_code", 0) == 303
     assert "job-2" in r.canceled
@@ -0,0 +1,98 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from services.web.adapters.batching import chunk
+from services.web.adapters.eventbridge_publisher import EventBridgePublisher
+from services.web.adapters.repositories.sqs_queue import SqsQueue
+
+
+class FlakySqs:
+    """Fails entry "1" once (retryable) and entry "2" always (sender fault)."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def send_message_batch(self, QueueUrl, Entries):
+        ids = [e["Id"] for e in Entries]
+        self.calls.append(ids)
+        failed = []
+        if "1" in ids and len(self.calls) == 1:
+            failed.append({"Id": "1", "SenderFault": False, "Code": "InternalError"})
+        if "2" in ids:
+            failed.append({"Id": "2", "SenderFault": True, "Code": "InvalidParameter"})
+        ok = [{"Id": i} for i in ids if i not in {f["Id"] for f in failed}]
+        return {"Successful": ok, "Failed": failed}
+
+
+class FlakyEvents:
+    def __init__(self):
+        self.calls: list[list[dict]] = []
+
+    def put_events(self, Entries):
+        self.calls.append(Entries)
+        first = len(self.calls) == 1
+        out = [
+            (
+                {"ErrorCode": "ThrottlingException"}
+                if first and i == 0
+                else {"EventId": "e"}
+            )
+            for i in range(len(Entries))
+        ]
+        return {"FailedEntryCount": 1 if first else 0, "Entries": out}
+
+
+def test_chunks_respect_count_and_size():
+    items = [(str(i), 100) for i in range(25)]
+    assert [len(b) for b in chunk(items, lambda n: n)] == [10, 10, 5]
+    assert [len(b) for b in chunk(items, lambda n: n, max_bytes=250)] == [2] * 12 + [1]
+
+
+def test_sqs_publish_many_retries_only_failed_entries():
+    sqs = FlakySqs()
+    q = SqsQueue("url", sqs=sqs)
+    out = q.publish_many([("t", {"i": i}) for i in range(12)])
+
+    assert len(out) == 12 and len({cid for cid, _ in out}) == 12
+    assert sqs.calls[0] == [str(i) for i in range(10)]
+    assert sqs.calls[1] == ["10", "11"]
+    # Only the retryable failure is resent
+    assert sqs.calls[2] == ["1"]
+    assert len(sqs.calls) == 3
+    assert out[1][1] is None
+    assert out[2][1].startswith("InvalidParameter")
+    assert [e for _, e in out if e] == [out[2][1]]
+
+
+def test_oversized_entry_is_rejected_without_sending():
+    sqs = FlakySqs()
+    out = SqsQueue("url", sqs=sqs).publish_many([("t", {"blob": "x" * 300_000})])
+    assert sqs.calls == []
+    assert "exceeds" in out[0][1]
+
+
+def test_eventbridge_publish_many_retries_failed_entries():
+    events = FlakyEvents()
+    pub = EventBridgePublisher("bus", events=events)
+    out = pub.publish_many([("t", {"i": i}) for i in range(3)])
+
+    assert [len(c) for c in events.calls] == [3, 1]
+    resent = json.loads(events.calls[1][0]["Detail"])
+    assert resent["correlation_id"] == out[0][0]
+    assert all(err is None for _, err in out)
+
+
+def test_batch_schedule_route(monkeypatch):
+    import services.web.app.api.main as mod
+
+    monkeypatch.setenv("AUTH_DISABLED", "true")
+
+    q = SqsQueue("url", sqs=FlakySqs())
+    monkeypatch.setattr(mod, "_provide_queue", lambda: q)
+    jobs = [{"job_type": "t", "params": {"i": i}} for i in range(3)]
+    resp = TestClient(mod.app).post("/admin/schedule/batch", json={"jobs": jobs})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["failed"] == 1
+    assert [sorted(r) for r in body["results"]] == [["id"], ["id"], ["error", "id"]]
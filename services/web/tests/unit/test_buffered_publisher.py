@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+
+from services.web.adapters.buffered_publisher import BufferedPublisher
+from services.web.domain.models.errors import QueueOverloaded
+
+
+class RecordingQueue:
+    def __init__(self, delay=0.0, fail=()):
+        self.batches: list[list[str]] = []
+        self.delay = delay
+        self.fail = set(fail)
+        self.release = threading.Event()
+        self.release.set()
+
+    def publish_many(self, jobs, correlation_ids=None):
+        self.release.wait(5)
+        time.sleep(self.delay)
+        self.batches.append(list(correlation_ids))
+        return [
+            (cid, "boom" if p.get("i") in self.fail else None)
+            for cid, (_, p) in zip(correlation_ids, jobs)
+        ]
+
+
+def test_publishes_are_batched_with_ids_returned_up_front():
+    inner = RecordingQueue()
+    pub = BufferedPublisher(inner, linger=0.05)
+    ids = []
+    threads = [
+        threading.Thread(target=lambda i=i: ids.append(pub.publish("t", {"i": i})))
+        for i in range(25)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(ids) == 25
+    assert pub.flush(timeout=5)
+    sent = [cid for batch in inner.batches for cid in batch]
+    assert sorted(sent) == sorted(ids)
+    assert len(inner.batches) < 25
+    pub.close()
+
+
+def test_single_publish_is_sent_after_linger():
+    inner = RecordingQueue()
+    pub = BufferedPublisher(inner, linger=0.01)
+    cid = pub.publish("t", {})
+    assert pub.flush(timeout=2)
+    assert inner.batches == [[cid]]
+    pub.close()
+
+
+def test_full_buffer_applies_backpressure():
+    inner = RecordingQueue()
+    inner.release.clear()  # stall the sender
+    pub = BufferedPublisher(inner, linger=0, max_pending=2, block_timeout=0.05)
+    pub.publish("t", {})  # taken by the stalled sender
+    time.sleep(0.05)
+    pub.publish("t", {})
+    pub.publish("t", {})
+    with pytest.raises(QueueOverloaded):
+        pub.publish("t", {})
+    inner.release.set()
+    pub.close()
+
+
+def test_close_flushes_pending_and_counts_failures():
+    inner = RecordingQueue()
+    pub = BufferedPublisher(inner, linger=60)
+    for i in range(3):
+        pub.publish("t", {"i": i})
+    inner.fail = {1}
+    pub.close()
+    assert sum(len(b) for b in inner.batches) == 3
+    assert pub.failed == 1
+    with pytest.raises(RuntimeError):
+        pub.publish("t", {})
+
+
+def test_overload_maps_to_503(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import services.web.app.api.main as mod
+
+    monkeypatch.setenv("AUTH_DISABLED", "true")
+
+    class Full:
+        def publish(self, job_type, params):
+            raise QueueOverloaded("full")
+
+    monkeypatch.setattr(mod, "_provide_queue", lambda: Full())
+    resp = TestClient(mod.app).post(
+        "/admin/schedule", json={"job_type": "t", "params": {}}
+    )
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "1"
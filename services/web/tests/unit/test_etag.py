@@ -0,0 +1,59 @@
+from fastapi.testclient import TestClient
+
+from services.web.adapters.repositories.s3_jobs import S3JobRepository
+from stack.libs.testing.aws_fakes import FakeS3
+
+
+def _repo():
+    s3 = FakeS3()
+    s3.create_bucket(Bucket="b")
+    return S3JobRepository("b", s3=s3), s3
+
+
+def test_repeat_reads_are_conditional():
+    repo, s3 = _repo()
+    repo.mark_completed("a", {"big": "x" * 1000})
+    first = repo.get_status("a")
+    # A 304 from S3 returns the parsed status from the first read
+    assert repo.get_status("a") is first
+    assert s3.calls["get_object"] == 2
+
+
+def test_changed_object_is_read_again():
+    repo, s3 = _repo()
+    repo.mark_running("a")
+    repo.get_status("a")
+    # Written by another process: the ETag no longer matches
+    s3.put_object(Bucket="b", Key="results/a.json", Body=b'{"status": "completed"}')
+    assert repo.get_status("a") == {"status": "completed"}
+
+
+def test_own_writes_drop_the_cached_etag():
+    repo, _ = _repo()
+    repo.mark_running("a")
+    repo.get_status("a")
+    repo.mark_failed("a", "boom")
+    assert repo._etags == {}
+    assert repo.get_status("a")["status"] == "failed"
+
+
+def test_status_endpoint_honours_if_none_match(monkeypatch):
+    import services.web.app.api.main as mod
+
+    monkeypatch.setenv("AUTH_DISABLED", "true")
+
+    repo, _ = _repo()
+    repo.mark_completed("e1", {"ok": True})
+    monkeypatch.setattr(mod, "_provide_repo", lambda: repo)
+    mod._status_cache.clear()
+    client = TestClient(mod.app)
+
+    first = client.get("/admin/jobs/e1")
+    etag = first.headers["etag"]
+    again = client.get("/admin/jobs/e1", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+    other = client.get("/admin/jobs/e1", headers={"If-None-Match": '"stale"'})
+    assert other.status_code == 200
+    mod._status_cache.clear()
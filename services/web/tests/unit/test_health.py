@@ -1,5 +1,7 @@
+import asyncio
+
 from services.web.app.api.main import healthz
 
 
 def test_healthz():
-    assert healthz() == {"status": "ok"}
+    assert asyncio.run(healthz()) == {"status": "ok"}
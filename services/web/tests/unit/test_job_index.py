@@ -0,0 +1,272 @@
+from fastapi.testclient import TestClient
+
+from stack.libs.shared.job_index import DynamoJobIndex
+
+
+class ConditionFailed(Exception):
+    response = {"Error": {"Code": "ConditionalCheckFailedException"}}
+
+
+class FakeDynamo:
+    def __init__(self):
+        self.updates: list[dict] = []
+        self.batches: list[int] = []
+        self.queries: list[dict] = []
+        self.unprocessed_once = True
+        self.fail_updates = False
+
+    def update_item(self, **kw):
+        self.updates.append(kw)
+        if self.fail_updates:
+            raise ConditionFailed()
+
+    def batch_write_item(self, RequestItems):
+        (items,) = RequestItems.values()
+        self.batches.append(len(items))
+        if self.unprocessed_once:
+            self.unprocessed_once = False
+            return {"UnprocessedItems": {"t": items[:1]}}
+        return {}
+
+    def query(self, **kw):
+        self.queries.append(kw)
+        item = {
+            "cid": {"S": "a"},
+            "status": {"S": "running"},
+            "status_pk": {"S": "running#20240101#0"},
+            "time_pk": {"S": "20240101#0"},
+            "job_type": {"S": "content.generate"},
+            "created_at": {"N": "1.000"},
+            "updated_at": {"N": "2.000"},
+        }
+        part = kw["ExpressionAttributeNames"]["#p"]
+        last = {k: item[k] for k in ("cid", part, "updated_at")}
+        return {"Items": [item], "LastEvaluatedKey": last}
+
+
+def test_non_terminal_update_cannot_overwrite_terminal():
+    ddb = FakeDynamo()
+    index = DynamoJobIndex("t", ddb=ddb)
+    index.record("a", "completed")
+    ddb.fail_updates = True
+    index.record("a", "running")  # rejected by the condition, not raised
+
+    assert "ConditionExpression" not in ddb.updates[0]
+    assert "NOT #s IN" in ddb.updates[1]["ConditionExpression"]
+
+
+def test_record_many_batches_and_retries_unprocessed(monkeypatch):
+    import stack.libs.shared.job_index as mod
+
+    monkeypatch.setattr(mod.time, "sleep", lambda s: None)
+    ddb = FakeDynamo()
+    DynamoJobIndex("t", ddb=ddb).record_many(
+        [(f"c{i}", "queued", "x") for i in range(30)]
+    )
+    assert ddb.batches == [25, 1, 5]
+
+
+class GsiDynamo:
+    """Items in memory; ``query`` follows DynamoDB's Limit/filter/paging rules."""
+
+    def __init__(self):
+        self.items: dict[str, dict] = {}
+        self.queries: list[dict] = []
+
+    def batch_write_item(self, RequestItems):
+        for req in next(iter(RequestItems.values())):
+            item = req["PutRequest"]["Item"]
+            self.items[item["cid"]["S"]] = item
+        return {}
+
+    def query(self, **kw):
+        self.queries.append(kw)
+        values = kw["ExpressionAttributeValues"]
+        part = kw["ExpressionAttributeNames"]["#p"]
+
+        def order(item):
+            return (float(item["updated_at"]["N"]), item["cid"]["S"])
+
+        rows = sorted(
+            (i for i in self.items.values() if i[part] == values[":k"]),
+            key=order,
+            reverse=True,
+        )
+        lo = float(values[":lo"]["N"]) if ":lo" in values else float("-inf")
+        hi = float(values[":hi"]["N"]) if ":hi" in values else float("inf")
+        rows = [r for r in rows if lo <= float(r["updated_at"]["N"]) <= hi]
+        if "ExclusiveStartKey" in kw:
+            after = order(kw["ExclusiveStartKey"])
+            rows = [r for r in rows if order(r) < after]
+        page, rest = rows[: kw["Limit"]], rows[kw["Limit"] :]
+        out = {"Items": page}
+        if ":jt" in values:
+            out["Items"] = [r for r in page if r.get("job_type") == values[":jt"]]
+        if rest and page:
+            last = page[-1]
+            out["LastEvaluatedKey"] = {k: last[k] for k in ("cid", part, "updated_at")}
+        return out
+
+
+def _seed(monkeypatch, n=40):
+    import stack.libs.shared.job_index as mod
+
+    ddb = GsiDynamo()
+    index = DynamoJobIndex("t", ddb=ddb, shards=4, lookback_days=5)
+    base = 1_700_000_000.0
+    for i in range(n):
+        # Spread over three days, several jobs per shard and day
+        monkeypatch.setattr(mod.time, "time", lambda i=i: base + i * 5_000)
+        index.record_many([(f"c{i:02d}", "running" if i % 3 else "queued", "x")])
+    monkeypatch.setattr(mod.time, "time", lambda: base + n * 5_000)
+    return index, ddb
+
+
+def test_time_index_partitions_are_sharded_by_day(monkeypatch):
+    index, ddb = _seed(monkeypatch)
+    parts = {item["time_pk"]["S"] for item in ddb.items.values()}
+    assert len({p.split("#")[0] for p in parts}) > 1
+    assert len(parts) > 3
+    assert all(
+        item["status_pk"]["S"] == f"{item['status']['S']}#{item['time_pk']['S']}"
+        for item in ddb.items.values()
+    )
+
+
+def test_paging_merges_shards_newest_first(monkeypatch):
+    index, ddb = _seed(monkeypatch)
+    seen, cursor = [], None
+    while True:
+        jobs, cursor = index.query(limit=7, cursor=cursor)
+        assert len(jobs) <= 7
+        seen.extend(j["id"] for j in jobs)
+        if cursor is None:
+            break
+    assert seen == [f"c{i:02d}" for i in reversed(range(40))]
+    assert {q["IndexName"] for q in ddb.queries} == {"by_time"}
+
+
+def test_filtered_paging_waits_for_shards_cut_short_by_limit(monkeypatch):
+    import stack.libs.shared.job_index as mod
+
+    ddb = GsiDynamo()
+    index = DynamoJobIndex("t", ddb=ddb, shards=2, lookback_days=1)
+    base = 1_700_000_000.0
+    day = mod._day(base)
+    rows = [("a0", 0, 100, "x"), ("a1", 0, 90, "x"), ("a2", 0, 80, "x")]
+    rows += [("a3", 0, 70, "x"), ("a4", 0, 50, "y"), ("b4", 1, 10, "y")]
+    for cid, shard, t, job_type in rows:
+        ddb.items[cid] = {
+            "cid": {"S": cid},
+            "status": {"S": "running"},
+            "job_type": {"S": job_type},
+            "created_at": {"N": str(base + t)},
+            "updated_at": {"N": str(base + t)},
+            "time_pk": {"S": f"{day}#{shard}"},
+            "status_pk": {"S": f"running#{day}#{shard}"},
+        }
+    monkeypatch.setattr(mod.time, "time", lambda: base + 1_000)
+    seen, cursor = [], None
+    while True:
+        jobs, cursor = index.query(job_type="y", limit=2, cursor=cursor)
+        seen.extend(j["id"] for j in jobs)
+        if cursor is None:
+            break
+    assert seen == ["a4", "b4"]
+    assert index.query(job_type="y", limit=5)[0][0]["id"] == "a4"
+
+
+def test_status_query_with_filter_and_range(monkeypatch):
+    index, ddb = _seed(monkeypatch)
+    base = 1_700_000_000.0
+    seen, cursor = [], None
+    while True:
+        jobs, cursor = index.query(
+            status="running",
+            job_type="x",
+            since=base + 10 * 5_000,
+            limit=5,
+            cursor=cursor,
+        )
+        seen.extend(j["id"] for j in jobs)
+        if cursor is None:
+            break
+    expected = [f"c{i:02d}" for i in reversed(range(10, 40)) if i % 3]
+    assert seen == expected
+    assert {q["IndexName"] for q in ddb.queries} == {"by_status"}
+    assert all(q["FilterExpression"] == "job_type = :jt" for q in ddb.queries)
+
+
+def test_sparse_listing_spends_a_bounded_number_of_queries_per_page(monkeypatch):
+    index, ddb = _seed(monkeypatch)
+    index.max_queries = 4
+    seen, cursor, pages = [], None, 0
+    while True:
+        before = len(ddb.queries)
+        jobs, cursor = index.query(status="queued", limit=50, cursor=cursor)
+        assert len(ddb.queries) - before < index.max_queries + index.shards
+        seen.extend(j["id"] for j in jobs)
+        pages += 1
+        if cursor is None:
+            break
+    assert seen == [f"c{i:02d}" for i in reversed(range(40)) if i % 3 == 0]
+    assert pages > 1
+
+
+def test_list_route_and_queued_record_on_schedule(monkeypatch):
+    import services.web.app.api.main as mod
+
+    monkeypatch.setenv("AUTH_DISABLED", "true")
+
+    ddb = FakeDynamo()
+    ddb.unprocessed_once = False
+
+    class Queue:
+        def publish(self, job_type, params, correlation_id=None):
+            # The queued record is already in place when the job goes out
+            assert ddb.batches == [1]
+            self.cid = correlation_id
+            return correlation_id
+
+    queue = Queue()
+    index = DynamoJobIndex("t", ddb=ddb)
+    monkeypatch.setattr(mod, "_provide_index", lambda: index)
+    monkeypatch.setattr(mod, "_provide_queue", lambda: queue)
+    client = TestClient(mod.app)
+
+    resp = client.get("/admin/jobs", params={"status": "running", "limit": 10})
+    assert resp.status_code == 200
+    assert resp.json()["jobs"][0]["id"] == "a"
+    assert resp.json()["next"]
+    assert client.get("/admin/jobs", params={"cursor": "%%%"}).status_code == 400
+
+    resp = client.post("/admin/schedule", json={"job_type": "t", "params": {}})
+    assert resp.json() == {"id": queue.cid}
+    assert ddb.batches == [1]
+
+    monkeypatch.setattr(mod, "_provide_index", lambda: None)
+    assert client.get("/admin/jobs").status_code == 503
+
+
+def test_batch_schedule_indexes_before_publishing_and_marks_failures():
+    import asyncio
+
+    from services.web.domain.models.request import ScheduleRequest
+    from services.web.domain.services.jobs import schedule_jobs_async
+
+    events = []
+
+    class Index:
+        async def record_many(self, jobs):
+            events.append([status for _, status, _ in jobs])
+
+    class Queue:
+        async def publish_many(self, jobs, correlation_ids=None):
+            events.append("publish")
+            return [(correlation_ids[0], None), (correlation_ids[1], "boom")]
+
+    reqs = [ScheduleRequest(job_type="t", params={}) for _ in range(2)]
+    out = asyncio.run(schedule_jobs_async(Queue(), reqs, Index()))
+
+    assert events == [["queued", "queued"], "publish", ["failed"]]
+    assert "error" in out[1] and "error" not in out[0]
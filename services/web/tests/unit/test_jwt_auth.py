@@ -0,0 +1,186 @@
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi.testclient import TestClient
+
+from stack.libs.shared.jwt_auth import JwksClient, JwtVerifier
+
+
+def _key(kid):
+    private = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = jwt.algorithms.RSAAlgorithm.to_jwk(private.public_key(), as_dict=True)
+    return private, {**jwk, "kid": kid, "alg": "RS256"}
+
+
+@pytest.fixture(scope="module")
+def keys():
+    return _key("k1"), _key("k2")
+
+
+def _token(private, kid, **claims):
+    payload = {"sub": "a@b.com", "name": "A", "exp": int(time.time()) + 60, **claims}
+    return jwt.encode(payload, private, algorithm="RS256", headers={"kid": kid})
+
+
+class Jwks:
+    def __init__(self, *jwks):
+        self.doc = {"keys": list(jwks)}
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.doc
+
+
+def test_verifier_caches_claims_without_remote_calls(keys, monkeypatch):
+    (p1, j1), _ = keys
+    fetch = Jwks(j1)
+    client = JwksClient("http://auth/jwks", fetch=fetch)
+    client.refresh()
+    verifier = JwtVerifier(client)
+
+    decodes = []
+    real = jwt.decode
+    monkeypatch.setattr(
+        jwt, "decode", lambda *a, **k: decodes.append(1) or real(*a, **k)
+    )
+    token = _token(p1, "k1")
+    for _ in range(3):
+        assert verifier.principal(token).subject == "a@b.com"
+    assert len(decodes) == 1
+    assert fetch.calls == 1
+    assert verifier.cache.hits == 2
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        verifier.verify(_token(p1, "k1", exp=int(time.time()) - 5))
+
+
+def test_unknown_kid_triggers_background_refresh(keys):
+    (p1, j1), (p2, j2) = keys
+    fetch = Jwks(j1)
+    client = JwksClient("http://auth/jwks", min_refresh_interval=0, fetch=fetch)
+    client.refresh()
+    verifier = JwtVerifier(client)
+    fetch.doc = {"keys": [j1, j2]}
+    try:
+        with pytest.raises(jwt.InvalidTokenError):
+            verifier.verify(_token(p2, "k2"))
+        deadline = time.monotonic() + 5
+        while fetch.calls < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert verifier.verify(_token(p2, "k2"))["sub"] == "a@b.com"
+    finally:
+        client.close()
+
+
+def test_rejects_other_algorithms(keys):
+    (_, j1), _ = keys
+    client = JwksClient("http://auth/jwks", fetch=Jwks(j1))
+    client.refresh()
+    hs = jwt.encode({"sub": "x", "exp": int(time.time()) + 60}, "s", algorithm="HS256")
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        JwtVerifier(client).verify(hs)
+    assert JwtVerifier(client, hs256_secret="s").verify(hs)["sub"] == "x"
+
+
+def test_admin_routes_require_token(keys, monkeypatch):
+    import services.web.app.api.main as mod
+
+    (p1, j1), _ = keys
+    jwks = JwksClient("http://auth/jwks", fetch=Jwks(j1))
+    jwks.refresh()
+    monkeypatch.setattr(mod, "_token_verifier", lambda: JwtVerifier(jwks))
+    client = TestClient(mod.app)
+
+    assert client.get("/healthz").status_code == 200
+    r = client.get("/admin")
+    assert r.status_code == 401
+    assert r.headers["WWW-Authenticate"] == "Bearer"
+    token = _token(p1, "k1")
+    r = client.get("/admin", headers={"Authorization": f"Bearer {token}"})
+    assert r.status_code == 200
+    # Browsers without a session are sent to the sign-in page
+    r = client.get("/admin", headers={"Accept": "text/html"}, follow_redirects=False)
+    assert (r.status_code, r.headers["location"]) == (303, "/login")
+
+
+def test_browser_session_with_csrf(keys, monkeypatch):
+    import services.web.app.api.main as mod
+    from stack.libs.shared.jwt_auth import csrf_token
+
+    (p1, j1), _ = keys
+    jwks = JwksClient("http://auth/jwks", fetch=Jwks(j1))
+    jwks.refresh()
+    monkeypatch.setattr(mod, "_token_verifier", lambda: JwtVerifier(jwks))
+    token = _token(p1, "k1")
+    logins = []
+
+    def fake_login(url, email, password):
+        logins.append((url, email))
+        return token if password == "p" else None
+
+    monkeypatch.setattr(mod, "auth_login", fake_login)
+    monkeypatch.setenv("AUTH_LOGIN_URL", "http://auth/login")
+    client = TestClient(mod.app)
+
+    bad = {"email": "a@b.com", "password": "x"}
+    assert client.post("/login", data=bad).status_code == 401
+    r = client.post(
+        "/login", data={"email": "a@b.com", "password": "p"}, follow_redirects=False
+    )
+    assert (r.status_code, r.headers["location"]) == (303, "/admin")
+    cookie = r.headers["set-cookie"].lower()
+    assert "httponly" in cookie and "samesite=strict" in cookie
+    assert logins[-1] == ("http://auth/login", "a@b.com")
+
+    # Pages work from the cookie and embed the session's CSRF token in forms
+    page = client.get("/admin")
+    assert page.status_code == 200
+    csrf = csrf_token(token)
+    assert f'action="/admin/jobs?csrf={csrf}"' in page.text
+
+    # A cookie alone cannot post: that is what a cross-site form would send
+    assert client.post("/admin/logout").status_code == 403
+    assert client.post("/admin/logout?csrf=forged").status_code == 403
+    r = client.post(f"/admin/logout?csrf={csrf}", follow_redirects=False)
+    assert (r.status_code, r.headers["location"]) == (303, "/login")
+
+
+def test_admin_routes_fail_closed_without_verifier(monkeypatch):
+    import services.web.app.api.main as mod
+
+    monkeypatch.setattr(mod, "_token_verifier", lambda: None)
+    monkeypatch.delenv("AUTH_DISABLED", raising=False)
+    client = TestClient(mod.app)
+    assert client.get("/admin").status_code == 503
+    assert client.get("/healthz").status_code == 200
+    monkeypatch.setenv("AUTH_DISABLED", "true")
+    assert client.get("/admin").status_code == 200
+
+
+def test_principal_is_on_the_request(keys):
+    from fastapi import Depends, FastAPI
+
+    from stack.libs.shared.jwt_auth import (
+        JwtAuthMiddleware,
+        Principal,
+        require_principal,
+    )
+
+    (p1, j1), _ = keys
+    jwks = JwksClient("http://auth/jwks", fetch=Jwks(j1))
+    jwks.refresh()
+    verifier = JwtVerifier(jwks)
+    app = FastAPI()
+    app.add_middleware(JwtAuthMiddleware, get_verifier=lambda: verifier)
+
+    @app.get("/me")
+    async def me(principal: Principal = Depends(require_principal)) -> dict:
+        return {"sub": principal.subject, "name": principal.name}
+
+    r = TestClient(app).get(
+        "/me", headers={"Authorization": f"Bearer {_token(p1, 'k1')}"}
+    )
+    assert r.json() == {"sub": "a@b.com", "name": "A"}
@@ -0,0 +1,52 @@
+import threading
+
+import stack.libs.shared.aws as aws
+from services.web.public import providers
+
+
+def test_shared_client_is_built_once_with_pooled_config(monkeypatch):
+    built = []
+
+    def fake_client(service, region_name, config=None, **kw):
+        built.append((service, config))
+        return object()
+
+    monkeypatch.setattr(aws.boto3, "client", fake_client)
+    monkeypatch.setattr(aws, "_shared", {})
+    monkeypatch.delenv("LOCALSTACK", raising=False)
+    monkeypatch.delenv("AWS_ENDPOINT_URL", raising=False)
+
+    got = []
+    threads = [
+        threading.Thread(target=lambda: got.append(aws.shared_client("s3")))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(built) == 1
+    assert len({id(c) for c in got}) == 1
+    config = built[0][1]
+    assert config.tcp_keepalive is True
+    assert config.retries["mode"] == "adaptive"
+    assert config.max_pool_connections == 50
+
+
+def test_job_repo_provider_bootstraps_once(monkeypatch):
+    import services.web.adapters.repositories.s3_jobs as s3_jobs
+
+    ensured = []
+    monkeypatch.setenv("LOCALSTACK", "1")
+    monkeypatch.setattr(s3_jobs, "shared_client", lambda name: object())
+    monkeypatch.setattr(
+        s3_jobs, "ensure_bucket", lambda c, bucket_name: ensured.append(bucket_name)
+    )
+    providers.provide_job_repo.reset()
+    try:
+        first = providers.provide_job_repo()
+        assert providers.provide_job_repo() is first
+        assert ensured == ["web-status"]
+    finally:
+        providers.provide_job_repo.reset()
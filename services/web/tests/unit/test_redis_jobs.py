@@ -0,0 +1,80 @@
+import json
+
+from services.web.adapters.repositories.s3_jobs import S3JobRepository
+from stack.libs.shared.redis_jobs import RedisJobStore
+from stack.libs.testing.aws_fakes import FakeS3
+from stack.libs.testing.redis_fake import FakeRedis
+
+
+def _store():
+    s3 = FakeS3()
+    s3.create_bucket(Bucket="b")
+    r = FakeRedis()
+    return RedisJobStore(r, S3JobRepository("b", s3=s3), terminal_ttl=60), r, s3
+
+
+def test_live_status_stays_in_redis():
+    store, r, s3 = _store()
+    store.mark_running("c1")
+    assert store.get_status("c1")["status"] == "running"
+    assert s3.calls.get("put_object", 0) == 0
+    assert 0 < r.ttl("job:status:c1") <= store.live_ttl
+
+
+def test_terminal_status_is_written_through_and_served_hot():
+    store, r, s3 = _store()
+    store.mark_running("c1")
+    store.mark_completed("c1", {"ok": True})
+    archived = json.loads(
+        s3.get_object(Bucket="b", Key="results/c1.json")["Body"].read()
+    )
+    assert archived["status"] == "completed"
+    reads = s3.calls.get("get_object", 0)
+    assert store.get_status("c1")["result"] == {"ok": True}
+    assert s3.calls.get("get_object", 0) == reads
+    assert r.ttl("job:status:c1") <= 60
+
+
+def test_miss_falls_back_to_archive_and_recaches():
+    store, r, _ = _store()
+    store.mark_failed("c1", "boom")
+    r.delete("job:status:c1")
+    assert store.get_status("c1")["error"] == "boom"
+    assert r.get("job:status:c1") is not None
+    assert store.get_status("missing") is None
+
+
+def test_cancel_sets_flag_and_archives():
+    store, _, s3 = _store()
+    store.mark_canceled("c1")
+    assert store.is_canceled("c1")
+    assert not store.is_canceled("c2")
+    assert store.list_canceled() == {"c1"}
+    assert store.get_status("c1")["status"] == "canceled"
+    assert S3JobRepository("b", s3=s3).get_status("c1")["status"] == "canceled"
+
+
+def test_provider_selects_redis_store(monkeypatch):
+    import stack.libs.shared.redis_jobs as redis_jobs
+    from services.web.public import providers
+
+    class FakeRedisModule:
+        class Redis:
+            @staticmethod
+            def from_url(url):
+                assert url == "redis://cache:6379/1"
+                return FakeRedis()
+
+    monkeypatch.setattr(redis_jobs, "redis", FakeRedisModule)
+    monkeypatch.setattr(
+        S3JobRepository, "from_env", classmethod(lambda cls, index: "s3")
+    )
+    monkeypatch.setenv("JOB_STORE", "redis")
+    monkeypatch.setenv("REDIS_URL", "redis://cache:6379/1")
+    providers.provide_job_repo.reset()
+    try:
+        repo = providers.provide_job_repo()
+        assert isinstance(repo, RedisJobStore)
+        assert repo.archive == "s3"
+    finally:
+        providers.provide_job_repo.reset()
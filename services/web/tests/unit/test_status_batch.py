@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+
+from services.web.adapters.threaded import ThreadedJobRepository
+from services.web.domain.services.jobs import get_job_statuses_async
+from services.web.domain.services.status_cache import StatusCache
+
+
+class SlowRepo:
+    def __init__(self, statuses, delay=0.05):
+        self.statuses = statuses
+        self.delay = delay
+        self.reads: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get_status(self, cid):
+        with self._lock:
+            self.reads.append(cid)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return self.statuses.get(cid)
+
+
+def test_lookups_overlap_within_pool_bound():
+    repo = SlowRepo({f"j{i}": {"status": "running"} for i in range(8)})
+    ids = [f"j{i}" for i in range(10)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        started = time.monotonic()
+        out = asyncio.run(
+            get_job_statuses_async(ThreadedJobRepository(repo, pool), ids)
+        )
+        elapsed = time.monotonic() - started
+
+    assert list(out) == ids
+    assert out["j0"] == {"status": "running"}
+    assert out["j9"] is None
+    assert repo.peak == 4
+    assert elapsed < 10 * repo.delay
+
+
+def test_cache_hits_and_duplicates_skip_the_store():
+    repo = SlowRepo({"a": {"status": "completed"}, "b": {"status": "running"}}, 0)
+    cache = StatusCache()
+    cache.put("a", {"status": "completed"})
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        out = asyncio.run(
+            get_job_statuses_async(
+                ThreadedJobRepository(repo, pool), ["a", "b", "b"], cache
+            )
+        )
+    assert out == {"a": {"status": "completed"}, "b": {"status": "running"}}
+    assert repo.reads == ["b"]
+
+
+def test_batch_status_route(monkeypatch):
+    import services.web.app.api.main as mod
+
+    monkeypatch.setenv("AUTH_DISABLED", "true")
+
+    repo = SlowRepo({"x": {"status": "failed"}}, 0)
+    monkeypatch.setattr(mod, "_provide_repo", lambda: repo)
+    mod._status_cache.clear()
+
+    resp = TestClient(mod.app).post("/admin/jobs/status", json={"ids": ["x", "y"]})
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "statuses": {"x": {"status": "failed"}, "y": None},
+        "missing": ["y"],
+    }
+    assert (
+        TestClient(mod.app).post("/admin/jobs/status", json={"ids": []}).status_code
+        == 422
+    )
+    mod._status_cache.clear()
+
+
+def test_async_lookup_limits_concurrency():
+    repo = SlowRepo({f"j{i}": {"status": "running"} for i in range(12)}, 0.02)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        out = asyncio.run(
+            get_job_statuses_async(
+                ThreadedJobRepository(repo, pool),
+                [f"j{i}" for i in range(12)],
+                concurrency=3,
+            )
+        )
+    assert len(out) == 12
+    assert repo.peak == 3
@@ -0,0 +1,87 @@
+import asyncio
+
+from services.web.domain.services.jobs import cancel_job_async, get_job_status_async
+from services.web.domain.services.status_cache import StatusCache
+
+
+class FakeRepo:
+    def __init__(self, status=None):
+        self.status = dict(status or {})
+        self.reads = 0
+        self.canceled: list[str] = []
+
+    async def get_status(self, cid):
+        self.reads += 1
+        return self.status.get(cid)
+
+    async def mark_canceled(self, cid):
+        self.canceled.append(cid)
+        self.status[cid] = {"status": "canceled"}
+
+
+def get_job_status(repo, cid, cache):
+    return asyncio.run(get_job_status_async(repo, cid, cache))
+
+
+def cancel_job(repo, cid, cache):
+    asyncio.run(cancel_job_async(repo, cid, cache))
+
+
+def _clock(monkeypatch):
+    import services.web.domain.services.status_cache as mod
+
+    clock = {"t": 0.0}
+    monkeypatch.setattr(mod.time, "monotonic", lambda: clock["t"])
+    return clock
+
+
+def test_running_status_expires_after_ttl(monkeypatch):
+    clock = _clock(monkeypatch)
+    repo = FakeRepo({"a": {"status": "running"}})
+    cache = StatusCache(ttl=2)
+    assert get_job_status(repo, "a", cache) == {"status": "running"}
+    assert get_job_status(repo, "a", cache) == {"status": "running"}
+    assert repo.reads == 1
+    clock["t"] += 3
+    repo.status["a"] = {"status": "completed"}
+    assert get_job_status(repo, "a", cache) == {"status": "completed"}
+    assert repo.reads == 2
+
+
+def test_terminal_status_is_pinned(monkeypatch):
+    clock = _clock(monkeypatch)
+    repo = FakeRepo({"a": {"status": "completed"}})
+    cache = StatusCache(ttl=1)
+    get_job_status(repo, "a", cache)
+    clock["t"] += 3600
+    get_job_status(repo, "a", cache)
+    assert repo.reads == 1
+
+
+def test_missing_status_is_cached_briefly(monkeypatch):
+    clock = _clock(monkeypatch)
+    repo = FakeRepo()
+    cache = StatusCache(ttl=1)
+    assert get_job_status(repo, "a", cache) is None
+    assert get_job_status(repo, "a", cache) is None
+    assert repo.reads == 1
+    clock["t"] += 2
+    get_job_status(repo, "a", cache)
+    assert repo.reads == 2
+
+
+def test_cancel_invalidates_entry(monkeypatch):
+    _clock(monkeypatch)
+    repo = FakeRepo({"a": {"status": "running"}})
+    cache = StatusCache(ttl=60)
+    get_job_status(repo, "a", cache)
+    cancel_job(repo, "a", cache)
+    assert get_job_status(repo, "a", cache) == {"status": "canceled"}
+
+
+def test_lru_is_bounded():
+    cache = StatusCache(capacity=2)
+    for cid in ("a", "b", "c"):
+        cache.put(cid, {"status": "completed"})
+    assert cache.get("a") == (False, None)
+    assert cache.get("c") == (True, {"status": "completed"})
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+
+from services.web.domain.services.status_watch import StatusWatcher
+
+
+class FakeStore:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.reads = 0
+
+    def fetch(self, cid):
+        self.reads += 1
+        if len(self.statuses) > 1:
+            return self.statuses.pop(0)
+        return self.statuses[0]
+
+
+def test_waiters_share_one_poller_and_see_transition():
+    store = FakeStore([{"status": "running"}] * 3 + [{"status": "completed"}])
+    watcher = StatusWatcher(store.fetch, min_interval=0.01, max_interval=0.01)
+    seen = []
+
+    def waiter():
+        seen.append(
+            watcher.wait("a", lambda st: st and st["status"] != "running", timeout=5)
+        )
+
+    threads = [threading.Thread(target=waiter) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    assert seen == [{"status": "completed"}] * 5
+    # One poller served every waiter
+    assert store.reads <= 6
+    assert watcher.watching() == 0
+
+
+def test_wait_times_out_with_latest_status_and_backs_off():
+    store = FakeStore([{"status": "running"}])
+    watcher = StatusWatcher(store.fetch, min_interval=0.01, max_interval=0.16)
+    st = watcher.wait("a", lambda s: s["status"] != "running", timeout=0.4)
+    assert st == {"status": "running"}
+    # Unchanged reads back off (0.01, 0.02, 0.04 ...), far fewer than 40
+    assert store.reads < 10
+    watcher.close()
+
+
+def test_async_waiters_hold_no_threads():
+    store = FakeStore([{"status": "running"}] * 2 + [{"status": "failed"}])
+    watcher = StatusWatcher(store.fetch, min_interval=0.01, max_interval=0.01)
+
+    async def main():
+        before = threading.active_count()
+        waits = [
+            watcher.wait_async("a", lambda st: st["status"] == "failed", timeout=5)
+            for _ in range(50)
+        ]
+        task = asyncio.gather(*waits)
+        await asyncio.sleep(0)
+        # Scheduler plus fetch workers, regardless of the fifty waiters
+        assert threading.active_count() <= before + 1 + watcher.workers
+        return await task
+
+    assert asyncio.run(main()) == [{"status": "failed"}] * 50
+    watcher.close()
+
+
+def test_distinct_ids_share_a_fixed_set_of_threads():
+    reads: dict[str, int] = {}
+
+    def fetch(cid):
+        reads[cid] = reads.get(cid, 0) + 1
+        return {"status": "completed" if reads[cid] > 2 else "running"}
+
+    watcher = StatusWatcher(fetch, min_interval=0.01, max_interval=0.02, workers=2)
+
+    async def main():
+        before = threading.active_count()
+        waits = [
+            watcher.wait_async(
+                f"id-{i}", lambda st: st["status"] == "completed", timeout=10
+            )
+            for i in range(200)
+        ]
+        task = asyncio.gather(*waits)
+        await asyncio.sleep(0.05)
+        assert threading.active_count() <= before + 3
+        return await task
+
+    assert asyncio.run(main()) == [{"status": "completed"}] * 200
+    assert watcher.watching() == 0
+    watcher.close()
+
+
+def test_long_poll_and_sse_endpoints(monkeypatch):
+    import services.web.app.api.main as mod
+
+    store = FakeStore(
+        [None, {"status": "running"}, {"status": "running"}, {"status": "completed"}]
+    )
+
+    class Repo:
+        def get_status(self, cid):
+            return store.fetch(cid)
+
+    monkeypatch.setattr(mod, "_provide_repo", lambda: Repo())
+    monkeypatch.setattr(
+        mod,
+        "_status_watcher",
+        StatusWatcher(mod._fetch_status, min_interval=0.01, max_interval=0.02),
+    )
+    mod._status_cache.clear()
+
+    assert asyncio.run(mod.wait_job_status("j1", since="pending", timeout=5)) == {
+        "status": "running"
+    }
+
+    async def collect():
+        return [e async for e in mod._status_events("j1", max_seconds=5)]
+
+    events = asyncio.run(collect())
+    data = [e for e in events if e.startswith("event: status")]
+    assert data[-1] == 'event: status\ndata: {"status": "completed"}\n\n'
+    mod._status_cache.clear()
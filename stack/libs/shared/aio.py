@@ -0,0 +1,30 @@
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from stack.libs.shared.memo import once
+
+T = TypeVar("T")
+
+
+@once
+def io_executor() -> ThreadPoolExecutor:
+    """Dedicated pool for blocking SDK calls made from async handlers.
+
+    Sized by ``IO_THREADS`` (default 32) and kept apart from the server's own
+    threadpool, so slow AWS calls queue here instead of starving sync routes.
+    """
+    return ThreadPoolExecutor(
+        max_workers=int(os.getenv("IO_THREADS", "32")), thread_name_prefix="io"
+    )
+
+
+async def run_blocking(
+    fn: Callable[..., T], *args, executor: ThreadPoolExecutor | None = None
+) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or io_executor(), functools.partial(fn, *args)
+    )
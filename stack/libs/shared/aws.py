@@ -1,7 +1,12 @@
 import os
+import threading
 from typing import Optional
 
 import boto3  # pants: no-infer-dep
+from botocore.config import Config  # pants: no-infer-dep
+
+_shared: dict[tuple[str, str, str | None], object] = {}
+_shared_lock = threading.Lock()
 
 
 def _use_localstack() -> bool:
@@ -9,16 +14,62 @@ def _use_localstack() -> bool:
     return val in ("1", "true", "yes", "on")
 
 
-def client(service_name: str, *, region: Optional[str] = None):
-    region_name = region or os.getenv(
+def _region(region: Optional[str]) -> str:
+    return region or os.getenv(
         "AWS_REGION", os.getenv("AWS_DEFAULT_REGION", "eu-west-2")
     )
+
+
+def _endpoint() -> Optional[str]:
     if _use_localstack() or os.getenv("AWS_ENDPOINT_URL"):
-        endpoint = os.getenv("AWS_ENDPOINT_URL", "http://localhost:4566")
+        return os.getenv("AWS_ENDPOINT_URL", "http://localhost:4566")
+    return None
+
+
+def client(
+    service_name: str, *, region: Optional[str] = None, config: Config | None = None
+):
+    region_name = _region(region)
+    endpoint = _endpoint()
+    if endpoint:
         return boto3.client(
-            service_name, region_name=region_name, endpoint_url=endpoint
+            service_name, region_name=region_name, endpoint_url=endpoint, config=config
         )
-    return boto3.client(service_name, region_name=region_name)
+    return boto3.client(service_name, region_name=region_name, config=config)
+
+
+def pooled_config() -> Config:
+    """Client config for long-lived, shared clients.
+
+    A larger connection pool for concurrent request threads, TCP keep-alive
+    so connections survive idle gaps, and adaptive retries that back off
+    client-side when AWS throttles.
+    """
+    return Config(
+        max_pool_connections=int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50")),
+        tcp_keepalive=True,
+        retries={
+            "mode": os.getenv("AWS_RETRY_MODE", "adaptive"),
+            "max_attempts": int(os.getenv("AWS_MAX_ATTEMPTS", "5")),
+        },
+    )
+
+
+def shared_client(service_name: str, *, region: Optional[str] = None):
+    """Process-wide client for ``service_name``, built once with ``pooled_config``.
+
+    botocore clients are thread-safe, so one instance serves every request.
+    """
+    key = (service_name, _region(region), _endpoint())
+    c = _shared.get(key)
+    if c is None:
+        with _shared_lock:
+            c = _shared.get(key)
+            if c is None:
+                c = _shared[key] = client(
+                    service_name, region=key[1], config=pooled_config()
+                )
+    return c
 
 
 def ensure_queue(sqs_client, *, queue_name: str) -> str:
@@ -0,0 +1,84 @@
+"""Pluggable payload codecs.
+
+``json`` is always available; ``orjson`` and ``msgpack`` are used when the
+packages are installed. ``get_codec("auto")`` returns the fastest JSON codec.
+"""
+
+import json
+from typing import Any, Protocol
+
+try:  # Optional fast paths
+    import orjson  # type: ignore[import-not-found]  # pants: no-infer-dep
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack  # type: ignore[import-not-found]  # pants: no-infer-dep
+except Exception:  # pragma: no cover
+    msgpack = None  # type: ignore[assignment]
+
+
+class Codec(Protocol):
+    name: str
+    binary: bool
+
+    def loads(self, data: str | bytes) -> Any: ...
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+
+class JsonCodec:
+    name = "json"
+    binary = False
+
+    def loads(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode("utf-8")
+
+
+class OrjsonCodec:
+    name = "orjson"
+    binary = False
+
+    def loads(self, data: str | bytes) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+
+class MsgpackCodec:
+    name = "msgpack"
+    binary = True
+
+    def loads(self, data: str | bytes) -> Any:
+        if isinstance(data, str):
+            data = data.encode("latin-1")
+        return msgpack.unpackb(data, raw=False)
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgpack.packb(obj, use_bin_type=True, default=str)
+
+
+def available() -> list[str]:
+    names = ["json"]
+    if orjson is not None:
+        names.append("orjson")
+    if msgpack is not None:
+        names.append("msgpack")
+    return names
+
+
+def get_codec(name: str = "auto") -> Codec:
+    name = (name or "auto").lower()
+    if name == "auto":
+        name = "orjson" if orjson is not None else "json"
+    if name == "json":
+        return JsonCodec()
+    if name == "orjson" and orjson is not None:
+        return OrjsonCodec()
+    if name == "msgpack" and msgpack is not None:
+        return MsgpackCodec()
+    raise ValueError(f"codec {name!r} not available (have: {', '.join(available())})")
@@ -0,0 +1,327 @@
+import base64
+import calendar
+import json
+import os
+import time
+import zlib
+from typing import Optional
+
+from stack.libs.shared.aws import shared_client
+from stack.libs.shared.logging import get_logger
+
+log = get_logger("job_index")
+
+STATUS_INDEX = "by_status"
+TIME_INDEX = "by_time"
+TERMINAL_STATUSES = ("completed", "failed", "canceled")
+_DAY = 86_400
+
+
+class DynamoJobIndex:
+    """Queryable catalog of jobs kept next to the status blobs.
+
+    One item per correlation id with ``status``, ``job_type`` and
+    ``created_at``/``updated_at`` (epoch seconds). Both GSIs are keyed by a
+    write-sharded partition, ``<day>#<shard>`` (``time_pk``) and
+    ``<status>#<day>#<shard>`` (``status_pk``), ranged on ``updated_at``, so
+    job writes spread over ``shards`` partitions per day; listings query the
+    shards of each day and merge them newest first. ``max_queries`` caps the
+    DynamoDB queries spent on one page.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        ddb=None,
+        shards: int = 8,
+        lookback_days: int = 30,
+        max_queries: int | None = None,
+    ):
+        self.table = table
+        self.ddb = ddb or shared_client("dynamodb")
+        self.shards = shards
+        self.lookback_days = lookback_days
+        self.max_queries = max_queries or 2 * shards
+
+    @classmethod
+    def from_env(cls) -> Optional["DynamoJobIndex"]:
+        table = os.getenv("JOB_INDEX_TABLE")
+        if not table:
+            return None
+        inst = cls(
+            table,
+            shards=int(os.getenv("JOB_INDEX_SHARDS", "8")),
+            lookback_days=int(os.getenv("JOB_INDEX_LOOKBACK_DAYS", "30")),
+            max_queries=int(os.getenv("JOB_INDEX_MAX_QUERIES", "0")) or None,
+        )
+        if os.getenv("LOCALSTACK", "").lower() in ("1", "true", "yes", "on"):
+            inst.ensure_table()
+        return inst
+
+    def _shard(self, correlation_id: str) -> int:
+        return zlib.crc32(correlation_id.encode()) % self.shards
+
+    def _keys(self, correlation_id: str, status: str, now: float) -> dict:
+        part = f"{_day(now)}#{self._shard(correlation_id)}"
+        return {"time_pk": {"S": part}, "status_pk": {"S": f"{status}#{part}"}}
+
+    def record(
+        self,
+        correlation_id: str,
+        status: str,
+        job_type: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Upsert the job's status; failures are logged, never raised.
+
+        A terminal status is never replaced by a non-terminal one, so a late
+        ``running`` from a redelivery cannot resurrect a finished job.
+        """
+        now = time.time()
+        keys = self._keys(correlation_id, status, now)
+        names = {"#s": "status"}
+        values = {
+            ":s": {"S": status},
+            ":t": _num(now),
+            ":tp": keys["time_pk"],
+            ":sp": keys["status_pk"],
+        }
+        sets = [
+            "#s = :s",
+            "updated_at = :t",
+            "created_at = if_not_exists(created_at, :t)",
+            "time_pk = :tp",
+            "status_pk = :sp",
+        ]
+        if job_type is not None:
+            sets.append("job_type = :jt")
+            values[":jt"] = {"S": job_type}
+        if error is not None:
+            sets.append("#e = :e")
+            names["#e"] = "error"
+            values[":e"] = {"S": error[:1024]}
+        kw = {}
+        if status not in TERMINAL_STATUSES:
+            kw["ConditionExpression"] = (
+                "attribute_not_exists(#s) OR NOT #s IN (:c, :f, :x)"
+            )
+            values.update(
+                {
+                    ":c": {"S": "completed"},
+                    ":f": {"S": "failed"},
+                    ":x": {"S": "canceled"},
+                }
+            )
+        try:
+            self.ddb.update_item(
+                TableName=self.table,
+                Key={"cid": {"S": correlation_id}},
+                UpdateExpression="SET " + ", ".join(sets),
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+                **kw,
+            )
+        except Exception as exc:  # noqa: BLE001 - the index is best effort
+            code = getattr(exc, "response", {}).get("Error", {}).get("Code")
+            if code != "ConditionalCheckFailedException":
+                log.warning("job index update failed for %s: %s", correlation_id, exc)
+
+    def record_many(self, jobs: list[tuple[str, str, str | None]]) -> None:
+        """Insert new ``(correlation_id, status, job_type)`` items in batches.
+
+        These are unconditional puts, so write them before the job is
+        published; afterwards ``record`` is the only safe way to update.
+        """
+        now = time.time()
+        requests = []
+        for cid, status, job_type in jobs:
+            item = {
+                "cid": {"S": cid},
+                "status": {"S": status},
+                "created_at": _num(now),
+                "updated_at": _num(now),
+                **self._keys(cid, status, now),
+            }
+            if job_type is not None:
+                item["job_type"] = {"S": job_type}
+            requests.append({"PutRequest": {"Item": item}})
+        for start in range(0, len(requests), 25):
+            pending = {self.table: requests[start : start + 25]}
+            for attempt in range(5):
+                try:
+                    resp = self.ddb.batch_write_item(RequestItems=pending)
+                except Exception as exc:  # noqa: BLE001 - the index is best effort
+                    log.warning("job index batch write failed: %s", exc)
+                    break
+                pending = resp.get("UnprocessedItems") or {}
+                if not pending:
+                    break
+                time.sleep(0.05 * 2**attempt)
+
+    def query(
+        self,
+        status: str | None = None,
+        job_type: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """Newest first. Returns one page and an opaque cursor for the next.
+
+        Days are walked from ``until`` (or now) back to ``since`` (or
+        ``lookback_days``). The cursor holds the current day and, per shard,
+        the key of the last item returned from it. Once ``max_queries`` is
+        spent the page ends early, possibly empty, with a cursor to go on
+        from; sparse filters over long ranges take several pages.
+        """
+        top = until if until is not None else time.time()
+        floor = since if since is not None else top - self.lookback_days * _DAY
+        state = {"d": _day(top), "k": {}}
+        if cursor:
+            state = json.loads(base64.urlsafe_b64decode(cursor))
+            if not isinstance(state, dict) or not {"d", "k"} <= state.keys():
+                raise ValueError("malformed cursor")
+        names = {"#u": "updated_at", "#p": "status_pk" if status else "time_pk"}
+        values: dict = {}
+        key_cond = "#p = :k"
+        if since is not None and until is not None:
+            key_cond += " AND #u BETWEEN :lo AND :hi"
+            values.update({":lo": _num(since), ":hi": _num(until)})
+        elif since is not None:
+            key_cond += " AND #u >= :lo"
+            values[":lo"] = _num(since)
+        elif until is not None:
+            key_cond += " AND #u <= :hi"
+            values[":hi"] = _num(until)
+        kw = {}
+        if job_type:
+            kw["FilterExpression"] = "job_type = :jt"
+            values[":jt"] = {"S": job_type}
+
+        out: list[dict] = []
+        day, done = state["d"], state["k"]
+        spent = 0
+        while len(out) < limit and day >= _day(floor) and spent < self.max_queries:
+            # Fetch the next run of every unfinished shard of this day
+            fetched: list[tuple[str, dict]] = []
+            last_keys: dict[str, dict | None] = {}
+            for shard in map(str, range(self.shards)):
+                start = done.get(shard)
+                if start == "done":
+                    continue
+                part = f"{day}#{shard}"
+                q = dict(
+                    TableName=self.table,
+                    IndexName=STATUS_INDEX if status else TIME_INDEX,
+                    KeyConditionExpression=key_cond,
+                    ExpressionAttributeNames=names,
+                    ExpressionAttributeValues={
+                        **values,
+                        ":k": {"S": f"{status}#{part}" if status else part},
+                    },
+                    ScanIndexForward=False,
+                    Limit=limit - len(out),
+                    **kw,
+                )
+                if start:
+                    q["ExclusiveStartKey"] = start
+                resp = self.ddb.query(**q)
+                spent += 1
+                fetched.extend((shard, item) for item in resp.get("Items", []))
+                last_keys[shard] = resp.get("LastEvaluatedKey")
+            fetched.sort(
+                key=lambda si: (float(si[1]["updated_at"]["N"]), si[1]["cid"]["S"]),
+                reverse=True,
+            )
+            # Limit applies before FilterExpression, so a shard that stopped
+            # early may still hold matches down to its resume point; only
+            # items at or above every such point are safe to return yet.
+            bound = max(
+                (float(k["updated_at"]["N"]) for k in last_keys.values() if k),
+                default=float("-inf"),
+            )
+            ready = sum(
+                1 for _, item in fetched if float(item["updated_at"]["N"]) >= bound
+            )
+            taken = fetched[: min(ready, limit - len(out))]
+            for shard, item in taken:
+                done[shard] = _index_key(item, names["#p"])
+            leftover = {shard for shard, _ in fetched[len(taken) :]}
+            for shard, last in last_keys.items():
+                if shard in leftover:
+                    continue  # resume after the last item returned from it
+                # Everything read was returned; carry on past what was read
+                done[shard] = last if last else "done"
+            out.extend(_job(item) for _, item in taken)
+            if all(done.get(str(i)) == "done" for i in range(self.shards)):
+                day, done = _prev_day(day), {}
+        if day < _day(floor):
+            return out, None
+        nxt = base64.urlsafe_b64encode(
+            json.dumps({"d": day, "k": done}).encode()
+        ).decode()
+        return out, nxt
+
+    def ensure_table(self) -> None:
+        try:
+            self.ddb.describe_table(TableName=self.table)
+            return
+        except Exception:  # noqa: BLE001
+            pass
+
+        def gsi(name: str, hash_key: str) -> dict:
+            return {
+                "IndexName": name,
+                "KeySchema": [
+                    {"AttributeName": hash_key, "KeyType": "HASH"},
+                    {"AttributeName": "updated_at", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            }
+
+        self.ddb.create_table(
+            TableName=self.table,
+            AttributeDefinitions=[
+                {"AttributeName": "cid", "AttributeType": "S"},
+                {"AttributeName": "status_pk", "AttributeType": "S"},
+                {"AttributeName": "time_pk", "AttributeType": "S"},
+                {"AttributeName": "updated_at", "AttributeType": "N"},
+            ],
+            KeySchema=[{"AttributeName": "cid", "KeyType": "HASH"}],
+            GlobalSecondaryIndexes=[
+                gsi(STATUS_INDEX, "status_pk"),
+                gsi(TIME_INDEX, "time_pk"),
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
+
+def _day(ts: float) -> str:
+    return time.strftime("%Y%m%d", time.gmtime(ts))
+
+
+def _prev_day(day: str) -> str:
+    return _day(calendar.timegm(time.strptime(day, "%Y%m%d")) - _DAY)
+
+
+def _index_key(item: dict, partition: str) -> dict:
+    return {k: item[k] for k in ("cid", partition, "updated_at")}
+
+
+def _num(value: float) -> dict:
+    return {"N": f"{value:.3f}"}
+
+
+def _job(item: dict) -> dict:
+    out = {
+        "id": item["cid"]["S"],
+        "status": item["status"]["S"],
+        "created_at": float(item["created_at"]["N"]),
+        "updated_at": float(item["updated_at"]["N"]),
+    }
+    if "job_type" in item:
+        out["job_type"] = item["job_type"]["S"]
+    if "error" in item:
+        out["error"] = item["error"]["S"]
+    return out
@@ -0,0 +1,321 @@
+"""In-process bearer-token verification for FastAPI services.
+
+Signing keys come from the auth service's JWKS endpoint, fetched at startup
+and refreshed in the background; verified claims are cached until ``exp``.
+The request path itself never calls out to auth.
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+import jwt
+from fastapi import HTTPException, Request
+from fastapi.responses import JSONResponse, RedirectResponse
+
+from stack.libs.shared.logging import get_logger
+from stack.libs.shared.token_cache import TokenCache
+
+log = get_logger("jwt_auth")
+
+SAFE_METHODS = ("GET", "HEAD")
+
+
+@dataclass(frozen=True)
+class Principal:
+    subject: str
+    name: Optional[str] = None
+    claims: dict = field(default_factory=dict)
+
+
+class JwksClient:
+    """Signing keys by ``kid``, kept fresh by a background thread.
+
+    An unknown ``kid`` wakes the refresher (at most once per
+    ``min_refresh_interval``) instead of fetching inline; failed fetches keep
+    the previous key set.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        refresh_seconds: float = 300.0,
+        min_refresh_interval: float = 10.0,
+        timeout: float = 2.0,
+        fetch: Callable[[], dict] | None = None,
+    ):
+        self.url = url
+        self.refresh_seconds = refresh_seconds
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._fetch = fetch or self._http_fetch
+        self._keys: dict[str, Any] = {}
+        self.fingerprint = ""
+        self._last_refresh = 0.0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def _http_fetch(self) -> dict:
+        with urllib.request.urlopen(self.url, timeout=self.timeout) as resp:
+            return json.load(resp)
+
+    def refresh(self) -> bool:
+        self._last_refresh = time.monotonic()
+        try:
+            data = self._fetch()
+            keys = {
+                k.key_id: k.key
+                for k in jwt.PyJWKSet.from_dict(data).keys
+                if k.key_id is not None
+            }
+        except Exception as exc:  # noqa: BLE001 - keep serving the old keys
+            log.warning("JWKS refresh from %s failed: %s", self.url, exc)
+            return False
+        self._keys = keys
+        self.fingerprint = hashlib.sha256(
+            json.dumps(data, sort_keys=True).encode()
+        ).hexdigest()
+        return True
+
+    def get(self, kid: str | None) -> Any:
+        key = self._keys.get(kid) if kid is not None else None
+        if key is None:
+            self.request_refresh()
+        return key
+
+    def request_refresh(self) -> None:
+        self._ensure_thread()
+        self._wake.set()
+
+    def start(self) -> None:
+        """Fetch once (blocking) and start the refresher; call at startup."""
+        self.refresh()
+        self._ensure_thread()
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="jwks-refresh", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.refresh_seconds)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            wait = self._last_refresh + self.min_refresh_interval - time.monotonic()
+            if wait > 0 and self._stop.wait(wait):
+                break
+            self.refresh()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+
+class JwtVerifier:
+    """Verifies bearer tokens against a ``JwksClient`` with a claims cache.
+
+    ``hs256_secret`` additionally accepts legacy HS256 tokens while the auth
+    service migrates; leave it unset once all tokens are asymmetric.
+    """
+
+    def __init__(
+        self,
+        jwks: JwksClient,
+        algorithms: tuple[str, ...] = ("RS256", "EdDSA"),
+        audience: str | None = None,
+        issuer: str | None = None,
+        hs256_secret: str | None = None,
+        cache: TokenCache | None = None,
+    ):
+        self.jwks = jwks
+        self.algorithms = algorithms
+        self.audience = audience
+        self.issuer = issuer
+        self.hs256_secret = hs256_secret
+        self.cache = cache or TokenCache()
+
+    @classmethod
+    def from_env(cls) -> Optional["JwtVerifier"]:
+        """None unless ``AUTH_JWKS_URL`` is set."""
+        url = os.getenv("AUTH_JWKS_URL")
+        if not url:
+            return None
+        return cls(
+            JwksClient(
+                url,
+                refresh_seconds=float(os.getenv("AUTH_JWKS_REFRESH_SECONDS", "300")),
+            ),
+            audience=os.getenv("AUTH_AUDIENCE") or None,
+            issuer=os.getenv("AUTH_ISSUER") or None,
+            hs256_secret=os.getenv("AUTH_HS256_SECRET") or None,
+            cache=TokenCache(capacity=int(os.getenv("AUTH_CLAIMS_CACHE_SIZE", "4096"))),
+        )
+
+    def verify(self, token: str) -> dict:
+        """Verified claims; raises ``jwt.PyJWTError`` on any failure."""
+        self.cache.bind(self.jwks.fingerprint)
+        claims = self.cache.get(token)
+        if claims is not None:
+            return claims
+        header = jwt.get_unverified_header(token)
+        alg = header.get("alg")
+        if alg == "HS256" and self.hs256_secret:
+            key: Any = self.hs256_secret
+        elif alg in self.algorithms:
+            key = self.jwks.get(header.get("kid"))
+            if key is None:
+                raise jwt.InvalidTokenError(f"unknown key id {header.get('kid')!r}")
+        else:
+            raise jwt.InvalidAlgorithmError(f"algorithm {alg!r} is not accepted")
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=[alg],
+            audience=self.audience,
+            issuer=self.issuer,
+            options={"require": ["exp", "sub"]},
+        )
+        self.cache.put(token, claims)
+        return claims
+
+    def principal(self, token: str) -> Principal:
+        claims = self.verify(token)
+        return Principal(subject=claims["sub"], name=claims.get("name"), claims=claims)
+
+    def start(self) -> None:
+        self.jwks.start()
+
+    def close(self) -> None:
+        self.jwks.close()
+
+
+class JwtAuthMiddleware:
+    """ASGI middleware guarding paths under ``prefixes`` with bearer tokens.
+
+    The token comes from ``Authorization: Bearer`` or, for browser sessions,
+    the ``cookie`` named cookie. A cookie is only trusted on non-GET/HEAD
+    requests that also carry ``?csrf=<csrf_token(token)>``, which a cross-site
+    form cannot know. Browsers without a valid session are redirected to
+    ``login_url``. ``get_verifier`` is called per request; when it returns
+    None the guard fails closed with a 503, unless ``allow_anonymous()`` says
+    otherwise (local development).
+    """
+
+    def __init__(
+        self,
+        app,
+        get_verifier: Callable[[], JwtVerifier | None],
+        prefixes: tuple[str, ...] = ("/",),
+        allow_anonymous: Callable[[], bool] | None = None,
+        cookie: str | None = None,
+        login_url: str | None = None,
+    ):
+        self.app = app
+        self.get_verifier = get_verifier
+        self.prefixes = prefixes
+        self.allow_anonymous = allow_anonymous
+        self.cookie = cookie
+        self.login_url = login_url
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.prefixes):
+            await self.app(scope, receive, send)
+            return
+        verifier = self.get_verifier()
+        if verifier is None:
+            if self.allow_anonymous is not None and self.allow_anonymous():
+                await self.app(scope, receive, send)
+                return
+            response = JSONResponse(
+                {"detail": "authentication is not configured"}, status_code=503
+            )
+            await response(scope, receive, send)
+            return
+        request = Request(scope)
+        token, from_cookie = _token(request, self.cookie)
+        if token and from_cookie and scope["method"] not in SAFE_METHODS:
+            sent = request.query_params.get("csrf", "")
+            if not hmac.compare_digest(sent, csrf_token(token)):
+                response = JSONResponse(
+                    {"detail": "missing or invalid CSRF token"}, status_code=403
+                )
+                await response(scope, receive, send)
+                return
+        try:
+            if not token:
+                raise jwt.InvalidTokenError("missing bearer token")
+            principal = verifier.principal(token)
+        except (jwt.PyJWTError, KeyError) as exc:
+            if self.login_url and _wants_page(request):
+                response = RedirectResponse(self.login_url, status_code=303)
+            else:
+                response = JSONResponse(
+                    {"detail": f"unauthorized: {exc}"},
+                    status_code=401,
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            await response(scope, receive, send)
+            return
+        state = scope.setdefault("state", {})
+        state["principal"] = principal
+        state["csrf"] = csrf_token(token)
+        await self.app(scope, receive, send)
+
+
+def require_principal(request: Request) -> Principal:
+    """FastAPI dependency returning the principal set by ``JwtAuthMiddleware``."""
+    principal = getattr(request.state, "principal", None)
+    if principal is None:
+        raise HTTPException(401, "unauthorized", headers={"WWW-Authenticate": "Bearer"})
+    return principal
+
+
+def csrf_token(token: str) -> str:
+    """Per-session CSRF token; guarded forms send it as ``?csrf=``."""
+    return hashlib.sha256(b"csrf\0" + token.encode()).hexdigest()[:32]
+
+
+def login(url: str, email: str, password: str, timeout: float = 5.0) -> str | None:
+    """Token from the auth service's ``/login``; None for bad credentials."""
+    req = urllib.request.Request(
+        url,
+        data=json.dumps({"email": email, "password": password}).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return json.load(resp)["token"]
+    except urllib.error.HTTPError as exc:
+        if exc.code in (400, 401, 422):
+            return None
+        raise
+
+
+def _token(request: Request, cookie: str | None) -> tuple[str | None, bool]:
+    scheme, _, value = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and value:
+        return value.strip(), False
+    if cookie and request.cookies.get(cookie):
+        return request.cookies[cookie], True
+    return None, False
+
+
+def _wants_page(request: Request) -> bool:
+    return request.method in SAFE_METHODS and "text/html" in request.headers.get(
+        "accept", ""
+    )
@@ -0,0 +1,31 @@
+import functools
+import threading
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def once(fn: Callable[[], T]) -> Callable[[], T]:
+    """Memoize a zero-argument factory for the life of the process.
+
+    Concurrent first calls build the value exactly once; a factory that
+    raises is retried on the next call. ``reset()`` drops the cached value.
+    """
+    lock = threading.Lock()
+    box: list[T] = []
+
+    @functools.wraps(fn)
+    def wrapper() -> T:
+        if box:
+            return box[0]
+        with lock:
+            if not box:
+                box.append(fn())
+            return box[0]
+
+    def reset() -> None:
+        with lock:
+            box.clear()
+
+    wrapper.reset = reset  # type: ignore[attr-defined]
+    return wrapper
@@ -0,0 +1,119 @@
+"""Redis-backed job status store with an S3 repository as the cold archive.
+
+Live statuses and cancel flags are kept only in Redis, with TTLs. Terminal
+statuses are written through to the archive first, so Redis can lose them
+(eviction, restart, TTL) without losing results; misses fall back to the
+archive and terminal hits are re-cached.
+"""
+
+import json
+import os
+import time
+from typing import Any, Optional
+
+from stack.libs.shared.job_index import TERMINAL_STATUSES
+
+try:
+    import redis  # type: ignore[import-not-found]  # pants: no-infer-dep
+except Exception:  # pragma: no cover
+    redis = None  # type: ignore[assignment]
+
+
+class RedisJobStore:
+    """Implements the web and agent ``JobRepository`` ports.
+
+    ``archive`` is the service's S3 repository. ``index`` (optional) gets the
+    non-terminal transitions the archive never sees.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        archive: Any,
+        prefix: str = "job:",
+        live_ttl: int = 86_400,
+        terminal_ttl: int = 3_600,
+        index: Any = None,
+    ):
+        self.r = client
+        self.archive = archive
+        self.prefix = prefix
+        self.live_ttl = live_ttl
+        self.terminal_ttl = terminal_ttl
+        self.index = index
+
+    @classmethod
+    def from_env(cls, archive: Any, index: Any = None) -> "RedisJobStore":
+        if redis is None:
+            raise RuntimeError("JOB_STORE=redis requires the redis package")
+        url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        return cls(
+            redis.Redis.from_url(url),
+            archive,
+            prefix=os.getenv("REDIS_JOB_PREFIX", "job:"),
+            live_ttl=int(os.getenv("JOB_LIVE_TTL_SECONDS", "86400")),
+            terminal_ttl=int(os.getenv("JOB_TERMINAL_TTL_SECONDS", "3600")),
+            index=index,
+        )
+
+    def _status_key(self, cid: str) -> str:
+        return f"{self.prefix}status:{cid}"
+
+    def _cancel_key(self, cid: str) -> str:
+        return f"{self.prefix}cancel:{cid}"
+
+    @property
+    def _cancels_key(self) -> str:
+        # Sorted by cancel time so stale members can be trimmed with the TTL
+        return f"{self.prefix}cancels"
+
+    def _put(self, cid: str, status: dict) -> None:
+        terminal = status.get("status") in TERMINAL_STATUSES
+        self.r.set(
+            self._status_key(cid),
+            json.dumps(status, default=str),
+            ex=self.terminal_ttl if terminal else self.live_ttl,
+        )
+
+    def get_status(self, correlation_id: str) -> Optional[dict]:
+        raw = self.r.get(self._status_key(correlation_id))
+        if raw is not None:
+            return json.loads(raw)
+        status = self.archive.get_status(correlation_id)
+        if status and status.get("status") in TERMINAL_STATUSES:
+            self._put(correlation_id, status)
+        return status
+
+    def mark_running(self, correlation_id: str) -> None:
+        self._put(correlation_id, {"id": correlation_id, "status": "running"})
+        if self.index is not None:
+            self.index.record(correlation_id, "running")
+
+    def mark_completed(self, correlation_id: str, result: dict) -> None:
+        self.archive.mark_completed(correlation_id, result)
+        self._put(
+            correlation_id,
+            {"id": correlation_id, "status": "completed", "result": result},
+        )
+
+    def mark_failed(self, correlation_id: str, error: str) -> None:
+        self.archive.mark_failed(correlation_id, error)
+        self._put(
+            correlation_id, {"id": correlation_id, "status": "failed", "error": error}
+        )
+
+    def mark_canceled(self, correlation_id: str) -> None:
+        self.r.set(self._cancel_key(correlation_id), b"1", ex=self.live_ttl)
+        self.r.zadd(self._cancels_key, {correlation_id: time.time()})
+        self.archive.mark_canceled(correlation_id)
+        self._put(correlation_id, {"id": correlation_id, "status": "canceled"})
+
+    def is_canceled(self, correlation_id: str) -> bool:
+        return bool(self.r.exists(self._cancel_key(correlation_id)))
+
+    def list_canceled(self) -> set[str]:
+        self.r.zremrangebyscore(self._cancels_key, "-inf", time.time() - self.live_ttl)
+        return {
+            m.decode() if isinstance(m, bytes) else m
+            for m in self.r.zrange(self._cancels_key, 0, -1)
+        }
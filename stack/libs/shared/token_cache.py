@@ -0,0 +1,70 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenCache:
+    """Bounded LRU of verified token claims, keyed by token digest.
+
+    Entries expire at the token's own ``exp``; tokens without one are not
+    cached. ``bind`` drops everything when the verification key changes, so a
+    rotated secret never honours tokens checked against the old one.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        # digest -> (claims, exp)
+        self._entries: OrderedDict[bytes, tuple[dict, float]] = OrderedDict()
+        self._key_id: bytes | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(value: str) -> bytes:
+        return hashlib.sha256(value.encode()).digest()
+
+    def bind(self, key: str) -> None:
+        """Clear the cache if ``key`` differs from the one entries were made with."""
+        key_id = self._digest(key)
+        with self._lock:
+            if key_id != self._key_id:
+                self._entries.clear()
+                self._key_id = key_id
+
+    def get(self, token: str) -> dict | None:
+        digest = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[digest]
+            self.misses += 1
+            return None
+
+    def put(self, token: str, claims: dict) -> None:
+        exp = claims.get("exp")
+        if self.capacity <= 0 or not isinstance(exp, (int, float)):
+            return
+        digest = self._digest(token)
+        with self._lock:
+            self._entries[digest] = (claims, float(exp))
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
@@ -0,0 +1 @@
+"""In-memory test doubles shared across services."""
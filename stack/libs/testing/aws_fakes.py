@@ -0,0 +1,402 @@
+"""In-memory stand-ins for the SQS and S3 calls used across the services.
+
+They mimic the boto3 client surface closely enough to be passed wherever a
+client is expected, with optional per-call latency so throughput can be
+measured offline. ``latency`` is either a number of seconds or a callable
+returning one (e.g. ``lambda: random.uniform(0.01, 0.03)``).
+"""
+
+import hashlib
+import io
+import itertools
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Callable
+
+Latency = float | Callable[[], float]
+
+
+class FakeClientError(Exception):
+    """Mirrors ``botocore.exceptions.ClientError`` (code and ``response``)."""
+
+    def __init__(self, code: str, status: int = 400, message: str = ""):
+        super().__init__(f"{code}: {message}" if message else code)
+        self.response = {
+            "Error": {"Code": code, "Message": message},
+            "ResponseMetadata": {"HTTPStatusCode": status},
+        }
+
+
+class NoSuchKey(FakeClientError):
+    def __init__(self, key: str):
+        super().__init__("NoSuchKey", 404, key)
+
+
+class _FakeService:
+    def __init__(self, latency: Latency = 0.0, region: str = "eu-west-2"):
+        self.latency = latency
+        self.calls: dict[str, int] = {}
+        self.meta = SimpleNamespace(region_name=region)
+        self._lock = threading.Condition()
+
+    def _call(self, name: str) -> None:
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+        delay = self.latency() if callable(self.latency) else self.latency
+        if delay > 0:
+            time.sleep(delay)
+
+
+@dataclass
+class _Message:
+    message_id: str
+    body: str
+    attributes: dict
+    sent_at: float
+    visible_at: float = 0.0
+    receive_count: int = 0
+    receipt: str | None = None
+    deleted_at: float | None = None
+
+
+@dataclass
+class _Queue:
+    url: str
+    visibility_timeout: int = 30
+    messages: dict[str, _Message] = field(default_factory=dict)
+
+
+class FakeSqs(_FakeService):
+    """SQS with visibility timeouts, receive counts and batch calls.
+
+    ``max_wait`` caps long-polls so tests and benchmarks can stop quickly.
+    Every deleted message is kept with its send and delete times for
+    end-to-end latency measurements.
+    """
+
+    def __init__(
+        self,
+        latency: Latency = 0.0,
+        max_wait: float | None = None,
+        visibility_timeout: int = 30,
+        region: str = "eu-west-2",
+    ):
+        super().__init__(latency, region)
+        self.max_wait = max_wait
+        self.visibility_timeout = visibility_timeout
+        self.queues: dict[str, _Queue] = {}
+        self.deleted: list[_Message] = []
+        self._receipts: dict[str, tuple[str, str]] = {}
+        self._seq = itertools.count()
+
+    # Queue management
+    def create_queue(self, QueueName: str, **_: Any) -> dict:
+        self._call("create_queue")
+        url = f"https://sqs.{self.meta.region_name}.fake/000000000000/{QueueName}"
+        with self._lock:
+            self.queues.setdefault(url, _Queue(url, self.visibility_timeout))
+        return {"QueueUrl": url}
+
+    def get_queue_attributes(self, QueueUrl: str, AttributeNames: list[str]) -> dict:
+        self._call("get_queue_attributes")
+        now = time.monotonic()
+        with self._lock:
+            msgs = list(self._queue(QueueUrl).messages.values())
+        visible = sum(1 for m in msgs if m.visible_at <= now)
+        return {
+            "Attributes": {
+                "ApproximateNumberOfMessages": str(visible),
+                "ApproximateNumberOfMessagesNotVisible": str(len(msgs) - visible),
+            }
+        }
+
+    # Producers
+    def send_message(
+        self, QueueUrl: str, MessageBody: str, MessageAttributes: dict | None = None
+    ) -> dict:
+        self._call("send_message")
+        return {"MessageId": self._enqueue(QueueUrl, MessageBody, MessageAttributes)}
+
+    def send_message_batch(self, QueueUrl: str, Entries: list[dict]) -> dict:
+        self._call("send_message_batch")
+        ok = [
+            {
+                "Id": e["Id"],
+                "MessageId": self._enqueue(
+                    QueueUrl, e["MessageBody"], e.get("MessageAttributes")
+                ),
+            }
+            for e in Entries
+        ]
+        return {"Successful": ok, "Failed": []}
+
+    # Consumers
+    def receive_message(
+        self,
+        QueueUrl: str,
+        MaxNumberOfMessages: int = 1,
+        WaitTimeSeconds: int = 0,
+        VisibilityTimeout: int | None = None,
+        **_: Any,
+    ) -> dict:
+        self._call("receive_message")
+        wait = float(WaitTimeSeconds)
+        if self.max_wait is not None:
+            wait = min(wait, self.max_wait)
+        deadline = time.monotonic() + wait
+        with self._lock:
+            q = self._queue(QueueUrl)
+            while True:
+                now = time.monotonic()
+                ready = [m for m in q.messages.values() if m.visible_at <= now]
+                if ready or now >= deadline:
+                    break
+                self._lock.wait(min(0.05, deadline - now))
+            out = []
+            timeout = (
+                q.visibility_timeout if VisibilityTimeout is None else VisibilityTimeout
+            )
+            for m in ready[: max(1, min(MaxNumberOfMessages, 10))]:
+                m.receive_count += 1
+                m.visible_at = now + timeout
+                m.receipt = f"{m.message_id}#{next(self._seq)}"
+                self._receipts[m.receipt] = (QueueUrl, m.message_id)
+                out.append(
+                    {
+                        "MessageId": m.message_id,
+                        "ReceiptHandle": m.receipt,
+                        "Body": m.body,
+                        "Attributes": {"ApproximateReceiveCount": str(m.receive_count)},
+                        "MessageAttributes": m.attributes,
+                    }
+                )
+        return {"Messages": out} if out else {}
+
+    def delete_message(self, QueueUrl: str, ReceiptHandle: str) -> dict:
+        self._call("delete_message")
+        if not self._delete(QueueUrl, ReceiptHandle):
+            raise FakeClientError("ReceiptHandleIsInvalid", 400, ReceiptHandle)
+        return {}
+
+    def delete_message_batch(self, QueueUrl: str, Entries: list[dict]) -> dict:
+        self._call("delete_message_batch")
+        ok, failed = [], []
+        for e in Entries:
+            if self._delete(QueueUrl, e["ReceiptHandle"]):
+                ok.append({"Id": e["Id"]})
+            else:
+                failed.append(
+                    {
+                        "Id": e["Id"],
+                        "SenderFault": True,
+                        "Code": "ReceiptHandleIsInvalid",
+                    }
+                )
+        return {"Successful": ok, "Failed": failed}
+
+    def change_message_visibility(
+        self, QueueUrl: str, ReceiptHandle: str, VisibilityTimeout: int
+    ) -> dict:
+        self._call("change_message_visibility")
+        if not self._set_visibility(QueueUrl, ReceiptHandle, VisibilityTimeout):
+            raise FakeClientError("ReceiptHandleIsInvalid", 400, ReceiptHandle)
+        return {}
+
+    def change_message_visibility_batch(
+        self, QueueUrl: str, Entries: list[dict]
+    ) -> dict:
+        self._call("change_message_visibility_batch")
+        ok, failed = [], []
+        for e in Entries:
+            if self._set_visibility(
+                QueueUrl, e["ReceiptHandle"], e["VisibilityTimeout"]
+            ):
+                ok.append({"Id": e["Id"]})
+            else:
+                failed.append(
+                    {
+                        "Id": e["Id"],
+                        "SenderFault": True,
+                        "Code": "ReceiptHandleIsInvalid",
+                    }
+                )
+        return {"Successful": ok, "Failed": failed}
+
+    def _queue(self, url: str) -> _Queue:
+        try:
+            return self.queues[url]
+        except KeyError:
+            raise FakeClientError("AWS.SimpleQueueService.NonExistentQueue", 400, url)
+
+    def _enqueue(self, url: str, body: str, attributes: dict | None) -> str:
+        mid = str(uuid.uuid4())
+        with self._lock:
+            self._queue(url).messages[mid] = _Message(
+                mid, body, dict(attributes or {}), sent_at=time.monotonic()
+            )
+            self._lock.notify_all()
+        return mid
+
+    def _lookup(self, url: str, receipt: str) -> _Message | None:
+        ref = self._receipts.get(receipt)
+        if ref is None or ref[0] != url:
+            return None
+        m = self._queue(url).messages.get(ref[1])
+        # Only the latest receipt for a message is valid
+        return m if m is not None and m.receipt == receipt else None
+
+    def _delete(self, url: str, receipt: str) -> bool:
+        with self._lock:
+            m = self._lookup(url, receipt)
+            if m is None:
+                return False
+            del self._queue(url).messages[m.message_id]
+            self._receipts.pop(receipt, None)
+            m.deleted_at = time.monotonic()
+            self.deleted.append(m)
+            self._lock.notify_all()
+            return True
+
+    def _set_visibility(self, url: str, receipt: str, timeout: int) -> bool:
+        with self._lock:
+            m = self._lookup(url, receipt)
+            if m is None:
+                return False
+            m.visible_at = time.monotonic() + timeout
+            self._lock.notify_all()
+            return True
+
+
+@dataclass
+class _Object:
+    body: bytes
+    etag: str
+    last_modified: datetime
+
+
+class _ListObjectsPaginator:
+    def __init__(self, s3: "FakeS3"):
+        self.s3 = s3
+
+    def paginate(self, **kw: Any):
+        token = None
+        while True:
+            page = self.s3.list_objects_v2(
+                **kw, **({"ContinuationToken": token} if token else {})
+            )
+            yield page
+            if not page.get("IsTruncated"):
+                return
+            token = page["NextContinuationToken"]
+
+
+class FakeS3(_FakeService):
+    """S3 object store covering put/get/head/list and bucket bootstrap."""
+
+    def __init__(self, latency: Latency = 0.0, region: str = "eu-west-2"):
+        super().__init__(latency, region)
+        self.buckets: dict[str, dict[str, _Object]] = {}
+        self.exceptions = SimpleNamespace(
+            NoSuchKey=NoSuchKey, ClientError=FakeClientError
+        )
+
+    def head_bucket(self, Bucket: str) -> dict:
+        self._call("head_bucket")
+        if Bucket not in self.buckets:
+            raise FakeClientError("404", 404, Bucket)
+        return {}
+
+    def create_bucket(self, Bucket: str, **_: Any) -> dict:
+        self._call("create_bucket")
+        with self._lock:
+            self.buckets.setdefault(Bucket, {})
+        return {}
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes | str, **_: Any) -> dict:
+        self._call("put_object")
+        data = Body.encode("utf-8") if isinstance(Body, str) else bytes(Body)
+        etag = f'"{hashlib.md5(data).hexdigest()}"'  # noqa: S324 - matches S3 ETags
+        with self._lock:
+            self._bucket(Bucket)[Key] = _Object(data, etag, datetime.now(timezone.utc))
+        return {"ETag": etag}
+
+    def get_object(
+        self, Bucket: str, Key: str, IfNoneMatch: str | None = None, **_: Any
+    ) -> dict:
+        self._call("get_object")
+        obj = self._object(Bucket, Key)
+        if IfNoneMatch is not None and IfNoneMatch == obj.etag:
+            raise FakeClientError("304", 304, "Not Modified")
+        return {
+            "Body": io.BytesIO(obj.body),
+            "ETag": obj.etag,
+            "ContentLength": len(obj.body),
+            "LastModified": obj.last_modified,
+        }
+
+    def head_object(self, Bucket: str, Key: str, **_: Any) -> dict:
+        self._call("head_object")
+        try:
+            obj = self._object(Bucket, Key)
+        except NoSuchKey:
+            raise FakeClientError("404", 404, Key)
+        return {
+            "ETag": obj.etag,
+            "ContentLength": len(obj.body),
+            "LastModified": obj.last_modified,
+        }
+
+    def delete_object(self, Bucket: str, Key: str, **_: Any) -> dict:
+        self._call("delete_object")
+        with self._lock:
+            self._bucket(Bucket).pop(Key, None)
+        return {}
+
+    def list_objects_v2(
+        self,
+        Bucket: str,
+        Prefix: str = "",
+        MaxKeys: int = 1000,
+        ContinuationToken: str | None = None,
+        **_: Any,
+    ) -> dict:
+        self._call("list_objects_v2")
+        with self._lock:
+            keys = sorted(k for k in self._bucket(Bucket) if k.startswith(Prefix))
+            objs = {k: self._bucket(Bucket)[k] for k in keys}
+        if ContinuationToken:
+            keys = [k for k in keys if k > ContinuationToken]
+        page, rest = keys[:MaxKeys], keys[MaxKeys:]
+        out: dict[str, Any] = {
+            "KeyCount": len(page),
+            "IsTruncated": bool(rest),
+            "Contents": [
+                {"Key": k, "ETag": objs[k].etag, "Size": len(objs[k].body)}
+                for k in page
+            ],
+        }
+        if rest:
+            out["NextContinuationToken"] = page[-1]
+        return out
+
+    def get_paginator(self, operation: str) -> _ListObjectsPaginator:
+        if operation != "list_objects_v2":
+            raise NotImplementedError(operation)
+        return _ListObjectsPaginator(self)
+
+    def _bucket(self, name: str) -> dict[str, _Object]:
+        try:
+            return self.buckets[name]
+        except KeyError:
+            raise FakeClientError("NoSuchBucket", 404, name)
+
+    def _object(self, bucket: str, key: str) -> _Object:
+        with self._lock:
+            obj = self._bucket(bucket).get(key)
+        if obj is None:
+            raise NoSuchKey(key)
+        return obj
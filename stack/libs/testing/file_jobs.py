@@ -0,0 +1,39 @@
+"""Job repository on the local filesystem, shareable across processes."""
+
+import json
+import os
+from pathlib import Path
+
+
+class FileJobRepository:
+    def __init__(self, root: str | os.PathLike):
+        self.root = Path(root)
+        (self.root / "jobs").mkdir(parents=True, exist_ok=True)
+        (self.root / "cancels").mkdir(parents=True, exist_ok=True)
+
+    def _write(self, cid: str, status: dict) -> None:
+        tmp = self.root / "jobs" / f".{cid}.{os.getpid()}"
+        tmp.write_text(json.dumps({"id": cid, **status, "pid": os.getpid()}))
+        tmp.replace(self.root / "jobs" / f"{cid}.json")
+
+    def get_status(self, correlation_id: str) -> dict | None:
+        path = self.root / "jobs" / f"{correlation_id}.json"
+        return json.loads(path.read_text()) if path.exists() else None
+
+    def mark_running(self, correlation_id: str) -> None:
+        self._write(correlation_id, {"status": "running"})
+
+    def mark_completed(self, correlation_id: str, result: dict) -> None:
+        self._write(correlation_id, {"status": "completed", "result": result})
+
+    def mark_failed(self, correlation_id: str, error: str) -> None:
+        self._write(correlation_id, {"status": "failed", "error": error})
+
+    def mark_canceled(self, correlation_id: str) -> None:
+        (self.root / "cancels" / correlation_id).touch()
+
+    def is_canceled(self, correlation_id: str) -> bool:
+        return (self.root / "cancels" / correlation_id).exists()
+
+    def list_canceled(self) -> set[str]:
+        return {p.name for p in (self.root / "cancels").iterdir()}
@@ -0,0 +1,77 @@
+"""Dict-backed stand-in for the subset of redis-py used by the services."""
+
+import threading
+import time
+from typing import Any
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, tuple[Any, float | None]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.calls: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def _live(self, key: str):
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    def get(self, key: str):
+        with self._lock:
+            self._count("get")
+            value = self._live(key)
+        return value.encode() if isinstance(value, str) else value
+
+    def set(self, key: str, value: Any, ex: int | None = None) -> bool:
+        with self._lock:
+            self._count("set")
+            self.data[key] = (value, time.monotonic() + ex if ex else None)
+        return True
+
+    def ttl(self, key: str) -> int:
+        with self._lock:
+            entry = self.data.get(key)
+            if entry is None or self._live(key) is None:
+                return -2
+            return -1 if entry[1] is None else int(entry[1] - time.monotonic())
+
+    def exists(self, *keys: str) -> int:
+        with self._lock:
+            self._count("exists")
+            return sum(1 for k in keys if self._live(k) is not None)
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(1 for k in keys if self.data.pop(k, None) is not None)
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        with self._lock:
+            z = self.zsets.setdefault(key, {})
+            added = sum(1 for m in mapping if m not in z)
+            z.update(mapping)
+            return added
+
+    def zrange(self, key: str, start: int, end: int) -> list[bytes]:
+        with self._lock:
+            members = sorted(self.zsets.get(key, {}).items(), key=lambda kv: kv[1])
+        stop = None if end == -1 else end + 1
+        return [m.encode() for m, _ in members[start:stop]]
+
+    def zremrangebyscore(self, key: str, low, high) -> int:
+        lo = float(low)
+        hi = float(high)
+        with self._lock:
+            z = self.zsets.get(key, {})
+            drop = [m for m, s in z.items() if lo <= s <= hi]
+            for m in drop:
+                del z[m]
+            return len(drop)